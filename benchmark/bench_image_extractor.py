@@ -0,0 +1,132 @@
+"""
+상세 페이지 이미지 URL 추출기 벤치마크
+
+BeautifulSoup 전체 파싱(기존 방식)과 뷰어 영역만 스트리밍 파싱하는 빠른 추출기의
+페이지당 처리 시간과 최대 메모리 사용량을 비교한다.
+
+사용법)
+    python benchmark/bench_image_extractor.py                   # 합성 상세 페이지로 측정
+    python benchmark/bench_image_extractor.py pages/*.html       # 저장해둔 상세 페이지로 측정
+    python benchmark/bench_image_extractor.py --repeat 200 pages/*.html
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from module.webtoon.image_extractor import (
+    extract_image_urls,
+    extract_image_urls_bs4,
+)
+
+
+def make_synthetic_page(image_count: int = 60, comment_count: int = 300) -> str:
+    """
+    실제 상세 페이지와 비슷한 구조(긴 head / 스크립트, 뷰어, 긴 댓글 영역)의 HTML 생성
+
+    Args:
+        image_count: 뷰어 안의 이미지 수
+        comment_count: 뷰어 뒤에 붙는 댓글 수
+
+    Returns:
+        HTML 문자열
+    """
+    head_scripts = "\n".join(
+        f'<script>window.__data{i} = {{"key": "{"x" * 200}"}};</script>'
+        for i in range(80)
+    )
+    nav = "\n".join(
+        f'<li class="item"><a href="/webtoon/list?titleId={i}">웹툰 {i}</a></li>'
+        for i in range(200)
+    )
+    images = "\n".join(
+        f'<img src="https://image-comic.pstatic.net/webtoon/123456/1/20240101_IMAG01_{i}.jpg" '
+        f'alt="comic content" id="content_image_{i}">'
+        for i in range(image_count)
+    )
+    comments = "\n".join(
+        f'<div class="comment"><div class="u_cbox_area"><span class="u_cbox_nick">user{i}</span>'
+        f'<span class="u_cbox_contents">{"재밌어요 " * 10}</span>'
+        f'<img src="https://ssl.pstatic.net/static/profile_{i}.png"></div></div>'
+        for i in range(comment_count)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>웹툰</title>
+<style>.wt_viewer {{ width: 690px; }}</style>
+{head_scripts}
+</head><body>
+<div id="wrap"><ul class="nav">{nav}</ul>
+<div class="view_area"><div class="wt_viewer" style="background:#FFFFFF">
+{images}
+</div></div>
+<div id="comment_area">{comments}</div>
+</div></body></html>"""
+
+
+def measure(
+    func: Callable[[str], List[str]], html: str, repeat: int
+) -> Tuple[float, int, List[str]]:
+    """
+    추출 함수의 페이지당 처리 시간(중앙값)과 최대 메모리 사용량 측정
+
+    Returns:
+        (처리 시간(ms), 최대 메모리(byte), 추출 결과)
+    """
+    result = func(html)  # 워밍업 (bs4 lazy import 등)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(html)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    func(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return statistics.median(timings), peak, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="이미지 URL 추출기 벤치마크")
+    parser.add_argument("pages", nargs="*", help="저장해둔 상세 페이지 HTML 파일")
+    parser.add_argument("--repeat", type=int, default=50, help="페이지당 반복 횟수")
+    args = parser.parse_args()
+
+    pages: List[Tuple[str, str]] = []
+    for page in args.pages:
+        pages.append((Path(page).name, Path(page).read_text(encoding="utf-8")))
+    if not pages:
+        pages.append(("synthetic", make_synthetic_page()))
+
+    print(
+        f"{'페이지':<24}{'크기(KB)':>10}{'이미지':>8}"
+        f"{'bs4(ms)':>10}{'fast(ms)':>10}{'배속':>8}"
+        f"{'bs4 peak(KB)':>14}{'fast peak(KB)':>15}"
+    )
+    for name, html in pages:
+        bs4_time, bs4_peak, bs4_urls = measure(extract_image_urls_bs4, html, args.repeat)
+        fast_time, fast_peak, fast_urls = measure(extract_image_urls, html, args.repeat)
+
+        if bs4_urls != fast_urls:
+            print(f"{name}: 추출 결과가 다릅니다! (bs4 {len(bs4_urls)}개, fast {len(fast_urls)}개)")
+            continue
+
+        print(
+            f"{name[:23]:<24}{len(html) / 1024:>10.1f}{len(fast_urls):>8}"
+            f"{bs4_time:>10.2f}{fast_time:>10.2f}{bs4_time / fast_time:>7.1f}x"
+            f"{bs4_peak / 1024:>14.1f}{fast_peak / 1024:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+에피소드 이미지 병합 벤치마크
+
+기존 방식(모든 이미지를 디코딩 -> INTER_CUBIC 으로 리사이즈 -> vconcat)과
+MergeEngine(헤더로 크기 계산 -> 너비가 같으면 바로 복사, 넓은 이미지만 INTER_AREA 축소)의
+에피소드당 병합 시간(인코딩 제외)과 최대 메모리 사용량을 비교한다.
+
+사용법)
+    python benchmark/bench_merge.py                                # 합성 에피소드로 측정
+    python benchmark/bench_merge.py "Webtoon_Download/제목/[0001] 1화"  # 다운로드한 에피소드 폴더로 측정
+    python benchmark/bench_merge.py --outliers 0.2 --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+import cv2
+import numpy as np
+import natsort
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from module.merge_engine import MergeEngine
+
+
+def legacy_merge(paths: List[str]) -> np.ndarray:
+    """기존 ImageMerger 의 병합 방식 (비교용)"""
+    img_lst = [cv2.imdecode(np.fromfile(path, np.uint8), cv2.IMREAD_COLOR) for path in paths]
+    w_min = min(im.shape[1] for im in img_lst)
+    im_list_resize = [
+        cv2.resize(
+            im,
+            (w_min, int(im.shape[0] * w_min / im.shape[1])),
+            interpolation=cv2.INTER_CUBIC,
+        )
+        for im in img_lst
+    ]
+    return cv2.vconcat(im_list_resize)
+
+
+def make_synthetic_episode(
+    directory: str, count: int, outliers: float, seed: int = 0
+) -> List[str]:
+    """
+    690px 너비의 JPEG 이미지로 이루어진 합성 에피소드 생성
+
+    Args:
+        directory: 이미지를 저장할 폴더
+        count: 이미지 수
+        outliers: 너비가 더 넓은(축소가 필요한) 이미지의 비율
+
+    Returns:
+        이미지 경로 리스트
+    """
+    rng = np.random.default_rng(seed)
+    paths = []
+    for i in range(count):
+        width = 800 if rng.random() < outliers else 690
+        img = cv2.GaussianBlur(
+            rng.integers(0, 255, (1600, width, 3), dtype=np.uint8), (0, 0), 3
+        )
+        path = os.path.join(directory, f"{i + 1:04}.jpg")
+        cv2.imwrite(path, img, [cv2.IMWRITE_JPEG_QUALITY, 90])
+        paths.append(path)
+    return paths
+
+
+def measure(
+    func: Callable[[List[str]], np.ndarray], paths: List[str], repeat: int
+) -> Tuple[float, int, Tuple[int, ...]]:
+    """
+    병합 함수의 에피소드당 처리 시간(중앙값)과 최대 메모리 사용량 측정
+
+    Returns:
+        (처리 시간(s), 최대 메모리(byte), 결과 배열 크기)
+    """
+    timings = []
+    shape: Tuple[int, ...] = ()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        shape = func(paths).shape
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(paths)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return statistics.median(timings), peak, shape
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="이미지 병합 벤치마크")
+    parser.add_argument("episodes", nargs="*", help="이미지가 들어있는 에피소드 폴더")
+    parser.add_argument("--images", type=int, default=60, help="합성 에피소드의 이미지 수")
+    parser.add_argument(
+        "--outliers", type=float, default=0.0, help="합성 에피소드에서 너비가 다른 이미지 비율"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="에피소드당 반복 횟수")
+    args = parser.parse_args()
+
+    episodes: List[Tuple[str, List[str]]] = []
+    for directory in args.episodes:
+        paths = natsort.natsorted(
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.lower().endswith((".jpg", ".jpeg", ".png"))
+            and not name.lower().startswith("output")
+        )
+        episodes.append((os.path.basename(directory.rstrip("/\\")), paths))
+
+    temp_dir = None
+    if not episodes:
+        temp_dir = tempfile.TemporaryDirectory()
+        paths = make_synthetic_episode(temp_dir.name, args.images, args.outliers)
+        episodes.append((f"synthetic ({args.outliers:.0%} outliers)", paths))
+
+    engine = MergeEngine()
+    print(
+        f"{'에피소드':<28}{'이미지':>6}{'결과 크기':>16}"
+        f"{'기존(s)':>10}{'엔진(s)':>10}{'배속':>8}{'기존 peak(MB)':>15}{'엔진 peak(MB)':>15}"
+    )
+    for name, paths in episodes:
+        legacy_time, legacy_peak, legacy_shape = measure(legacy_merge, paths, args.repeat)
+        engine_time, engine_peak, engine_shape = measure(engine.merge, paths, args.repeat)
+        if legacy_shape != engine_shape:
+            print(f"{name}: 결과 크기가 다릅니다! ({legacy_shape} / {engine_shape})")
+            continue
+
+        size = f"{engine_shape[1]}x{engine_shape[0]}"
+        print(
+            f"{name[:27]:<28}{len(paths):>6}{size:>16}"
+            f"{legacy_time:>10.3f}{engine_time:>10.3f}{legacy_time / engine_time:>7.1f}x"
+            f"{legacy_peak / 2**20:>15.0f}{engine_peak / 2**20:>15.0f}"
+        )
+
+    if temp_dir is not None:
+        temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
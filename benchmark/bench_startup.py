@@ -0,0 +1,153 @@
+"""
+main.py 시작 시간 벤치마크
+
+main.py 를 새 프로세스로 실행해서 메뉴 입력 프롬프트(">>> ")가 나올 때까지 걸린 시간을 재고,
+python -X importtime 으로 `import main` 의 모듈별 import 시간을 출력한다.
+시작 시간이 예산을 넘거나, 메뉴를 띄우는 데 필요 없는 무거운 모듈(cv2, aiohttp ...)이
+메뉴 전에 import 되면 종료 코드 1 로 실패한다. (CI 에서 시작 시간 회귀 확인용)
+
+사용법)
+    python benchmark/bench_startup.py                      # 기본 예산(400ms)으로 측정
+    python benchmark/bench_startup.py --budget-ms 250 --repeat 10
+    python benchmark/bench_startup.py --top 30             # import 시간 상위 30개 모듈 출력
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_PATH = os.path.join(ROOT_DIR, "main.py")
+PROMPT = b">>> "
+
+# 메뉴가 뜨기 전에 import 되면 안 되는 모듈 (해당 모드를 선택했을 때만 필요)
+HEAVY_MODULES = ("cv2", "numpy", "aiohttp", "bs4", "lxml", "jinja2", "chardet", "natsort")
+
+# import time:  self [us] | cumulative | imported package
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def measure_prompt_time(cwd: str, timeout: float = 30.0) -> float:
+    """
+    main.py 를 실행해서 첫 입력 프롬프트가 나올 때까지 걸린 시간(초)을 잰다.
+
+    Args:
+        cwd: 실행 디렉토리 (settings.ini 가 생성되므로 임시 폴더를 사용)
+        timeout: 프롬프트를 기다리는 최대 시간
+
+    Returns:
+        프로세스 시작부터 프롬프트 출력까지 걸린 시간
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, MAIN_PATH],
+        cwd=cwd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        output = b""
+        while PROMPT not in output:
+            chunk = process.stdout.read1(4096)
+            if not chunk:
+                raise RuntimeError("프롬프트가 나오기 전에 프로그램이 종료되었습니다.")
+            output += chunk
+            if time.perf_counter() - start > timeout:
+                raise TimeoutError("프롬프트를 기다리다 시간이 초과되었습니다.")
+        return time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+
+
+def measure_imports(cwd: str) -> List[Tuple[str, int, int, int]]:
+    """
+    python -X importtime 으로 `import main` 의 모듈별 import 시간을 측정한다.
+
+    Returns:
+        (모듈 이름, 자체 시간(us), 누적 시간(us), 깊이) 리스트 (import 가 끝난 순서)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=cwd,
+        env={**os.environ, "PYTHONPATH": ROOT_DIR},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    records = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return records
+
+
+def group_by_package(records: List[Tuple[str, int, int, int]]) -> Dict[str, int]:
+    """모듈별 자체 시간을 최상위 패키지(aiohttp.client -> aiohttp) 단위로 합친다."""
+    packages: Dict[str, int] = {}
+    for name, self_us, _, _ in records:
+        package = name.split(".", 1)[0]
+        packages[package] = packages.get(package, 0) + self_us
+    return packages
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="main.py 시작 시간 벤치마크")
+    parser.add_argument(
+        "--budget-ms", type=float, default=400.0, help="프롬프트까지 허용하는 시간(중앙값, ms)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="시작 시간 측정 반복 횟수")
+    parser.add_argument("--top", type=int, default=15, help="출력할 import 시간 상위 항목 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cwd:
+        # 첫 실행은 settings.ini 생성 / .pyc 컴파일이 포함되므로 측정에서 제외
+        measure_prompt_time(cwd)
+        timings = [measure_prompt_time(cwd) for _ in range(max(args.repeat, 1))]
+        records = measure_imports(cwd)
+
+    total_us = sum(self_us for _, self_us, _, _ in records)
+    print(f"import main : 모듈 {len(records)}개, 합계 {total_us / 1000:.1f}ms")
+
+    print(f"\n패키지별 import 시간 (상위 {args.top}개)")
+    packages = sorted(group_by_package(records).items(), key=lambda x: x[1], reverse=True)
+    for package, self_us in packages[: args.top]:
+        print(f"  {package:<30} {self_us / 1000:8.1f}ms")
+
+    print(f"\n모듈별 누적 import 시간 (상위 {args.top}개)")
+    for name, _, cumulative_us, depth in sorted(records, key=lambda x: x[2], reverse=True)[
+        : args.top
+    ]:
+        print(f"  {'  ' * depth}{name:<{40 - 2 * depth}} {cumulative_us / 1000:8.1f}ms")
+
+    median_ms = statistics.median(timings) * 1000
+    print(
+        f"\n프롬프트까지 걸린 시간 : 중앙값 {median_ms:.1f}ms "
+        f"(최소 {min(timings) * 1000:.1f}ms / 최대 {max(timings) * 1000:.1f}ms, {len(timings)}회)"
+    )
+
+    failed = False
+    imported = {name.split(".", 1)[0] for name, _, _, _ in records}
+    heavy = [name for name in HEAVY_MODULES if name in imported]
+    if heavy:
+        print(f"실패 : 메뉴 전에 무거운 모듈을 import 합니다. ({', '.join(heavy)})")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"실패 : 시작 시간이 예산({args.budget_ms:.0f}ms)을 넘었습니다.")
+        failed = True
+    if not failed:
+        print(f"통과 : 예산 {args.budget_ms:.0f}ms 이내")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+다운로드 처리량 벤치마크
+
+로컬 가짜 네이버 웹툰 서버(fake_naver_server.py)를 띄우고 WebtoonAnalyzer.create 부터
+WebtoonDownloader.download 까지 실제 다운로드 과정을 그대로 실행해서
+시나리오별 images/s, MB/s, 전체 시간, 최대 메모리(RSS)를 측정한다.
+(실서버에 부하를 주지 않고 MaxConcurrent / BatchSize / RateLimit 값을 비교하기 위함)
+
+다운로드는 시나리오마다 새 프로세스에서 실행하므로 최대 RSS 가 시나리오끼리 섞이지 않는다.
+다운로드 설정은 임시 폴더의 settings.ini 를 사용한다. (기본값 + 명령줄에서 지정한 값)
+
+사용법)
+    python benchmark/bench_throughput.py                          # small, medium 시나리오
+    python benchmark/bench_throughput.py --scenario large          # 2000화 웹툰 (오래 걸림)
+    python benchmark/bench_throughput.py --scenario flaky --max-concurrent 20
+    python benchmark/bench_throughput.py --scenario medium --latency-ms 100 --bandwidth-mbps 50
+    python benchmark/bench_throughput.py --json result.json
+"""
+
+import argparse
+import asyncio
+import configparser
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark.fake_naver_server import (
+    FakeNaverServer,
+    ServerConfig,
+    add_server_arguments,
+    config_from_args,
+)
+
+TITLE_ID = 900001  # 가짜 서버는 어떤 titleId 든 같은 웹툰으로 응답한다
+
+# 미리 정의한 시나리오 (명령줄 인자로 값 일부를 덮어쓸 수 있음)
+SCENARIOS: Dict[str, ServerConfig] = {
+    # 짧은 웹툰 몇 화 - 큰 이미지 위주
+    "small": ServerConfig(episodes=10, images=20, image_kb=100, latency_ms=20),
+    # 보통 연재작 전체 - URL 수집과 다운로드 파이프라인이 모두 길게 돈다
+    "medium": ServerConfig(episodes=300, images=30, image_kb=40, latency_ms=20),
+    # 장기 연재작 전체 - 에피소드 목록 페이지 100개 + 상세 페이지 2000개
+    "large": ServerConfig(episodes=2000, images=10, image_kb=16, latency_ms=20),
+    # 429 / 5xx 가 섞인 서버 - 재시도 / 백오프 / Retry-After 동작 확인
+    "flaky": ServerConfig(
+        episodes=100,
+        images=20,
+        image_kb=40,
+        latency_ms=20,
+        error_rate=0.03,
+        throttle_rate=0.02,
+        retry_after=1,
+    ),
+}
+
+
+# 다운로드 프로세스 (자식) ------------------------------------------------
+
+
+def peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS (MB, 측정할 수 없는 OS 면 None)"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 byte 단위
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+async def download_title(title_id: int) -> Dict[str, Any]:
+    """가짜 서버에서 웹툰 하나를 분석하고 다운로드 가능한 전체 에피소드를 받는다."""
+    from module.progress import ProgressReporter
+    from module.webtoon.analyzer import WebtoonAnalyzer
+    from module.webtoon.downloader import WebtoonDownloader
+    from module.webtoon.session import HttpSession
+
+    class CaptureReporter(ProgressReporter):
+        """download_done 이벤트의 이미지 수 / 바이트 수를 기록한다."""
+
+        def __init__(self) -> None:
+            self.result: Dict[str, Any] = {}
+
+        def emit(self, event: str, **fields: Any) -> None:
+            if event == "download_done":
+                self.result = fields
+
+    reporter = CaptureReporter()
+    start = time.perf_counter()
+    async with HttpSession() as http:
+        analyzer = await WebtoonAnalyzer.create(title_id, http=http)
+        analyze_seconds = time.perf_counter() - start
+
+        downloader = WebtoonDownloader(
+            analyzer.title_id,
+            analyzer.downloadable_episodes,
+            analyzer.title_name,
+            analyzer.webtoon_type,
+            http=http,
+            reporter=reporter,
+        )
+        success = await downloader.download(1, len(analyzer.downloadable_episodes))
+        requests = http.stats.requests
+    wall = time.perf_counter() - start
+
+    images = reporter.result.get("images", 0)
+    size = reporter.result.get("bytes", 0)
+    return {
+        "success": success,
+        "episodes": len(analyzer.downloadable_episodes),
+        "images": images,
+        "bytes": size,
+        "requests": requests,
+        "analyze_seconds": round(analyze_seconds, 3),
+        "wall_seconds": round(wall, 3),
+        "images_per_sec": round(images / wall, 1) if wall > 0 else 0.0,
+        "mb_per_sec": round(size / 2**20 / wall, 2) if wall > 0 else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_child() -> None:
+    """다운로드 진행 로그는 버리고 마지막 줄에 결과 JSON 만 출력한다."""
+    stdout = sys.stdout
+    with open(os.devnull, "w", encoding="utf-8") as devnull, redirect_stdout(devnull):
+        result = asyncio.run(download_title(TITLE_ID))
+    stdout.write(json.dumps(result) + "\n")
+
+
+# 벤치마크 실행 (부모) ----------------------------------------------------
+
+
+def write_settings(work_dir: str, base_url: str, args: argparse.Namespace) -> None:
+    """임시 폴더에 기본 settings.ini 를 만들고 벤치마크용 값으로 바꾼다."""
+    from module.settings import Setting
+
+    path = os.path.join(work_dir, "settings.ini")
+    Setting(file_name=path)  # 기본값으로 생성
+
+    config = configparser.ConfigParser()
+    config.read(path, encoding="utf-8")
+    config["DEFAULT"]["DownloadPath"] = os.path.join(work_dir, "Webtoon_Download")
+    config["DEFAULT"]["ErrorPath"] = os.path.join(work_dir, "error_log.txt")
+    config["Network"]["BaseUrl"] = base_url
+    config["Cache"]["Enabled"] = "false"  # 매번 분석 API 까지 실제로 요청
+    overrides = {
+        ("Download", "MaxConcurrent"): args.max_concurrent,
+        ("Download", "BatchSize"): args.batch_size,
+        ("Download", "OutputMode"): args.output_mode,
+        ("RateLimit", "InitialRate"): args.initial_rate,
+        ("RateLimit", "MaxRate"): args.max_rate,
+    }
+    for (section, key), value in overrides.items():
+        if value is not None:
+            config[section][key] = str(value)
+    with open(path, "w", encoding="utf-8") as f:
+        config.write(f)
+
+
+async def run_scenario(
+    name: str, server_config: ServerConfig, args: argparse.Namespace
+) -> Dict[str, Any]:
+    """가짜 서버를 띄우고 자식 프로세스에서 다운로드를 실행한다."""
+    server = FakeNaverServer(server_config)
+    await server.start()
+    try:
+        with tempfile.TemporaryDirectory(prefix="nwebtoon_bench_") as work_dir:
+            write_settings(work_dir, f"http://127.0.0.1:{server.port}", args)
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                os.path.abspath(__file__),
+                "--child",
+                cwd=work_dir,
+                stdout=asyncio.subprocess.PIPE,
+            )
+            stdout, _ = await process.communicate()
+            if process.returncode != 0:
+                raise RuntimeError(f"{name}: 다운로드 프로세스가 실패했습니다. ({process.returncode})")
+            result = json.loads(stdout.decode().strip().splitlines()[-1])
+    finally:
+        await server.stop()
+
+    hits = server.hits
+    result.update(scenario=name, injected_429=hits["429"], injected_5xx=hits["5xx"])
+    return result
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    columns = (
+        # 한글은 터미널에서 두 칸을 차지해 정렬이 어긋나므로 영문 제목을 사용
+        ("scenario", "scenario", "{}"),
+        ("episodes", "episodes", "{}"),
+        ("images", "images", "{}"),
+        ("MB", "bytes", "{:.1f}"),
+        ("requests", "requests", "{}"),
+        ("429/5xx", None, "{}"),
+        ("wall(s)", "wall_seconds", "{:.2f}"),
+        ("img/s", "images_per_sec", "{:.1f}"),
+        ("MB/s", "mb_per_sec", "{:.2f}"),
+        ("RSS(MB)", "peak_rss_mb", "{:.1f}"),
+        ("ok", "success", "{}"),
+    )
+    rows = []
+    for result in results:
+        row = []
+        for _, key, fmt in columns:
+            if key is None:
+                value = f"{result['injected_429']}/{result['injected_5xx']}"
+            elif key == "bytes":
+                value = fmt.format(result[key] / 2**20)
+            elif result.get(key) is None:
+                value = "-"
+            else:
+                value = fmt.format(result[key])
+            row.append(value)
+        rows.append(row)
+
+    widths = [
+        max(len(title), *(len(row[i]) for row in rows)) for i, (title, _, _) in enumerate(columns)
+    ]
+    print("  ".join(title.rjust(width) for (title, _, _), width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(value.rjust(width) for value, width in zip(row, widths)))
+
+
+async def run_all(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    results = []
+    for name in args.scenario:
+        server_config = config_from_args(args, SCENARIOS[name])
+        print(f"[{name}] {server_config}", flush=True)
+        results.append(await run_scenario(name, server_config, args))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="다운로드 처리량 벤치마크 (로컬 가짜 서버)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--scenario",
+        nargs="+",
+        choices=sorted(SCENARIOS),
+        default=["small", "medium"],
+        help="실행할 시나리오 (기본값: small medium)",
+    )
+    parser.add_argument("--max-concurrent", type=int, help="[Download] MaxConcurrent")
+    parser.add_argument("--batch-size", type=int, help="[Download] BatchSize")
+    parser.add_argument("--output-mode", choices=("files", "strip", "cbz"), help="[Download] OutputMode")
+    parser.add_argument("--initial-rate", type=float, help="[RateLimit] InitialRate")
+    parser.add_argument("--max-rate", type=float, help="[RateLimit] MaxRate")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child()
+        return 0
+
+    results = asyncio.run(run_all(args))
+    print()
+    print_results(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0 if all(result["success"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
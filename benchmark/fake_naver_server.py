@@ -0,0 +1,339 @@
+"""
+벤치마크용 가짜 네이버 웹툰 서버
+
+comic.naver.com 의 웹툰 정보 API / 에피소드 목록 API / 상세 페이지와
+이미지 CDN(image-comic.pstatic.net)을 흉내내는 로컬 aiohttp 서버.
+응답 지연, 대역폭 제한, 429 / 5xx 오류 주입, Retry-After 헤더를 설정할 수 있다.
+
+이미지는 URL 마다 내용이 다른 디코딩 가능한 JPEG 이고 (strip 모드 병합까지 실행 가능),
+에피소드 끝의 shared_images 개는 모든 에피소드에 같은 내용 / ETag 로 반복된다. (공지 배너, 중복 제거 확인용)
+
+    /api/article/list/info?titleId=   웹툰 정보 (제목, 종류, 연령)
+    /api/article/list?titleId=&page=  에피소드 목록 (한 페이지 20개, sort=DESC 지원)
+    /{type}/detail?titleId=&no=       상세 페이지 (div.wt_viewer 안에 CDN 이미지 태그)
+    (CDN) /img/{titleId}/{no}/{idx}.jpg
+
+다운로더가 이 서버를 사용하게 하려면 settings.ini 의 [Network] BaseUrl 을
+http://127.0.0.1:<port> 로 바꾼다. (bench_throughput.py 가 자동으로 설정)
+
+사용법)
+    python benchmark/fake_naver_server.py --port 8080 --cdn-port 8081
+    python benchmark/fake_naver_server.py --episodes 300 --latency-ms 50 --bandwidth-mbps 20
+    python benchmark/fake_naver_server.py --error-rate 0.05 --throttle-rate 0.02 --retry-after 1
+"""
+
+import argparse
+import asyncio
+import random
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+from aiohttp import web
+
+PAGE_SIZE = 20  # 네이버 웹툰 목록 API 의 한 페이지 에피소드 수
+CHUNK_SIZE = 16 * 1024  # 대역폭 제한 시 한 번에 보내는 크기
+
+# 이미지 크기 (네이버 웹툰 이미지 너비, 높이는 MCU 높이(16)의 배수라서 무손실 JPEG 병합도 가능)
+IMAGE_WIDTH = 690
+IMAGE_HEIGHT = 320
+JPEG_QUALITY = 85
+COM_MAX = 65533  # JPEG COM 세그먼트 하나에 넣을 수 있는 최대 바이트 수
+
+
+@dataclass
+class ServerConfig:
+    """가짜 서버 설정"""
+
+    episodes: int = 10  # 웹툰 하나의 에피소드 수 (모든 titleId 공통)
+    images: int = 20  # 에피소드 하나의 이미지 수
+    image_kb: int = 100  # 이미지 하나의 크기(KB, COM 세그먼트로 채움 / 인코딩 결과가 더 크면 그 크기)
+    shared_images: int = 1  # 에피소드 끝에서부터 모든 에피소드에 같은 내용으로 반복되는 이미지 수
+    locked: int = 0  # 끝에서부터 잠긴(미리보기 유료) 에피소드 수
+    latency_ms: float = 0.0  # 평균 응답 지연 (0.5 ~ 1.5 배 사이에서 무작위)
+    bandwidth_mbps: float = 0.0  # 응답 하나의 최대 전송 속도 (0 이면 제한 없음)
+    error_rate: float = 0.0  # 요청이 5xx 로 실패할 확률
+    throttle_rate: float = 0.0  # 요청이 429 로 실패할 확률
+    retry_after: float = 0.0  # 429 응답의 Retry-After (초, 0 이면 헤더 없음)
+    seed: int = 0
+
+
+class FakeNaverServer:
+    """
+    가짜 comic.naver.com + 이미지 CDN
+
+    info / list API, 상세 페이지, 이미지 요청 모두에 같은 확률로 429 / 5xx 를 주입한다.
+    """
+
+    def __init__(self, config: ServerConfig) -> None:
+        self.__config = config
+        self.__random = random.Random(config.seed)
+        self.__cdn_base = ""  # start() 에서 CDN 주소가 정해진 뒤 설정
+
+        # 이미지 본문은 (웹툰, 화, 순번)마다 같은 내용을 만들도록 캐시한다 (Range 이어받기에도 필요)
+        self.__image_body = lru_cache(maxsize=512)(self.__make_image)
+
+        # 엔드포인트별 요청 수와 주입한 오류 수
+        self.__hits: Dict[str, int] = dict.fromkeys(
+            ("info", "list", "detail", "image", "image_bytes", "429", "5xx"), 0
+        )
+        self.__runners = []
+
+    # 서버 실행 -------------------------------------------------------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, cdn_port: int = 0) -> None:
+        """comic 서버와 CDN 서버를 각각 다른 포트로 시작한다. (port 가 0 이면 빈 포트 사용)"""
+        comic = web.Application()
+        comic.router.add_get("/api/article/list/info", self.__info)
+        comic.router.add_get("/api/article/list", self.__list)
+        comic.router.add_get("/{type}/detail", self.__detail)
+        comic.router.add_get("/stats", self.__stats)
+
+        cdn = web.Application()
+        cdn.router.add_get("/img/{title_id}/{no}/{idx}.jpg", self.__image_handler)
+
+        self.port = await self.__serve(comic, host, port)
+        self.cdn_port = await self.__serve(cdn, host, cdn_port)
+        self.__cdn_base = f"http://{host}:{self.cdn_port}"
+
+    async def __serve(self, app: web.Application, host: str, port: int) -> int:
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        self.__runners.append(runner)
+        return runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        for runner in self.__runners:
+            await runner.cleanup()
+        self.__runners.clear()
+
+    # 응답 흉내 -------------------------------------------------------
+
+    async def __delay(self) -> None:
+        if self.__config.latency_ms > 0:
+            await asyncio.sleep(self.__config.latency_ms / 1000 * self.__random.uniform(0.5, 1.5))
+
+    def __injected_error(self) -> Optional[web.Response]:
+        """설정한 확률로 429 / 5xx 응답을 만든다. (오류가 없으면 None)"""
+        roll = self.__random.random()
+        if roll < self.__config.throttle_rate:
+            self.__hits["429"] += 1
+            headers = {}
+            if self.__config.retry_after > 0:
+                headers["Retry-After"] = f"{self.__config.retry_after:g}"
+            return web.Response(status=429, headers=headers)
+        if roll < self.__config.throttle_rate + self.__config.error_rate:
+            self.__hits["5xx"] += 1
+            return web.Response(status=self.__random.choice((500, 502, 503)))
+        return None
+
+    async def __info(self, request: web.Request) -> web.Response:
+        self.__hits["info"] += 1
+        await self.__delay()
+        error = self.__injected_error()
+        if error is not None:
+            return error
+        title_id = int(request.query["titleId"])
+        return web.json_response(
+            {
+                "titleId": title_id,
+                "titleName": f"벤치마크 웹툰 {title_id}",
+                "synopsis": "벤치마크용 가짜 웹툰",
+                "webtoonLevelCode": "WEBTOON",
+                "age": {"type": "RATE_12"},
+            }
+        )
+
+    async def __list(self, request: web.Request) -> web.Response:
+        self.__hits["list"] += 1
+        await self.__delay()
+        error = self.__injected_error()
+        if error is not None:
+            return error
+        total = self.__config.episodes
+        page = int(request.query.get("page", "1"))
+        numbers = list(range(1, total + 1))
+        if request.query.get("sort", "").upper() == "DESC":
+            numbers.reverse()
+        chunk = numbers[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]
+        lock_from = total - self.__config.locked + 1
+        return web.json_response(
+            {
+                "titleId": int(request.query["titleId"]),
+                "totalCount": total,
+                "articleList": [
+                    {"no": no, "subtitle": f"{no}화", "thumbnailLock": no >= lock_from}
+                    for no in chunk
+                ],
+                "pageInfo": {
+                    "totalRows": total,
+                    "pageSize": PAGE_SIZE,
+                    "page": page,
+                    "totalPages": (total + PAGE_SIZE - 1) // PAGE_SIZE,
+                },
+            }
+        )
+
+    async def __detail(self, request: web.Request) -> web.Response:
+        self.__hits["detail"] += 1
+        await self.__delay()
+        error = self.__injected_error()
+        if error is not None:
+            return error
+
+        title_id, no = request.query["titleId"], request.query["no"]
+        images = "\n".join(
+            f'<img src="{self.__cdn_base}/img/{title_id}/{no}/{idx}.jpg" alt="comic content" id="content_image_{idx}">'
+            for idx in range(self.__config.images)
+        )
+        html = (
+            "<html><head><title>detail</title></head><body>"
+            f'<div class="wt_viewer" id="sectionContWide">\n{images}\n</div>'
+            '<div class="comment_area"><img src="https://ssl.pstatic.net/static/profile.png"></div>'
+            "</body></html>"
+        )
+        return web.Response(text=html, content_type="text/html")
+
+    def __image_key(self, title_id: int, no: int, idx: int) -> str:
+        """이미지 내용을 정하는 키 (에피소드 끝의 공유 이미지는 화수와 상관없이 같은 키)"""
+        shared_from = self.__config.images - self.__config.shared_images
+        if idx >= shared_from:
+            return f"{title_id}-shared-{idx - shared_from}"
+        return f"{title_id}-{no}-{idx}"
+
+    def __make_image(self, key: str) -> bytes:
+        """
+        key 마다 다른 그림의 JPEG 를 만든다.
+
+        모든 이미지를 같은 크기 / 같은 품질로 인코딩하므로 양자화 / 허프만 테이블이 같고,
+        image_kb 에 맞춰 SOI 뒤에 COM 세그먼트를 채워 넣는다. (디코더는 COM 을 무시함)
+        """
+        rng = np.random.default_rng(list(key.encode()))
+        # 가로 그라데이션 + 무작위 사각형 몇 개 + 약한 노이즈 (JPEG 크기가 너무 작지 않게)
+        img = np.empty((IMAGE_HEIGHT, IMAGE_WIDTH, 3), dtype=np.uint8)
+        img[:] = np.linspace(0, 255, IMAGE_WIDTH, dtype=np.uint8)[None, :, None]
+        img[..., rng.integers(3)] = rng.integers(256)
+        for _ in range(6):
+            y, x = rng.integers(IMAGE_HEIGHT - 20), rng.integers(IMAGE_WIDTH - 20)
+            h, w = rng.integers(10, IMAGE_HEIGHT - y), rng.integers(10, IMAGE_WIDTH - x)
+            img[y : y + h, x : x + w] = rng.integers(256, size=3)
+        img = cv2.add(img, rng.integers(0, 12, img.shape, dtype=np.uint8))
+        ok, encoded = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+        if not ok:
+            raise RuntimeError("JPEG 인코딩 실패")
+        data = encoded.tobytes()
+
+        padding = bytearray()
+        missing = self.__config.image_kb * 1024 - len(data)
+        while missing > 4:
+            chunk = min(missing - 4, COM_MAX)
+            padding += b"\xff\xfe" + struct.pack(">H", chunk + 2) + rng.bytes(chunk)
+            missing -= chunk + 4
+        return data[:2] + bytes(padding) + data[2:]
+
+    async def __image_handler(self, request: web.Request) -> web.StreamResponse:
+        self.__hits["image"] += 1
+        await self.__delay()
+        error = self.__injected_error()
+        if error is not None:
+            return error
+
+        info = request.match_info
+        key = self.__image_key(int(info["title_id"]), int(info["no"]), int(info["idx"]))
+        body = self.__image_body(key)
+        etag = f'"{key}"'
+
+        # 이어받기(Range) 요청 지원
+        status, start = 200, 0
+        headers = {"ETag": etag, "Accept-Ranges": "bytes", "Content-Type": "image/jpeg"}
+        range_header = request.headers.get("Range")
+        if range_header and range_header.startswith("bytes="):
+            start = int(range_header[6:].split("-")[0] or 0)
+            if start >= len(body):
+                return web.Response(status=416)
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{len(body) - 1}/{len(body)}"
+
+        payload = body[start:]
+        response = web.StreamResponse(status=status, headers=headers)
+        response.content_length = len(payload)
+        await response.prepare(request)
+        if request.method == "HEAD":
+            # 헤더(ETag, Content-Length)만 보낸다 (중복 제거 확인용)
+            await response.write_eof()
+            return response
+
+        bandwidth = self.__config.bandwidth_mbps * 1024 * 1024 / 8  # bytes/s
+        for offset in range(0, len(payload), CHUNK_SIZE):
+            chunk = payload[offset : offset + CHUNK_SIZE]
+            await response.write(chunk)
+            if bandwidth > 0:
+                await asyncio.sleep(len(chunk) / bandwidth)
+        await response.write_eof()
+        self.__hits["image_bytes"] += len(payload)
+        return response
+
+    async def __stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.__hits)
+
+    @property
+    def hits(self) -> Dict[str, int]:
+        """엔드포인트별 요청 수와 주입한 오류 수"""
+        return dict(self.__hits)
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    """가짜 서버 설정 인자 (bench_throughput.py 와 공유)"""
+    parser.add_argument("--episodes", type=int, help="에피소드 수")
+    parser.add_argument("--images", type=int, help="에피소드당 이미지 수")
+    parser.add_argument("--image-kb", type=int, help="이미지 하나의 크기(KB)")
+    parser.add_argument("--shared-images", type=int, help="에피소드마다 반복되는 공유 이미지 수")
+    parser.add_argument("--locked", type=int, help="끝에서부터 잠긴 에피소드 수")
+    parser.add_argument("--latency-ms", type=float, help="평균 응답 지연(ms)")
+    parser.add_argument("--bandwidth-mbps", type=float, help="응답 하나의 최대 전송 속도(Mbps)")
+    parser.add_argument("--error-rate", type=float, help="5xx 주입 확률 (0 ~ 1)")
+    parser.add_argument("--throttle-rate", type=float, help="429 주입 확률 (0 ~ 1)")
+    parser.add_argument("--retry-after", type=float, help="429 응답의 Retry-After(초)")
+
+
+def config_from_args(args: argparse.Namespace, base: ServerConfig) -> ServerConfig:
+    """명령줄에서 지정한 값만 base 설정에 덮어쓴다."""
+    overrides = {
+        name: getattr(args, name)
+        for name in ServerConfig.__dataclass_fields__
+        if getattr(args, name, None) is not None
+    }
+    return ServerConfig(**{**base.__dict__, **overrides})
+
+
+async def serve_forever(config: ServerConfig, port: int, cdn_port: int) -> None:
+    server = FakeNaverServer(config)
+    await server.start(port=port, cdn_port=cdn_port)
+    print(f"comic : http://127.0.0.1:{server.port}  ([Network] BaseUrl 로 설정)")
+    print(f"CDN   : http://127.0.0.1:{server.cdn_port}")
+    print(f"설정  : {config}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크용 가짜 네이버 웹툰 서버")
+    parser.add_argument("--port", type=int, default=8080, help="comic 서버 포트")
+    parser.add_argument("--cdn-port", type=int, default=8081, help="이미지 CDN 포트")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve_forever(config_from_args(args, ServerConfig()), args.port, args.cdn_port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,68 @@
 import asyncio
-from typing import Optional
-from module.image_merger import ImageMerger
-from module.webtoon.analyzer import WebtoonAnalyzer
-from module.webtoon.downloader import WebtoonDownloader
-from module.webtoon.search import WebtoonSearch
+import sys
+from typing import TYPE_CHECKING, Optional, Tuple
 from module.input_validate import (
     input_until_correct_download_range,
     input_until_get_data,
 )
 from module.settings import Setting
-from module.html_maker import HtmlMaker
 from sys import exit
 from rich import print
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 import os
 from module.title_changer import change_title
 
+# 무거운 모듈(aiohttp, bs4, cv2/numpy, jinja2 ...)은 메뉴가 뜨기 전에 읽지 않고
+# 해당 모드를 선택했을 때 import 한다. (PyInstaller onefile 빌드의 시작 시간 단축)
+# 시작 시간 측정 : python benchmark/bench_startup.py
+if TYPE_CHECKING:
+    from module.webtoon.analyzer import WebtoonAnalyzer
+    from module.webtoon.session import HttpSession
+
+
+async def analyze_title(
+    title_id: int, http: "HttpSession", load_episodes: bool = True
+) -> Tuple["WebtoonAnalyzer", Optional[str], Optional[str]]:
+    """
+    웹툰을 분석하고, 성인 웹툰이면 로그인 쿠키를 입력받아 다시 분석하는 함수
+
+    Args:
+        title_id: 웹툰 id
+        http: 공유 HTTP 세션
+        load_episodes: False 면 메타데이터만 가져온다 (동기화 모드)
+
+    Returns:
+        (분석 결과, NID_AUT, NID_SES)
+    """
+    from module.webtoon.analyzer import WebtoonAnalyzer
+
+    # title_id를 이용해 웹툰 정보 파싱
+    analyzer = await WebtoonAnalyzer.create(
+        title_id, http=http, load_episodes=load_episodes
+    )
+
+    # 성인 웹툰 인증용 쿠키
+    nid_aut: Optional[str] = None
+    nid_ses: Optional[str] = None
+
+    if analyzer.is_adult:
+        print("성인 웹툰입니다. 로그인 정보가 필요합니다.")
+        print("NID_AUT와 NID_SES 쿠키 값을 입력해주세요.")
+
+        nid_aut = input("NID_AUT : ").strip()
+        nid_ses = input("NID_SES : ").strip()
+
+        if not nid_aut or not nid_ses:
+            raise Exception("NID_AUT와 NID_SES 값이 필요합니다.")
+        else:
+            # nid_aut, nid_ses 입력시 analyzer 객체 갱신 (재생성)
+            analyzer = await WebtoonAnalyzer.create(
+                title_id, nid_aut, nid_ses, http=http, load_episodes=load_episodes
+            )
+
+            print(analyzer.__dict__)
+
+    return analyzer, nid_aut, nid_ses
+
 
 async def main() -> None:
     # 윈도우에서 실행한 경우 콘솔 타이틀 변경
@@ -26,16 +71,29 @@ async def main() -> None:
     # 세팅 파일 없으면 자동 생성 & 값 읽기
     s = Setting()
     while True:
+        # 다운로드 모드에서 사용하는 공유 HTTP 세션 (모드가 끝나면 정리)
+        http: Optional["HttpSession"] = None
         try:
             print("::[bold green]NWebtoon Downloader[/bold green]::")
             print("<모드를 선택해주세요>")
             print("[magenta]d[/magenta] : 다운로드")
+            print("[magenta]s[/magenta] : 새 에피소드 동기화")
+            print("[magenta]b[/magenta] : 여러 웹툰 일괄 다운로드 (작업 파일)")
             print("[magenta]o[/magenta] : 다운로드 폴더 열기")
             print("[magenta]m[/magenta] : 이미지 병합")
             print("[red]q[/red] : 프로그램 종료")
             # print('[magenta]h[/magenta] : HTML 생성')
             dialog = input(">>> ")
             if dialog.lower() == "d":
+                from rich.console import Console
+                from rich.panel import Panel
+                from rich.table import Table
+
+                from module.live_progress import LiveProgress
+                from module.webtoon.downloader import WebtoonDownloader
+                from module.webtoon.search import WebtoonSearch
+                from module.webtoon.session import HttpSession
+
                 # 공백이 아닐때까지 입력을 받는다
                 query = input_until_get_data(
                     default_prompt=">>> 정보를 입력해주세요 (웹툰ID, URL, 웹툰제목) : "
@@ -44,29 +102,16 @@ async def main() -> None:
                 # 객체 생성 -> 유저한테 입력받은 정보를 토대로 title_id 얻기
                 title_id: int = WebtoonSearch(query).title_id
 
-                # title_id를 이용해 웹툰 정보 파싱
-                analyzer = await WebtoonAnalyzer.create(title_id)
-
-                # 성인 웹툰 인증용 쿠키
-                nid_aut: Optional[str] = None
-                nid_ses: Optional[str] = None
-
-                if analyzer.is_adult:
-                    print("성인 웹툰입니다. 로그인 정보가 필요합니다.")
-                    print("NID_AUT와 NID_SES 쿠키 값을 입력해주세요.")
-
-                    nid_aut = input("NID_AUT : ").strip()
-                    nid_ses = input("NID_SES : ").strip()
-
-                    if not nid_aut or not nid_ses:
-                        raise Exception("NID_AUT와 NID_SES 값이 필요합니다.")
-                    else:
-                        # nid_aut, nid_ses 입력시 analyzer 객체 갱신 (재생성)
-                        analyzer = await WebtoonAnalyzer.create(
-                            title_id, nid_aut, nid_ses
-                        )
+                # 분석부터 다운로드까지 하나의 커넥션 풀을 공유한다
+                http = HttpSession(s)
+                await http.open()
 
-                        print(analyzer.__dict__)
+                # title_id를 이용해 웹툰 정보 파싱 (성인 웹툰이면 쿠키 입력)
+                # 전체 에피소드 목록 대신 메타데이터만 가져오고, 필요한 페이지는 범위를 입력받은 뒤 요청한다
+                analyzer, nid_aut, nid_ses = await analyze_title(
+                    title_id, http, load_episodes=False
+                )
+                downloadable_count = await analyzer.find_downloadable_count()
 
                 # 분석된 웹툰 정보를 Rich 패널로 표시 (downloader.py 디자인 참고)
                 console = Console()
@@ -76,12 +121,9 @@ async def main() -> None:
                 info_table.add_column("값", style="white")
 
                 info_table.add_row("웹툰명:", analyzer.title_name)
+                info_table.add_row("총 에피소드 수:", f"{analyzer.total_count}화")
                 info_table.add_row(
-                    "총 에피소드 수:", f"{len(analyzer.full_episodes)}화"
-                )
-                info_table.add_row(
-                    "다운로드 가능한 에피소드 수:",
-                    f"{len(analyzer.downloadable_episodes)}화",
+                    "다운로드 가능한 에피소드 수:", f"{downloadable_count}화"
                 )
                 info_table.add_row("종류:", str(analyzer.webtoon_type))
                 info_table.add_row("소개:", analyzer.synopsis)
@@ -100,14 +142,17 @@ async def main() -> None:
                     error_prompt=">>> 다시 입력해주세요. 예) 1-10 , 5: ",
                 )
 
-                # 다운로드 객체 생성
+                # 다운로드 객체 생성 (진행 상황은 이미지마다 출력하지 않고 진행 막대로 표시)
+                progress = LiveProgress(s)
                 downloader = WebtoonDownloader(
                     analyzer.title_id,
-                    analyzer.downloadable_episodes,
+                    [],
                     analyzer.title_name,
                     analyzer.webtoon_type,
                     nid_aut,
                     nid_ses,
+                    http=http,
+                    reporter=progress,
                 )
 
                 # 검증된 입력값에 대해 다운로드 진행
@@ -115,18 +160,105 @@ async def main() -> None:
                     dialog.find("-") == -1
                 ):  # 숫자만 입력했을때 ("-" 입력하지 않고 순수한 문자만 입력시)
                     start = int(dialog)
-                    await downloader.download(start=start, end=start)
+                    episodes = await analyzer.get_downloadable_episodes(start, start)
+                    with progress:
+                        await downloader.download_episodes(episodes)
                     input("다운로드가 완료되었습니다.")
                 else:  # 일반 다운로드일때
                     download_number_lst = list(
                         map(int, dialog.split("-"))
                     )  # "1-2" -> [1,2]
                     start, end = download_number_lst
-                    await downloader.download(start, end)
+                    # 범위가 들어있는 에피소드 목록 페이지만 요청한다
+                    episodes = await analyzer.get_downloadable_episodes(start, end)
+                    with progress:
+                        await downloader.download_episodes(episodes)
                     input("다운로드가 완료되었습니다.")
+            elif dialog.lower() == "s":
+                from module.live_progress import LiveProgress
+                from module.webtoon.downloader import WebtoonDownloader
+                from module.webtoon.search import WebtoonSearch
+                from module.webtoon.session import HttpSession
+
+                query = input_until_get_data(
+                    default_prompt=">>> 정보를 입력해주세요 (웹툰ID, URL, 웹툰제목) : "
+                )
+                title_id: int = WebtoonSearch(query).title_id
+
+                http = HttpSession(s)
+                await http.open()
+
+                # 전체 에피소드 목록 대신 메타데이터만 가져온다
+                analyzer, nid_aut, nid_ses = await analyze_title(
+                    title_id, http, load_episodes=False
+                )
+
+                progress = LiveProgress(s)
+                downloader = WebtoonDownloader(
+                    analyzer.title_id,
+                    [],
+                    analyzer.title_name,
+                    analyzer.webtoon_type,
+                    nid_aut,
+                    nid_ses,
+                    http=http,
+                    reporter=progress,
+                )
+
+                # 다운로드 폴더 / 매니페스트에서 이미 받은 에피소드를 찾고, 그 이후 에피소드만 요청
+                known_episodes = downloader.known_episodes()
+                new_episodes = await analyzer.fetch_new_episodes(known_episodes)
+
+                if known_episodes:
+                    print(
+                        f"{analyzer.title_name}: 이미 받은 에피소드 {len(known_episodes)}개 (최신 {max(known_episodes)}화)"
+                    )
+                if not new_episodes:
+                    input("새로 다운로드할 에피소드가 없습니다.")
+                else:
+                    print(
+                        f"새 에피소드 {len(new_episodes)}개 ({new_episodes[0].no}화 ~ {new_episodes[-1].no}화)"
+                    )
+                    with progress:
+                        await downloader.download_episodes(new_episodes)
+                    input("동기화가 완료되었습니다.")
+            elif dialog.lower() == "b":
+                from module.live_progress import LiveProgress
+                from module.webtoon.batch import BatchDownloader, load_jobs
+
+                print("작업 파일은 한 줄에 웹툰 하나씩 '웹툰ID(또는 URL) [화수 범위]' 형식으로 작성합니다.")
+                print("예) 758037 1-10 / 758037 (전체) / 758037 new (새 에피소드만) / # 주석")
+                path = input_until_get_data(
+                    default_prompt=">>> 작업 파일 경로를 입력해주세요 : "
+                ).strip()
+                jobs = load_jobs(path)
+                if not jobs:
+                    input("작업 파일에 다운로드할 웹툰이 없습니다.")
+                    continue
+
+                print(f"{len(jobs)}개 웹툰을 일괄 다운로드합니다.")
+                # 성인 웹툰이 섞여 있으면 모든 웹툰에 같은 로그인 쿠키를 사용한다
+                nid_aut = input("NID_AUT (성인 웹툰이 없으면 엔터) : ").strip() or None
+                nid_ses = None
+                if nid_aut:
+                    nid_ses = input("NID_SES : ").strip() or None
+
+                with LiveProgress(s) as progress:
+                    await BatchDownloader(
+                        jobs, nid_aut, nid_ses, s, reporter=progress
+                    ).run()
+                input("일괄 다운로드가 완료되었습니다.")
             elif dialog.lower() == "m":
+                from module.image_merger import ImageMerger
+
                 path = input("병합할 웹툰 경로를 입력해주세요 : ")
-                image = ImageMerger(path)
+                try:
+                    image = ImageMerger(path)
+                except Exception as e:
+                    # 경로가 없거나 폴더 구조가 잘못된 경우 메시지를 보여주고 종료
+                    print(e)
+                    input()
+                    exit()
                 image.print_lists()
                 image.run()
                 input("작업이 완료되었습니다.")
@@ -134,8 +266,16 @@ async def main() -> None:
                 print(
                     "히든 기능 발견! 해당 기능은 아직 개발중입니다. 버그 발생해도 책임지지 않습니다."
                 )
+                from module.html_maker import HtmlMaker
+
                 path = input("HTML을 생성할 웹툰 경로를 입력해주세요 : ")
-                html = HtmlMaker(path)
+                try:
+                    html = HtmlMaker(path)
+                except Exception as e:
+                    # 경로가 없거나 폴더 구조가 잘못된 경우 메시지를 보여주고 종료
+                    print(e)
+                    input()
+                    exit()
                 html.print_lists()
                 html.run()
                 input("작업이 완료되었습니다.")
@@ -156,7 +296,19 @@ async def main() -> None:
         except Exception as e:
             print(e, type(e))
             input("오류가 발생했습니다.")
+        finally:
+            if http is not None:
+                from module.metrics import export_metrics
+
+                # 분석부터 다운로드까지 이 세션으로 보낸 모든 요청의 측정값을 한 번만 쓴다
+                export_metrics(http.metrics, s)
+                await http.close()
 
 
 if __name__ == "__main__":
+    # 인자가 있으면 대화형 메뉴 대신 명령줄 모드로 실행 (python main.py download 758037 ...)
+    if len(sys.argv) > 1:
+        from module.cli import run_cli
+
+        exit(run_cli(sys.argv[1:]))
     asyncio.run(main())
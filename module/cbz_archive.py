@@ -0,0 +1,118 @@
+import os
+import shutil
+import zipfile
+from typing import List, Tuple
+
+import natsort
+
+# 에피소드 하나를 담는 만화책 아카이브 확장자 (압축하지 않은 ZIP)
+ARCHIVE_EXTENSION = ".cbz"
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+
+def is_archive(path: str) -> bool:
+    """에피소드 아카이브(.cbz) 파일이면 True"""
+    return path.lower().endswith(ARCHIVE_EXTENSION) and os.path.isfile(path)
+
+
+def _image_names(archive: zipfile.ZipFile) -> List[str]:
+    """아카이브 안의 이미지 파일 이름 리스트 (natural sort 순서)"""
+    return natsort.natsorted(
+        info.filename
+        for info in archive.infolist()
+        if not info.is_dir() and info.filename.lower().endswith(IMAGE_EXTENSIONS)
+    )
+
+
+def read_archive_images(path: str) -> List[Tuple[str, bytes]]:
+    """
+    아카이브 안의 이미지를 이름 순서대로 읽는 함수
+
+    Args:
+        path: .cbz 파일 경로
+
+    Returns:
+        (파일 이름, 이미지 바이트) 리스트 (natural sort 순서)
+    """
+    with zipfile.ZipFile(path) as archive:
+        return [(name, archive.read(name)) for name in _image_names(archive)]
+
+
+def extract_archive_images(path: str, output_dir: str) -> List[str]:
+    """
+    아카이브 안의 이미지를 이름 순서대로 output_dir 에 풀어놓는 함수
+    (이미지를 하나씩 복사하므로 아카이브 전체를 메모리에 올리지 않는다)
+
+    Args:
+        path: .cbz 파일 경로
+        output_dir: 이미지를 풀어놓을 폴더 (없으면 생성)
+
+    Returns:
+        풀어놓은 파일 이름 리스트 (natural sort 순서)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    file_names = []
+    with zipfile.ZipFile(path) as archive:
+        for name in _image_names(archive):
+            # 아카이브 안의 경로는 무시하고 파일 이름만 사용 (폴더 밖으로 쓰지 않도록)
+            file_name = os.path.basename(name)
+            with archive.open(name) as source, open(
+                os.path.join(output_dir, file_name), "wb"
+            ) as target:
+                shutil.copyfileobj(source, target)
+            file_names.append(file_name)
+    return file_names
+
+
+class CbzWriter:
+    """
+    에피소드 이미지를 압축 없이(store) .cbz 아카이브에 바로 써넣는 클래스
+
+    이미 압축된 JPEG / PNG 를 다시 압축해도 크기가 거의 줄지 않으므로 ZIP_STORED 로 저장한다.
+    작성 중에는 *.cbz.part 에 쓰고, commit() 하면 최종 이름으로 바꾼다.
+    (중간에 종료돼도 반쯤 쓴 아카이브가 최종 이름으로 남지 않는다)
+
+    파일을 쓰는 메서드는 블로킹이므로 이벤트 루프에서는 asyncio.to_thread 로 호출하고,
+    한 아카이브에 동시에 두 스레드가 쓰지 않도록 호출하는 쪽에서 순서를 맞춘다.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.__path = path
+        self.__part_path = path + ".part"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.__archive = zipfile.ZipFile(self.__part_path, "w", zipfile.ZIP_STORED)
+        self.__count = 0
+
+    def write(self, name: str, data: bytes) -> None:
+        """이미지 하나를 아카이브 끝에 추가한다."""
+        self.__archive.writestr(name, data)
+        self.__count += 1
+
+    def write_all(self, images: List[Tuple[str, bytes]]) -> None:
+        """(이름, 이미지 바이트) 리스트를 순서대로 아카이브 끝에 추가한다."""
+        for name, data in images:
+            self.write(name, data)
+
+    def commit(self) -> None:
+        """아카이브를 닫고 최종 이름(.cbz)으로 바꾼다."""
+        self.__archive.close()
+        os.replace(self.__part_path, self.__path)
+
+    def discard(self) -> None:
+        """작성 중이던 아카이브를 닫고 지운다."""
+        self.__archive.close()
+        try:
+            os.remove(self.__part_path)
+        except FileNotFoundError:
+            pass
+
+    @property
+    def count(self) -> int:
+        """지금까지 추가한 이미지 수"""
+        return self.__count
+
+    @property
+    def path(self) -> str:
+        """최종 아카이브 경로"""
+        return self.__path
@@ -0,0 +1,240 @@
+"""
+대화형 메뉴 없이 실행하는 명령줄 모드
+
+사용 예)
+    python main.py download 758037 --range 1-10
+    python main.py download 758037 "https://comic.naver.com/webtoon/list?titleId=123456"
+    python main.py download --jobs-file jobs.txt --max-concurrent 20
+    python main.py sync 758037 --cookie-file cookies.txt
+    python main.py merge "Webtoon_Download/제목" --workers 4
+    python main.py html "Webtoon_Download/제목"
+    python main.py download 758037 --quiet > progress.jsonl
+
+진행 상황은 stdout 에 한 줄에 JSON 하나씩(JSON Lines) 출력하고,
+사람이 읽는 메시지(표, 진행 로그)는 모두 stderr 로 보낸다. (--quiet 를 주면 출력하지 않음)
+모든 작업이 성공하면 종료 코드 0, 하나라도 실패하면 1 을 반환한다.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from contextlib import ExitStack, redirect_stdout
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from module.metrics import MetricsRegistry, export_metrics
+from module.progress import JsonLinesReporter, ProgressReporter
+from module.settings import Setting
+
+# 다운로드(aiohttp, bs4)와 병합(cv2, numpy, jinja2) 모듈은 실행하는 명령에서만 import 한다
+if TYPE_CHECKING:
+    from module.webtoon.batch import TitleJob
+
+
+def load_cookie_file(path: str) -> Dict[str, str]:
+    """
+    쿠키 파일에서 쿠키를 읽는 함수
+
+    다음 형식을 지원한다.
+        - 브라우저 확장 프로그램이 내보낸 Netscape cookies.txt (탭 구분 7열)
+        - "NID_AUT=...; NID_SES=..." 처럼 ; 로 구분한 한 줄
+        - 한 줄에 name=value 하나씩
+
+    Args:
+        path: 쿠키 파일 경로
+
+    Returns:
+        쿠키 이름 -> 값
+    """
+    cookies: Dict[str, str] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split("\t")
+            if len(fields) == 7:
+                cookies[fields[5]] = fields[6]
+                continue
+            for pair in line.split(";"):
+                name, sep, value = pair.partition("=")
+                if sep:
+                    cookies[name.strip()] = value.strip()
+    return cookies
+
+
+def resolve_cookies(args: argparse.Namespace) -> Tuple[Optional[str], Optional[str]]:
+    """
+    성인 웹툰 인증용 쿠키를 찾는 함수
+
+    우선순위: --nid-aut / --nid-ses > --cookie-file > 환경 변수 NID_AUT / NID_SES
+
+    Returns:
+        (NID_AUT, NID_SES)
+    """
+    file_cookies = load_cookie_file(args.cookie_file) if args.cookie_file else {}
+    nid_aut = args.nid_aut or file_cookies.get("NID_AUT") or os.environ.get("NID_AUT")
+    nid_ses = args.nid_ses or file_cookies.get("NID_SES") or os.environ.get("NID_SES")
+    return nid_aut or None, nid_ses or None
+
+
+def build_jobs(args: argparse.Namespace, sync: bool = False) -> List["TitleJob"]:
+    """명령줄의 웹툰 ID / URL 과 작업 파일로 작업 리스트를 만든다."""
+    from module.webtoon.batch import TitleJob, load_jobs, parse_range, parse_title_id
+
+    start, end = parse_range(args.range) if getattr(args, "range", None) else (None, None)
+    jobs = [
+        TitleJob(title_id=parse_title_id(title), start=start, end=end, sync=sync)
+        for title in args.titles
+    ]
+    if args.jobs_file:
+        file_jobs = load_jobs(args.jobs_file)
+        if sync:
+            for job in file_jobs:
+                job.sync = True
+        jobs.extend(file_jobs)
+    if not jobs:
+        raise ValueError("다운로드할 웹툰 ID / URL 또는 --jobs-file 을 지정해주세요.")
+    return jobs
+
+
+QUIET_HELP = "사람이 읽는 메시지(stderr)를 출력하지 않고 JSON Lines 만 출력"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령줄 인자 파서를 만든다."""
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="네이버 웹툰 다운로더 명령줄 모드 (진행 상황은 stdout 에 JSON Lines 로 출력)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # 다운로드 / 동기화 공통 인자
+    network = argparse.ArgumentParser(add_help=False)
+    network.add_argument("titles", nargs="*", help="웹툰 ID 또는 URL (여러 개 가능)")
+    network.add_argument("--jobs-file", help="한 줄에 '웹툰ID(또는 URL) [범위]' 형식의 작업 파일")
+    network.add_argument("--nid-aut", help="성인 웹툰 인증용 NID_AUT 쿠키")
+    network.add_argument("--nid-ses", help="성인 웹툰 인증용 NID_SES 쿠키")
+    network.add_argument("--cookie-file", help="NID_AUT / NID_SES 가 들어있는 쿠키 파일")
+    network.add_argument(
+        "--max-concurrent", type=int, help="최대 동시 요청 수 (기본값: 설정값)"
+    )
+    network.add_argument(
+        "--batch-size", type=int, help="동시에 URL 을 수집할 에피소드 수 (기본값: 설정값)"
+    )
+    network.add_argument(
+        "--max-titles", type=int, help="동시에 진행할 웹툰 수 (기본값: 설정값)"
+    )
+    network.add_argument("--quiet", action="store_true", help=QUIET_HELP)
+
+    download = commands.add_parser(
+        "download", parents=[network], help="웹툰 다운로드"
+    )
+    download.add_argument(
+        "--range", help="다운로드할 화수 범위 (예: 5, 1-10 / 생략하면 전체)"
+    )
+    commands.add_parser(
+        "sync", parents=[network], help="이미 받은 에피소드 이후의 새 에피소드만 다운로드"
+    )
+
+    # 병합 / HTML 생성 공통 인자
+    local = argparse.ArgumentParser(add_help=False)
+    local.add_argument("path", help="웹툰 폴더 (에피소드 폴더 또는 .cbz 가 들어있는 폴더)")
+    local.add_argument("--quiet", action="store_true", help=QUIET_HELP)
+
+    merge = commands.add_parser("merge", parents=[local], help="에피소드 이미지 병합")
+    merge.add_argument(
+        "--workers", type=int, help="동시에 처리할 에피소드 수 (기본값: 설정값)"
+    )
+    commands.add_parser("html", parents=[local], help="웹툰 HTML 뷰어 생성")
+    return parser
+
+
+async def run_download(
+    args: argparse.Namespace, reporter: ProgressReporter, settings: Setting
+) -> bool:
+    """download / sync 명령을 실행한다."""
+    from module.webtoon.batch import BatchDownloader
+
+    jobs = build_jobs(args, sync=args.command == "sync")
+    nid_aut, nid_ses = resolve_cookies(args)
+    results = await BatchDownloader(
+        jobs,
+        nid_aut,
+        nid_ses,
+        settings,
+        reporter=reporter,
+        max_concurrent=args.max_concurrent,
+        batch_size=args.batch_size,
+        max_active_titles=args.max_titles,
+    ).run()
+    return all(result.success for result in results)
+
+
+def run_local(
+    args: argparse.Namespace, reporter: ProgressReporter, settings: Setting
+) -> bool:
+    """merge / html 명령을 실행한다."""
+    # 경로 오류는 병합을 시작하기 전에 error 이벤트로 알린다
+    if not os.path.exists(args.path):
+        raise FileNotFoundError(f"경로가 존재하지 않습니다. ({args.path})")
+
+    start_time = time.perf_counter()
+    reporter.emit(f"{args.command}_start", path=args.path)
+    metrics = MetricsRegistry()
+    with metrics.phase(args.command):
+        if args.command == "merge":
+            from module.image_merger import ImageMerger
+
+            success = ImageMerger(args.path, args.workers).run()
+        else:
+            from module.html_maker import HtmlMaker
+
+            success = HtmlMaker(args.path).run()
+    export_metrics(metrics, settings)
+    reporter.emit(
+        f"{args.command}_done",
+        path=args.path,
+        success=success,
+        elapsed=round(time.perf_counter() - start_time, 3),
+    )
+    return success
+
+
+def run_cli(argv: List[str]) -> int:
+    """
+    명령줄 모드 진입점
+
+    Args:
+        argv: 프로그램 이름을 뺀 명령줄 인자
+
+    Returns:
+        종료 코드 (모두 성공 0, 실패 1, 잘못된 인자 2)
+    """
+    args = build_parser().parse_args(argv)
+
+    # stdout 은 JSON Lines 전용으로 쓰고, 기존 print / rich 출력은 stderr 로 돌린다
+    # (--quiet 이면 버린다)
+    reporter = JsonLinesReporter(sys.stdout)
+    with ExitStack() as stack:
+        human = sys.stderr
+        if args.quiet:
+            human = stack.enter_context(open(os.devnull, "w", encoding="utf-8"))
+        stack.enter_context(redirect_stdout(human))
+        try:
+            if args.command in ("download", "sync"):
+                success = asyncio.run(run_download(args, reporter, Setting()))
+            else:
+                success = run_local(args, reporter, Setting())
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            reporter.emit("error", message="사용자 입력으로 중단되었습니다.")
+            return 1
+        except Exception as e:
+            print(e)
+            reporter.emit("error", message=str(e))
+            return 1
+    return 0 if success else 1
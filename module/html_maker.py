@@ -1,6 +1,8 @@
 import os
 import re
+import shutil
 import chardet
+from .cbz_archive import ARCHIVE_EXTENSION, extract_archive_images, is_archive
 from .image_merger import ImageMerger
 from jinja2 import Template  # html 템플릿용
 import natsort
@@ -13,6 +15,10 @@ import natsort
 
 # ImageMerger 을 상속받아 구현
 
+# .cbz 아카이브의 이미지를 html 에서 보여주려고 풀어놓는 폴더 (웹툰 폴더 기준)
+# 숨김 폴더라서 병합 / 색인 생성 시 에피소드로 취급되지 않는다
+ARCHIVE_IMAGE_DIR = ".html_images"
+
 
 class HtmlMaker(ImageMerger):
     def __init__(self, path) -> None:
@@ -37,41 +43,70 @@ class HtmlMaker(ImageMerger):
         f.close()
         return data
 
+    @staticmethod
+    def __episode_page(entry: str) -> str:
+        """에피소드의 html 파일 경로 (웹툰 폴더 기준, 폴더면 "<폴더>/index.html", 아카이브면 "<이름>.html")"""
+        if entry.lower().endswith(ARCHIVE_EXTENSION):
+            return entry[: -len(ARCHIVE_EXTENSION)] + ".html"
+        return os.path.join(entry, "index.html")
+
     # ImagerMerger 오버라이딩으로 구현
     # 실제 run() 이 호출해서 처리해주는 함수
     # Python __ : private, _ : protected
-    def _processing(self, file_lst: list) -> None:
+    def _processing(self, file_lst: list) -> list:
         try:
             # 파일리스트가 비었으면 처리하지 않는다
             if not file_lst:
-                return
-
-            rel_base_path: str = os.path.dirname(
-                file_lst[0]
-            )  # 웹툰이 저장되어 있는 폴더 경로
-            base_path: str = os.path.abspath(rel_base_path)  # 절대경로로 변환
-            print("기반 경로 : ", base_path)
+                return []
+
+            # .cbz 아카이브면 이미지를 .html_images/[0001] 제목/ 에 풀고,
+            # 그 이미지를 가리키는 "[0001] 제목.html" 을 아카이브 옆에 만든다
+            archive_mode = len(file_lst) == 1 and is_archive(file_lst[0])
+            if archive_mode:
+                episode_path = os.path.abspath(file_lst[0])
+                base_path = os.path.dirname(episode_path)
+            else:
+                rel_base_path: str = os.path.dirname(
+                    file_lst[0]
+                )  # 웹툰이 저장되어 있는 폴더 경로
+                base_path: str = os.path.abspath(rel_base_path)  # 절대경로로 변환
+                episode_path = base_path
 
-            # 폴더명에서 숫자만 추출 (몇화를 작업하고 있는지 숫자 저장)
-            numbers = int(re.findall(r"\[(\d+)\]", base_path)[0])
+            # 에피소드 이름(폴더명 / 아카이브명)에서 숫자만 추출 (몇화를 작업하고 있는지 숫자 저장)
+            episode_name = os.path.basename(episode_path)
+            numbers = int(re.findall(r"\[(\d+)\]", episode_name)[0])
 
             # 기존에 생성한 index.html을 삭제한다.
-            output_path = os.path.join(base_path, "index.html")
+            if archive_mode:
+                output_path = self.__episode_page(episode_path)
+            else:
+                output_path = os.path.join(base_path, "index.html")
 
             if os.path.isfile(output_path):
                 os.remove(output_path)
 
             # html template 을 위한 데이터를 생성한다.
-            episode = os.path.basename(os.path.dirname(file_lst[0]))
-            episode = " ".join(episode.split()[1:])
+            if archive_mode:
+                episode_name = episode_name[: -len(ARCHIVE_EXTENSION)]
+            episode = " ".join(episode_name.split()[1:])
 
             img_lst = []
+            if archive_mode:
+                # 이전에 풀어둔 이미지는 지우고 다시 푼다 (아카이브가 바뀌었을 수 있음)
+                image_dir = os.path.join(base_path, ARCHIVE_IMAGE_DIR, episode_name)
+                shutil.rmtree(image_dir, ignore_errors=True)
+                img_lst = [
+                    f"{ARCHIVE_IMAGE_DIR}/{episode_name}/{name}"
+                    for name in extract_archive_images(episode_path, image_dir)
+                ]
+                file_lst = []
+
             for file in file_lst:
                 # file 소문자로 변환
                 file = file.lower()
 
-                # 이미지 파일이고, output.png가 아닌 경우만 추가한다.
-                if file.endswith("output.png"):
+                # 이미지 파일이고, 병합 결과 파일(output.png, output.jpg, output_001.png ...)이 아닌 경우만 추가한다.
+                if self.is_output_file(file):
                     continue
 
                 if (
@@ -83,38 +118,38 @@ class HtmlMaker(ImageMerger):
 
             # print(img_lst)
 
-            # 부모 경로에서 [다음화] 로 시작하는 폴더 이름을 가져온다.
-            parent_path = os.path.dirname(base_path)
-            next_folder_name = next(
-                (
-                    folder
-                    for folder in os.listdir(parent_path)
-                    if folder.startswith(f"[{numbers+1}]")
-                ),
-                None,
-            )
-
-            print(parent_path)
+            # 웹툰 폴더에서 [다음화] / [이전화] 로 시작하는 에피소드(폴더 또는 아카이브)를 찾는다.
+            # 폴더 에피소드의 html 은 에피소드 폴더 안에, 아카이브의 html 은 웹툰 폴더에 있으므로
+            # 링크 기준 위치가 다르다.
+            parent_path = base_path if archive_mode else os.path.dirname(base_path)
+            link_prefix = "" if archive_mode else "../"
+
+            def find_episode(number: int):
+                return next(
+                    (
+                        entry
+                        for entry in os.listdir(parent_path)
+                        if re.match(rf"\[0*{number}\]", entry)
+                        and (
+                            os.path.isdir(os.path.join(parent_path, entry))
+                            or is_archive(os.path.join(parent_path, entry))
+                        )
+                    ),
+                    None,
+                )
+
+            next_folder_name = find_episode(numbers + 1)
 
             if next_folder_name:
-                next_web = os.path.join("../", next_folder_name, "index.html")
+                next_web = link_prefix + self.__episode_page(next_folder_name)
             else:
                 # print("[다음화]로 시작하는 폴더를 찾지 못했습니다.")
                 next_web = "javascript:alert('마지막화 입니다.');"
 
-            # 부모 경로에서 [이전화] 로 시작하는 폴더 이름을 가져온다.
-            parent_path = os.path.dirname(base_path)
-            prev_folder_name = next(
-                (
-                    folder
-                    for folder in os.listdir(parent_path)
-                    if folder.startswith(f"[{numbers-1}]")
-                ),
-                None,
-            )
+            prev_folder_name = find_episode(numbers - 1)
 
             if prev_folder_name:
-                prev_web = os.path.join("../", prev_folder_name, "index.html")
+                prev_web = link_prefix + self.__episode_page(prev_folder_name)
             else:
                 # print("[이전화]로 시작하는 폴더를 찾지 못했습니다.")
                 prev_web = "javascript:alert('처음화 입니다.');"
@@ -130,11 +165,12 @@ class HtmlMaker(ImageMerger):
             )
 
             # index.html 파일을 생성한다.
-            index_path = os.path.join(base_path, "index.html")
+            index_path = output_path
             f = open(index_path, "w", encoding="UTF-8")
             f.write(html_data)
             f.close()
-            print(f"{index_path} 생성 완료")
+            # 작업자 스레드에서 실행되므로 출력은 메인 스레드(ImageMerger.run)에 맡긴다
+            return [f"{index_path} 생성 완료"]
 
         except Exception as e:
             raise e
@@ -143,19 +179,29 @@ class HtmlMaker(ImageMerger):
         print(f"{user_input_path} 위치에 색인을 생성중입니다...")
 
         # 현재 경로를 기준으로 모든 폴더를 리스트로 가져온다
-        dir_lst = os.listdir(user_input_path)
+        # 다운로드 기록(.nwebtoon_manifest.json) 같은 숨김 파일은 제외
+        # .cbz 아카이브로 만든 결과 파일("[0001] 제목.html" ...)은 에피소드가 아니므로 제외
+        dir_lst = [
+            name
+            for name in os.listdir(user_input_path)
+            if not name.startswith(".")
+            and not self.is_archive_output(os.path.join(user_input_path, name))
+        ]
         dir_lst = natsort.natsorted(dir_lst)  # natural sort 로 정렬
 
         pure_name_lst = []
 
-        # 이름 리스트에서 앞의 순번은 제거
+        # 이름 리스트에서 앞의 순번(과 아카이브 확장자)은 제거
         for element in dir_lst:
             item = os.path.basename(element)
+            if item.lower().endswith(ARCHIVE_EXTENSION):
+                item = item[: -len(ARCHIVE_EXTENSION)]
             item = " ".join(item.split()[1:])
             pure_name_lst.append(item)
 
         html_path = [
-            os.path.join(self.__title, element, "index.html") for element in dir_lst
+            os.path.join(self.__title, self.__episode_page(element))
+            for element in dir_lst
         ]
 
         item_lst = list(zip(html_path, pure_name_lst))
@@ -173,6 +219,6 @@ class HtmlMaker(ImageMerger):
 
     # ImageMerger 와 동일한 인터페이스 제공
 
-    def run(self):
+    def run(self) -> bool:
         self.__make_index(self.__user_input_path)  # html 전체 색인 생성 함수
-        super().run()  # 부모 클래스의 run() 호출, 실제로 각 폴더에 html Processing 해주는 함수
+        return super().run()  # 부모 클래스의 run() 호출, 실제로 각 폴더에 html Processing 해주는 함수
@@ -0,0 +1,98 @@
+import io
+import struct
+from typing import BinaryIO, Optional, Tuple, Union
+
+# 이미지 원본 (파일 경로 또는 메모리에 있는 이미지 바이트)
+ImageSource = Union[str, bytes]
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# 크기 정보가 들어있는 JPEG SOF 마커 (DHT(C4), JPG(C8), DAC(CC) 는 제외)
+JPEG_SOF_MARKERS = {
+    0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+    0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF,
+}
+
+
+def _read_png_size(f: BinaryIO) -> Optional[Tuple[int, int]]:
+    # 시그니처(8) + IHDR 길이(4) + "IHDR"(4) + 너비(4) + 높이(4)
+    f.seek(0)
+    header = f.read(24)
+    if len(header) < 24 or header[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", header[16:24])
+    return width, height
+
+
+def _read_jpeg_size(f: BinaryIO) -> Optional[Tuple[int, int]]:
+    # SOI(FFD8) 이후 세그먼트를 하나씩 건너뛰면서 SOF 세그먼트를 찾는다
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        if not byte:
+            return None
+        if byte != b"\xff":
+            continue
+
+        # 마커 앞의 채움 바이트(FF) 건너뛰기
+        marker = f.read(1)
+        while marker == b"\xff":
+            marker = f.read(1)
+        if not marker:
+            return None
+
+        code = marker[0]
+        # 길이가 없는 마커 (TEM, RSTn, SOI) / EOI, SOS 이후에는 크기 정보가 없다
+        if code == 0x01 or 0xD0 <= code <= 0xD8:
+            continue
+        if code in (0xD9, 0xDA):
+            return None
+
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack(">H", length_bytes)[0]
+
+        if code in JPEG_SOF_MARKERS:
+            # 정밀도(1) + 높이(2) + 너비(2)
+            data = f.read(5)
+            if len(data) < 5:
+                return None
+            height, width = struct.unpack(">HH", data[1:5])
+            return width, height
+
+        f.seek(length - 2, io.SEEK_CUR)
+
+
+def read_image_size(source: ImageSource) -> Optional[Tuple[int, int]]:
+    """
+    이미지 전체를 디코딩하지 않고 헤더만 읽어서 크기를 알아내는 함수 (PNG / JPEG)
+
+    Args:
+        source: 이미지 파일 경로 또는 이미지 바이트
+
+    Returns:
+        (너비, 높이), 지원하지 않는 형식이거나 헤더가 손상됐으면 None
+    """
+    try:
+        if isinstance(source, bytes):
+            f: BinaryIO = io.BytesIO(source)
+        else:
+            f = open(source, "rb")
+
+        with f:
+            signature = f.read(8)
+            if signature == PNG_SIGNATURE:
+                return _read_png_size(f)
+            if signature[:2] == b"\xff\xd8":
+                return _read_jpeg_size(f)
+            return None
+    except (OSError, struct.error):
+        return None
+
+
+def is_jpeg(source: ImageSource) -> bool:
+    """JPEG 이미지인지 확인하는 함수 (파일 경로는 확장자, 바이트는 SOI 마커로 판단)"""
+    if isinstance(source, bytes):
+        return source[:2] == b"\xff\xd8"
+    return source.lower().endswith((".jpg", ".jpeg"))
@@ -1,126 +1,242 @@
 import os
+import re
 import natsort
-import cv2
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Sequence
+
+from module.cbz_archive import ARCHIVE_EXTENSION, is_archive, read_archive_images
+from module.image_header import ImageSource, is_jpeg
+from module.jpeg_concat import JpegConcatError, concat_jpeg_files
+from module.merge_engine import MergeEngine
+from module.settings import Setting
+
+# 병합 결과 파일 이름 (output.png / output.jpg 또는 분할 저장 시 output_001.png ...)
+OUTPUT_FILE_PATTERN = re.compile(r"^output(_\d+)?\.(png|jpe?g)$", re.IGNORECASE)
+
+# .cbz 아카이브 옆에 만드는 결과 파일 확장자 ("[0001] 제목.png", "[0001] 제목_001.png", "[0001] 제목.html" ...)
+ARCHIVE_OUTPUT_EXTENSIONS = (".png", ".jpg", ".jpeg", ".html")
 
 
 class ImageMerger:
     # 파이썬에서 private = 앞에 언더바 두개 (__)
 
-    def __init__(self, dir_path) -> None:
-        try:
-            self.__dir_path = dir_path
-
-            # 디렉토리를 순회하면서 리스트에 저장 (앞의 경로까지 다 저장)
-            file_lst = os.listdir(self.__dir_path)
-
-            for i in range(0, len(file_lst)):
-                file_lst[i] = os.path.join(dir_path, file_lst[i])
-
-            # 파일 리스트 기억
-            self.__file_lst = file_lst  # 파일 리스트 기억
-            self.__file_lst = natsort.natsorted(
-                self.__file_lst)  # natural sort 로 정렬
-
-            if not file_lst:  # 파일이 아무것도 없음.
-                raise Exception('There is No File')  # 예외를 던짐
-            else:  # 파일이 하나라도 존재하면
-                file_count, dir_count = 0, 0
-                for name in file_lst:
-                    if os.path.isfile(name):
-                        file_count += 1
-                    if os.path.isdir(name):
-                        dir_count += 1
-
-                # 파일과 디렉토리가 동시에 존재할 경우
-                if file_count > 0 and dir_count > 0:
-                    raise Exception('Invalid file structure')  # 예외를 던짐
-                # 디렉토리 안에 파일만 존재할경우
-                elif file_count > 0 and dir_count == 0:
-                    self.__pure_file = True
-                # 디렉토리 안에 디렉토리만 존재할 경우
-                else:
-                    self.__pure_file = False
-        except Exception as e:
-            print(e)
-            input()
-            exit()
+    def __init__(self, dir_path, workers: Optional[int] = None) -> None:
+        """
+        Raises:
+            FileNotFoundError: 경로가 존재하지 않는 경우
+            ValueError: 처리할 파일이 없거나 파일과 폴더가 섞여 있는 경우
+        """
+        self.__dir_path = dir_path
+
+        settings = Setting()
+
+        # 동시에 처리할 에피소드 수 (0 이하면 CPU 코어 수)
+        if workers is None:
+            workers = settings.merge_workers
+        self.__workers = workers if workers > 0 else (os.cpu_count() or 1)
+
+        # 결과 파일 하나의 최대 높이 (0 이면 output.png 하나로 저장)
+        self.__max_height = settings.merge_max_height
+
+        # JPEG 를 디코딩 없이 이어붙여 output.jpg 로 저장할지 여부
+        self.__lossless_jpeg = settings.merge_lossless_jpeg
+
+        # .cbz 아카이브 하나를 지정한 경우 그 에피소드만 처리
+        if is_archive(self.__dir_path):
+            self.__file_lst = [self.__dir_path]
+            self.__pure_file = True
+            return
+
+        # 디렉토리를 순회하면서 리스트에 저장 (앞의 경로까지 다 저장)
+        # 다운로드 기록(.nwebtoon_manifest.json) 같은 숨김 파일은 제외
+        file_lst = [
+            name for name in os.listdir(self.__dir_path) if not name.startswith(".")
+        ]
+
+        for i in range(0, len(file_lst)):
+            file_lst[i] = os.path.join(dir_path, file_lst[i])
+
+        # .cbz 아카이브로 만든 결과 파일("[0001] 제목.png" ...)은 에피소드가 아니므로 제외
+        file_lst = [name for name in file_lst if not self.is_archive_output(name)]
+
+        # 파일 리스트 기억
+        self.__file_lst = file_lst  # 파일 리스트 기억
+        self.__file_lst = natsort.natsorted(
+            self.__file_lst)  # natural sort 로 정렬
+
+        if not file_lst:  # 파일이 아무것도 없음.
+            raise ValueError('There is No File')  # 예외를 던짐
+        else:  # 파일이 하나라도 존재하면
+            file_count, dir_count = 0, 0
+            for name in file_lst:
+                # .cbz 아카이브는 에피소드 폴더 하나로 취급한다
+                if os.path.isdir(name) or is_archive(name):
+                    dir_count += 1
+                elif os.path.isfile(name):
+                    file_count += 1
+
+            # 파일과 디렉토리가 동시에 존재할 경우
+            if file_count > 0 and dir_count > 0:
+                raise ValueError('Invalid file structure')  # 예외를 던짐
+            # 디렉토리 안에 파일만 존재할경우
+            elif file_count > 0 and dir_count == 0:
+                self.__pure_file = True
+            # 디렉토리 안에 디렉토리만 존재할 경우
+            else:
+                self.__pure_file = False
 
     # Private Method -------------------------------------------------------
 
-    # 수직으로 합칠때, 큰 이미지가 있으면 작게 resize 후 붙이는 함수
-    # https://note.nkmk.me/en/python-opencv-hconcat-vconcat-np-tile/
-    def __vconcat_resize_min(self, im_list, interpolation=cv2.INTER_CUBIC):
-        w_min = min(im.shape[1] for im in im_list)
-        im_list_resize = [cv2.resize(im, (w_min, int(im.shape[0] * w_min / im.shape[1])), interpolation=interpolation)
-                          for im in im_list]
-        return cv2.vconcat(im_list_resize)
+    @staticmethod
+    def is_output_file(path: str) -> bool:
+        """병합 결과 파일(output.png, output.jpg, output_001.png ...)이면 True"""
+        return OUTPUT_FILE_PATTERN.match(os.path.basename(path)) is not None
+
+    @staticmethod
+    def is_archive_output(path: str) -> bool:
+        """같은 폴더의 .cbz 아카이브로 만든 결과 파일("[0001] 제목.png", "[0001] 제목_001.png" ...)이면 True"""
+        stem, extension = os.path.splitext(path)
+        if extension.lower() not in ARCHIVE_OUTPUT_EXTENSIONS:
+            return False
+        return any(
+            os.path.isfile(candidate + ARCHIVE_EXTENSION)
+            for candidate in (stem, re.sub(r"_\d+$", "", stem))
+        )
+
+    @staticmethod
+    def merge_sources(
+        sources: Sequence[ImageSource],
+        output_dir: str,
+        max_height: int = 0,
+        lossless_jpeg: bool = False,
+        prefix: str = "output",
+        messages: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        이미지들을 세로로 병합해서 output_dir 에 저장하는 함수
+        (폴더의 이미지 파일뿐 아니라 다운로드 중 메모리에 모은 이미지 바이트도 병합할 수 있음)
+
+        작업자 스레드에서 실행되므로 직접 출력하지 않고, 알릴 내용은 messages 에 덧붙인다.
+
+        Args:
+            sources: 병합할 이미지 파일 경로 또는 바이트 (위에서부터 순서대로)
+            output_dir: 결과를 저장할 폴더
+            max_height: 결과 파일 하나의 최대 높이 (0 이면 output.png 하나로 저장)
+            lossless_jpeg: True 면 호환되는 JPEG 를 디코딩 없이 이어붙여 output.jpg 로 저장
+            prefix: 결과 파일 이름 앞부분 (output.png, output_001.png ...)
+            messages: 무손실 병합을 못 한 이유 등을 덧붙일 리스트 (None 이면 버림)
+
+        Returns:
+            저장한 결과 파일 경로 리스트
+        """
+        # 모두 호환되는 JPEG 면 디코딩 / 재인코딩 없이 이어붙인다 (안 되면 픽셀 병합으로 대체)
+        if lossless_jpeg and all(is_jpeg(source) for source in sources):
+            try:
+                return concat_jpeg_files(sources, output_dir, max_height, prefix)
+            except JpegConcatError as e:
+                if messages is not None:
+                    messages.append(f"JPEG 무손실 병합 불가, 일반 병합으로 진행합니다 : {e}")
+
+        engine = MergeEngine()
+        if max_height > 0:
+            # 최대 높이마다 패널 사이 여백에서 잘라 output_001.png, output_002.png ... 로 저장
+            return engine.write_segments(sources, output_dir, max_height, prefix)
+
+        # 헤더로 결과 크기를 먼저 계산하고, 이미지를 하나씩 디코딩해서 결과 배열에 바로 채운다
+        # (imwrite 의 경우에도 한글 경로 인식이 안되므로 엔진에서 imencode 후 저장)
+        output_path = os.path.join(output_dir, f"{prefix}.png")
+        engine.write(sources, output_path)
+        return [output_path]
 
     # 코드 참고 : https://stackoverflow.com/questions/53876007/how-to-vertically-merge-two-images
     #  실제로 구현해야 하는 함수
-    def _processing(self, file_lst: list) -> None:
+    #  작업자 스레드에서 실행되므로 출력하지 않고, 보여줄 메시지를 반환하면 메인 스레드가 출력한다
+    def _processing(self, file_lst: list) -> List[str]:
         try:
             # 파일리스트가 비었으면 아무것도 하지 않는다.
             if not file_lst:
-                return
+                return []
+
+            # .cbz 아카이브는 압축을 풀지 않고 메모리에서 바로 병합
+            if len(file_lst) == 1 and is_archive(file_lst[0]):
+                return self.__processing_archive(file_lst[0])
 
             rel_base_path = os.path.dirname(file_lst[0])  # 웹툰이 저장되어 있는 폴더 경로
             base_path = os.path.abspath(rel_base_path)  # 절대경로로 변환
-            print("기반 경로 : ", base_path)
 
-            # output 이라는 문구가 포함된 모든 파일을 지우고 시작
+            # 이전에 만든 병합 결과 파일(output.png, output.jpg, output_001.png ...)을 모두 지우고 시작
             # 리스트와 파일 둘다 삭제를 반영해준다.
-
-            output_path = os.path.join(base_path, 'output.png')
-            # print("output_path : ", output_path)
-
-            if os.path.isfile(output_path):
-                os.remove(output_path)
-
-            rel_output_path = os.path.join(rel_base_path, 'output.png')
-            if rel_output_path in file_lst:
-                file_lst.remove(rel_output_path)
-
-            result = None
+            for name in os.listdir(base_path):
+                if self.is_output_file(name):
+                    os.remove(os.path.join(base_path, name))
+            file_lst = [file for file in file_lst if not self.is_output_file(file)]
 
             img_lst = []
             for image_file in file_lst:
-                # 소문자로 변환
-                image_file = image_file.lower()
+                # 이미지 파일인경우만 병합 대상에 추가 (확장자는 소문자로 비교)
+                if image_file.lower().endswith(('.png', '.jpg', '.jpeg')):
+                    img_lst.append(os.path.abspath(image_file))
 
-                # 이미지 읽기 (이미지 파일인경우만 수행)
-                if image_file.endswith('.png') or image_file.endswith('.jpg') or image_file.endswith('.jpeg'):
-                    print("이미지 파일 : ", image_file)
-                    image_full_path = os.path.abspath(image_file)
-                    # 한글 경로를 처리할 수 있게 numpy로 읽어옴
-                    img_array = np.fromfile(image_full_path, np.uint8)
-                    img = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
-                    img_lst.append(img)
+            messages = [f"이미지 파일 : {len(img_lst)}개"]
+            output_paths = self.merge_sources(
+                img_lst,
+                base_path,
+                self.__max_height,
+                self.__lossless_jpeg,
+                messages=messages,
+            )
+            messages.append(
+                f"출력 경로 : {', '.join(map(os.path.basename, output_paths))}"
+            )
+            return messages
 
-            # call vconcat_resize_min function
-            result = self.__vconcat_resize_min(img_lst)
-            # result = cv2.vconcat(img_lst)
+        except Exception as e:
+            raise e
 
-            output_path = os.path.join(base_path, 'output.png')
-            print("출력 경로 : ", output_path)
+    def __processing_archive(self, archive_path: str) -> List[str]:
+        """
+        .cbz 아카이브 안의 이미지를 병합해서 아카이브 옆에 저장하는 함수
+        ("[0001] 제목.cbz" -> "[0001] 제목.png" 또는 "[0001] 제목_001.png" ...)
 
-            # imwrite 의 경우에도 한글 경로 인식이 안됨.
+        Returns:
+            메인 스레드에서 출력할 메시지 리스트
+        """
+        base_path = os.path.dirname(os.path.abspath(archive_path))
+        prefix = os.path.splitext(os.path.basename(archive_path))[0]
 
-            extension = os.path.splitext(output_path)[1]  # 이미지 확장자
+        # 이전에 이 아카이브로 만든 병합 결과 파일을 지우고 시작
+        output_pattern = re.compile(
+            rf"^{re.escape(prefix)}(_\d+)?\.(png|jpe?g)$", re.IGNORECASE
+        )
+        for name in os.listdir(base_path):
+            if output_pattern.match(name):
+                os.remove(os.path.join(base_path, name))
 
-            result, encoded_img = cv2.imencode(extension, result)
-            if result:
-                with open(output_path, mode='w+b') as f:
-                    encoded_img.tofile(f)
-            # cv2.imwrite(output_path, result)
-            print(f"병합 작업 완료 : {base_path}")
+        sources = [data for _, data in read_archive_images(archive_path)]
+        if not sources:
+            raise Exception(f"아카이브에 이미지가 없습니다 : {archive_path}")
 
-        except Exception as e:
-            raise e
+        messages = [f"이미지 파일 : {len(sources)}개"]
+        output_paths = self.merge_sources(
+            sources,
+            base_path,
+            self.__max_height,
+            self.__lossless_jpeg,
+            prefix,
+            messages,
+        )
+        messages.append(f"출력 경로 : {', '.join(map(os.path.basename, output_paths))}")
+        return messages
+
+    def _get_episode_files(self, path: str) -> list:
+        """에피소드 하나의 처리 대상 (폴더면 안의 파일 목록, .cbz 아카이브면 아카이브 자체)"""
+        if is_archive(path):
+            return [path]
+        return self.__get_files_in_dir(path)
 
     # 디렉토리에서 목록 읽고 리스트로 return
     def __get_files_in_dir(self, path):
-        file_lst = os.listdir(path)
+        file_lst = [name for name in os.listdir(path) if not name.startswith(".")]
         for i in range(0, len(file_lst)):
             file_lst[i] = os.path.join(path, file_lst[i])
         file_lst = natsort.natsorted(file_lst)  # natural sort 로 정렬
@@ -132,15 +248,60 @@ class ImageMerger:
         for element in self.__file_lst:
             print(element)
 
-    def run(self) -> None:
+    def run(self) -> bool:
+        """
+        병합을 실행하는 함수
+
+        Returns:
+            모든 에피소드를 처리했으면 True
+        """
         try:
             # 단일 디렉토리인 경우
             if self.__pure_file:
-                self._processing(self.__file_lst)  # 파일 리스트 그대로 merge
+                # 파일 리스트 그대로 merge
+                for message in self._processing(self.__file_lst):
+                    print(message)
+                print(f"작업 완료 : {self.__dir_path}")
+                return True
             else:
-                # 폴더가 안에 또 있는 구조면
-                for dir in self.__file_lst:
-                    inner_files_lst = self.__get_files_in_dir(dir)
-                    self._processing(inner_files_lst)
+                # 폴더가 안에 또 있는 구조면 에피소드 폴더들을 병렬로 처리
+                return not self.__run_parallel(self.__file_lst)
         except Exception as e:
             print(e)
+            return False
+
+    def __run_parallel(self, dir_lst: list) -> list:
+        """
+        에피소드 폴더들을 스레드 풀에서 동시에 처리하는 함수
+
+        OpenCV 의 디코딩 / 리사이즈 / 인코딩은 GIL 을 놓고 실행되므로 스레드만으로도
+        여러 CPU 코어를 사용할 수 있다. 한 에피소드에서 오류가 나도 나머지는 계속 처리한다.
+        출력은 작업이 끝나는 대로 메인 스레드에서만 하므로 에피소드별 메시지가 섞이지 않는다.
+
+        Returns:
+            처리에 실패한 폴더 리스트
+        """
+        total = len(dir_lst)
+        failed = []
+
+        print(f"{total}개 폴더를 {self.__workers}개 작업자로 처리합니다.")
+        with ThreadPoolExecutor(max_workers=self.__workers) as executor:
+            futures = {
+                executor.submit(self._processing, self._get_episode_files(dir)): dir
+                for dir in dir_lst
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                dir = futures[future]
+                try:
+                    messages = future.result()
+                    print(f"[{done}/{total}] 완료 : {dir}")
+                    for message in messages:
+                        print(f"  {message}")
+                except Exception as e:
+                    failed.append(dir)
+                    print(f"[{done}/{total}] 실패 : {dir} - {e}")
+
+        print(f"처리 결과 : 성공 {total - len(failed)}개 / 실패 {len(failed)}개")
+        for dir in failed:
+            print(f"  실패 : {dir}")
+        return failed
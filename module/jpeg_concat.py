@@ -0,0 +1,362 @@
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+from module.image_header import ImageSource
+
+# 결과 JPEG 의 높이 한도 (SOF 세그먼트의 높이 필드가 16비트)
+JPEG_MAX_HEIGHT = 65535
+
+# 그대로 이어붙일 수 있는 SOF 마커 (Baseline / Extended sequential, Huffman 부호화)
+CONCAT_SOF_MARKERS = (0xC0, 0xC1)
+
+# 크기 정보가 들어있는 그 외 SOF 마커 (프로그레시브, 무손실, 산술 부호화 등)
+OTHER_SOF_MARKERS = (0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF)
+
+MARKER_DHT = 0xC4
+MARKER_DQT = 0xDB
+MARKER_DRI = 0xDD
+MARKER_SOS = 0xDA
+MARKER_EOI = 0xD9
+
+
+class JpegConcatError(Exception):
+    """JPEG 를 디코딩 없이 이어붙일 수 없을 때 발생하는 예외 (픽셀 병합으로 대체해야 함)"""
+
+
+@dataclass
+class JpegInfo:
+    """이어붙이기에 필요한 JPEG 구조 정보"""
+
+    width: int
+    height: int
+    mcu_width: int
+    mcu_height: int
+    restart_interval: int  # 원본의 DRI 값 (없으면 0)
+    frame_key: bytes  # SOF 에서 높이를 뺀 나머지 (정밀도, 너비, 성분, 샘플링, 양자화 테이블 번호)
+    tables: bytes  # 모든 DQT / DHT 세그먼트 내용
+    sos: bytes  # SOS 세그먼트 전체 (마커 포함)
+    header: List[bytes] = field(default_factory=list)  # SOI 이후 SOS 전까지의 세그먼트 (DRI 제외)
+    sof_index: int = 0  # header 안에서 SOF 세그먼트의 위치
+    scan_start: int = 0  # 엔트로피 부호화 데이터 시작 위치
+    scan_end: int = 0  # 엔트로피 부호화 데이터 끝 위치 (EOI 직전)
+
+    @property
+    def mcus_per_row(self) -> int:
+        return -(-self.width // self.mcu_width)
+
+    @property
+    def mcu_count(self) -> int:
+        """이미지 전체의 MCU 수"""
+        return self.mcus_per_row * -(-self.height // self.mcu_height)
+
+
+def parse_jpeg(data: bytes) -> JpegInfo:
+    """
+    JPEG 바이트에서 이어붙이기에 필요한 구조 정보를 읽는 함수
+
+    Args:
+        data: JPEG 파일 내용
+
+    Returns:
+        JPEG 구조 정보
+
+    Raises:
+        JpegConcatError: JPEG 가 아니거나, 프로그레시브 / 다중 스캔 등 지원하지 않는 구조인 경우
+    """
+    if data[:2] != b"\xff\xd8":
+        raise JpegConcatError("JPEG 파일이 아닙니다.")
+
+    header: List[bytes] = []
+    tables: List[bytes] = []
+    sof: Optional[bytes] = None
+    sof_index = 0
+    restart_interval = 0
+    pos = 2
+
+    while True:
+        # 마커 앞의 채움 바이트(FF) 건너뛰기
+        if pos + 4 > len(data) or data[pos] != 0xFF:
+            raise JpegConcatError("손상된 JPEG 입니다.")
+        while data[pos + 1] == 0xFF:
+            pos += 1
+        marker = data[pos + 1]
+        length = struct.unpack(">H", data[pos + 2 : pos + 4])[0]
+        segment = data[pos : pos + 2 + length]
+        body = segment[4:]
+
+        if marker == MARKER_SOS:
+            if sof is None:
+                raise JpegConcatError("SOF 세그먼트가 없습니다.")
+            scan_start = pos + 2 + length
+            break
+
+        if marker in OTHER_SOF_MARKERS:
+            raise JpegConcatError("프로그레시브 / 산술 부호화 JPEG 는 지원하지 않습니다.")
+        if marker in CONCAT_SOF_MARKERS:
+            sof = segment
+            sof_index = len(header)
+        if marker in (MARKER_DQT, MARKER_DHT):
+            tables.append(segment)
+
+        if marker == MARKER_DRI:
+            restart_interval = struct.unpack(">H", body[:2])[0]
+        else:
+            header.append(segment)
+        pos += 2 + length
+
+    # SOF: 정밀도(1) 높이(2) 너비(2) 성분 수(1) + 성분마다 (id, 샘플링, 양자화 테이블 번호)
+    sof_body = sof[4:]
+    height, width = struct.unpack(">HH", sof_body[1:5])
+    component_count = sof_body[5]
+    sampling = [sof_body[6 + i * 3 + 1] for i in range(component_count)]
+    h_max = max(s >> 4 for s in sampling)
+    v_max = max(s & 0x0F for s in sampling)
+
+    sos = segment
+    if sos[4] != component_count:
+        # 성분별로 스캔이 나뉜 (non-interleaved) JPEG
+        raise JpegConcatError("다중 스캔 JPEG 는 지원하지 않습니다.")
+    if height == 0:
+        raise JpegConcatError("DNL 마커를 사용하는 JPEG 는 지원하지 않습니다.")
+
+    # 성분이 하나면 샘플링과 상관없이 MCU 는 8x8 블록 하나
+    if component_count == 1:
+        mcu_width, mcu_height = 8, 8
+    else:
+        mcu_width, mcu_height = h_max * 8, v_max * 8
+
+    # 엔트로피 부호화 데이터의 끝(EOI 또는 다음 스캔) 찾기
+    scan_end = scan_start
+    while True:
+        scan_end = data.find(b"\xff", scan_end)
+        if scan_end == -1 or scan_end + 1 >= len(data):
+            raise JpegConcatError("EOI 마커가 없습니다.")
+        next_byte = data[scan_end + 1]
+        if next_byte == 0x00 or 0xD0 <= next_byte <= 0xD7 or next_byte == 0xFF:
+            scan_end += 1 if next_byte == 0xFF else 2
+            continue
+        if next_byte != MARKER_EOI:
+            raise JpegConcatError("다중 스캔 JPEG 는 지원하지 않습니다.")
+        break
+
+    return JpegInfo(
+        width=width,
+        height=height,
+        mcu_width=mcu_width,
+        mcu_height=mcu_height,
+        restart_interval=restart_interval,
+        frame_key=sof_body[:1] + sof_body[3:],
+        tables=b"".join(tables),
+        sos=sos,
+        header=header,
+        sof_index=sof_index,
+        scan_start=scan_start,
+        scan_end=scan_end,
+    )
+
+
+def check_compatible(infos: Sequence[JpegInfo]) -> int:
+    """
+    JPEG 들을 디코딩 없이 이어붙일 수 있는지 확인하고 결과에 사용할 재시작 간격(DRI)을 구하는 함수
+
+    조건)
+    - 너비, 샘플링, 양자화 / 허프만 테이블, 스캔 구성이 모두 같아야 한다.
+    - 마지막을 제외한 이미지는 높이가 같고 MCU 높이의 배수여야 한다. (MCU 행이 어긋나지 않게)
+    - 원본에 재시작 간격이 있으면 모두 같아야 하고, 이미지 하나의 MCU 수가 그 배수여야 한다.
+
+    Returns:
+        결과 JPEG 의 재시작 간격 (이미지 경계마다 RST 마커가 오도록 설정)
+
+    Raises:
+        JpegConcatError: 조건을 만족하지 않는 경우
+    """
+    first = infos[0]
+    for info in infos[1:]:
+        if info.frame_key != first.frame_key:
+            raise JpegConcatError("너비 또는 샘플링 구성이 다릅니다.")
+        if info.tables != first.tables:
+            raise JpegConcatError("양자화 / 허프만 테이블이 다릅니다.")
+        if info.sos != first.sos:
+            raise JpegConcatError("스캔 구성이 다릅니다.")
+        if info.restart_interval != first.restart_interval:
+            raise JpegConcatError("재시작 간격(DRI)이 다릅니다.")
+
+    if len(infos) == 1:
+        return first.restart_interval
+
+    body = infos[:-1]
+    if any(info.height != first.height for info in body):
+        raise JpegConcatError("마지막을 제외한 이미지의 높이가 다릅니다.")
+    if first.height % first.mcu_height != 0:
+        raise JpegConcatError(
+            f"이미지 높이({first.height})가 MCU 높이({first.mcu_height})의 배수가 아닙니다."
+        )
+
+    mcu_count = first.mcu_count
+    if first.restart_interval:
+        # 원본 재시작 간격을 그대로 쓰고, 이미지 경계가 간격의 끝과 맞아야 한다
+        if mcu_count % first.restart_interval != 0:
+            raise JpegConcatError("이미지 경계가 재시작 간격과 맞지 않습니다.")
+        return first.restart_interval
+
+    # 이미지 하나를 재시작 간격 하나로 사용해 경계에서 DC 예측값을 초기화한다
+    if mcu_count > 0xFFFF:
+        raise JpegConcatError("이미지 하나의 MCU 수가 재시작 간격 한도를 넘습니다.")
+    return mcu_count
+
+
+def concat_jpegs(datas: Sequence[bytes]) -> bytes:
+    """
+    같은 너비 / 같은 테이블의 JPEG 들을 디코딩 없이 세로로 이어붙이는 함수 (jpegtran 방식)
+
+    첫 이미지의 헤더에 높이 합계와 재시작 간격(DRI)을 넣고, 각 이미지의 엔트로피 부호화 데이터를
+    RST 마커로 구분해서 이어붙인다. 원본에 있던 RST 마커는 순서대로 번호를 다시 매긴다.
+
+    Args:
+        datas: JPEG 파일 내용 (위에서부터 순서대로)
+
+    Returns:
+        이어붙인 JPEG 파일 내용
+
+    Raises:
+        JpegConcatError: 이어붙일 수 없는 경우
+    """
+    if not datas:
+        raise JpegConcatError("이어붙일 이미지가 없습니다.")
+
+    infos = [parse_jpeg(data) for data in datas]
+    restart_interval = check_compatible(infos)
+    total_height = sum(info.height for info in infos)
+    if total_height > JPEG_MAX_HEIGHT:
+        raise JpegConcatError(f"결과 높이({total_height})가 JPEG 한도를 넘습니다.")
+
+    first = infos[0]
+    out = bytearray(b"\xff\xd8")
+    for index, segment in enumerate(first.header):
+        if index == first.sof_index:
+            # 높이 필드만 합계로 바꾼다 (마커(2) + 길이(2) + 정밀도(1) 다음 2바이트)
+            segment = segment[:5] + struct.pack(">H", total_height) + segment[7:]
+        out += segment
+    if restart_interval:
+        out += b"\xff" + bytes([MARKER_DRI]) + struct.pack(">HH", 4, restart_interval)
+    out += first.sos
+
+    restart_number = 0
+    for index, (data, info) in enumerate(zip(datas, infos)):
+        # 원본의 RST 마커 번호를 전체 순서에 맞게 다시 매기면서 복사
+        pos = info.scan_start
+        while True:
+            found = data.find(b"\xff", pos, info.scan_end)
+            if found == -1:
+                out += data[pos : info.scan_end]
+                break
+            # 마커 앞의 채움 바이트(FF FF ...)를 건너뛰고 마커 종류를 확인한다
+            marker_pos = found + 1
+            while marker_pos < info.scan_end and data[marker_pos] == 0xFF:
+                marker_pos += 1
+            if marker_pos >= info.scan_end:
+                out += data[pos : info.scan_end]
+                break
+            next_byte = data[marker_pos]
+            if 0xD0 <= next_byte <= 0xD7:
+                # 채움 바이트는 버리고 새 번호의 RST 마커만 쓴다
+                out += data[pos:found]
+                out += bytes((0xFF, 0xD0 + restart_number % 8))
+                restart_number += 1
+            else:
+                out += data[pos : marker_pos + 1]
+            pos = marker_pos + 1
+
+        # 이미지 경계에 RST 마커를 넣어 다음 이미지의 DC 예측값을 초기화
+        if index < len(datas) - 1:
+            out += bytes((0xFF, 0xD0 + restart_number % 8))
+            restart_number += 1
+
+    out += b"\xff" + bytes([MARKER_EOI])
+    return bytes(out)
+
+
+def _read_source(source: ImageSource) -> bytes:
+    if isinstance(source, bytes):
+        return source
+    with open(source, "rb") as f:
+        return f.read()
+
+
+def concat_jpeg_files(
+    sources: Sequence[ImageSource],
+    output_dir: str,
+    max_height: int = 0,
+    prefix: str = "output",
+) -> List[str]:
+    """
+    JPEG 이미지들을 디코딩 없이 이어붙여 저장하는 함수
+
+    결과 높이가 max_height(0 이면 JPEG 한도인 65535)를 넘으면 이미지 경계에서 나눠
+    output_001.jpg, output_002.jpg ... 로 저장하고, 하나로 충분하면 output.jpg 로 저장한다.
+    모든 파일을 임시 파일(*.part)로 먼저 만든 뒤 한꺼번에 최종 이름으로 바꾸므로
+    중간 그룹에서 실패해도 앞 그룹의 파일만 남지 않는다.
+
+    Args:
+        sources: JPEG 파일 경로 또는 바이트 (위에서부터 순서대로)
+        output_dir: 저장할 폴더
+        max_height: 파일 하나의 최대 높이
+        prefix: 파일 이름 앞부분
+
+    Returns:
+        저장한 파일 경로 리스트
+
+    Raises:
+        JpegConcatError: 이어붙일 수 없거나, 이미지 하나의 높이가 max_height 를 넘는 경우
+            (아무 파일도 저장하지 않음 - 픽셀 병합으로 대체하면 패널 사이에서 잘라 저장)
+    """
+    limit = min(max_height, JPEG_MAX_HEIGHT) if max_height > 0 else JPEG_MAX_HEIGHT
+
+    # 헤더만 먼저 확인해서 전체 조건과 그룹(파일 하나에 들어갈 이미지들)을 정한다
+    infos = [parse_jpeg(_read_source(source)) for source in sources]
+    check_compatible(infos)
+
+    # 그룹에는 sources 안의 위치만 넣는다 (파일을 쓸 때 그룹의 이미지만 다시 읽음)
+    groups: List[List[int]] = [[]]
+    group_height = 0
+    for index, info in enumerate(infos):
+        if info.height > limit:
+            # 이미지 경계에서만 나눌 수 있으므로 이 이미지는 한도 안에 넣을 수 없다
+            raise JpegConcatError(
+                f"{index + 1}번째 이미지의 높이({info.height})가 최대 높이({limit})를 넘습니다."
+            )
+        if groups[-1] and group_height + info.height > limit:
+            groups.append([])
+            group_height = 0
+        groups[-1].append(index)
+        group_height += info.height
+
+    output_paths: List[str] = []
+    try:
+        for index, group in enumerate(groups, start=1):
+            datas = [_read_source(sources[position]) for position in group]
+
+            if len(groups) == 1:
+                output_path = os.path.join(output_dir, f"{prefix}.jpg")
+            else:
+                output_path = os.path.join(output_dir, f"{prefix}_{index:03}.jpg")
+
+            merged = concat_jpegs(datas)
+            output_paths.append(output_path)
+            with open(output_path + ".part", "wb") as f:
+                f.write(merged)
+    except BaseException:
+        # 실패하면 지금까지 만든 임시 파일을 지운다
+        for output_path in output_paths:
+            try:
+                os.remove(output_path + ".part")
+            except FileNotFoundError:
+                pass
+        raise
+
+    # 모든 그룹을 만든 뒤에만 최종 이름으로 바꾼다
+    for output_path in output_paths:
+        os.replace(output_path + ".part", output_path)
+    return output_paths
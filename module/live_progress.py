@@ -0,0 +1,286 @@
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    TaskID,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
+
+from module.progress import ProgressReporter
+from module.settings import Setting
+
+# 화면에 동시에 보여줄 에피소드 진행 막대 수 (나머지는 앞의 에피소드가 끝나면 차례로 표시)
+MAX_EPISODE_BARS = 5
+
+# 화면 대신 실패 로그 파일(ErrorPath)에 기록할 이벤트 (화면에는 진행 막대의 재시도 / 실패 수로만 표시)
+LOGGED_EVENTS = (
+    "retry",
+    "collect_failed",
+    "image_failed",
+    "image_error",
+    "episode_incomplete",
+    "merge_failed",
+    "download_error",
+)
+
+# 큐에 넣는 이벤트 (시각, 이벤트 이름, 이벤트 데이터), None 은 렌더러 종료 신호
+Event = Tuple[float, str, Dict[str, Any]]
+
+
+class LiveProgress(ProgressReporter):
+    """
+    다운로드 진행 상황을 rich 진행 막대로 보여주는 클래스
+
+    - 작업자(다운로드 코루틴 / 병합 스레드)는 emit() 으로 이벤트를 큐에 넣기만 한다. (화면 출력 / 잠금 없음)
+    - 렌더러 스레드 하나가 큐를 비우면서 전체 / 단계별 / 에피소드별 진행 막대를 갱신하고,
+      설정한 횟수(초당 RefreshPerSecond)까지만 화면을 다시 그린다.
+    - 재시도와 실패는 화면 대신 ErrorPath 로그 파일에 기록한다.
+    - quiet 모드에서는 진행 막대를 그리지 않고 로그 파일만 기록한다.
+
+    여러 웹툰을 동시에 받는 경우에도 하나의 객체로 모든 웹툰의 진행 상황을 합쳐서 보여준다.
+
+    사용 예)
+        with LiveProgress(settings) as progress:
+            await downloader_with(reporter=progress).download(1, 10)
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Setting] = None,
+        quiet: Optional[bool] = None,
+        log_path: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            settings: 설정 (기본값: settings.ini)
+            quiet: 진행 막대를 그리지 않을지 여부 (기본값: [Progress] Mode 설정값)
+            log_path: 실패 로그 파일 경로 (기본값: ErrorPath 설정값)
+        """
+        settings = settings if settings is not None else Setting()
+        self.__quiet = settings.progress_quiet if quiet is None else quiet
+        self.__interval = 1 / max(settings.progress_refresh_per_second, 0.1)
+        self.__log_path = log_path if log_path is not None else settings.error_path
+
+        self.__queue: "queue.SimpleQueue[Optional[Event]]" = queue.SimpleQueue()
+        self.__thread: Optional[threading.Thread] = None
+        self.__log: Optional[TextIO] = None
+
+        # 아래 상태는 렌더러 스레드에서만 다룬다
+        self.__progress = Progress(
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            TimeRemainingColumn(),
+            auto_refresh=False,
+        )
+        self.__overall = self.__progress.add_task("전체 에피소드", total=0)
+        self.__phases: Dict[str, TaskID] = {
+            "collect": self.__progress.add_task("  URL 수집", total=0),
+            "download": self.__progress.add_task("  이미지 다운로드", total=0),
+        }
+        self.__totals: Dict[TaskID, int] = dict.fromkeys(
+            (self.__overall, *self.__phases.values()), 0
+        )
+        self.__episodes: Dict[Tuple[int, int], TaskID] = {}  # (웹툰 id, 화수) -> 막대
+        self.__hidden: List[TaskID] = []  # 표시할 자리를 기다리는 에피소드 막대
+        self.__titles: Dict[int, str] = {}
+        self.__retries = 0
+        self.__failures = 0
+
+    def __enter__(self) -> "LiveProgress":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """진행 막대를 띄우고 렌더러 스레드를 시작한다."""
+        if self.__thread is not None:
+            return
+        if not self.__quiet:
+            self.__progress.start()
+        self.__thread = threading.Thread(
+            target=self.__run, name="nwebtoon-progress", daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """남은 이벤트를 모두 반영해서 마지막 화면을 그리고 렌더러 스레드를 종료한다."""
+        if self.__thread is None:
+            return
+        self.__queue.put(None)
+        self.__thread.join()
+        self.__thread = None
+        if not self.__quiet:
+            self.__progress.stop()
+        if self.__log is not None:
+            self.__log.close()
+            self.__log = None
+
+    def emit(self, event: str, **fields: Any) -> None:
+        self.__queue.put((time.time(), event, fields))
+
+    @property
+    def retries(self) -> int:
+        """지금까지 받은 재시도 이벤트 수"""
+        return self.__retries
+
+    @property
+    def failures(self) -> int:
+        """지금까지 받은 실패 이벤트 수 (에피소드 URL 수집 실패 + 이미지 실패 + 병합 / 저장 실패)"""
+        return self.__failures
+
+    # 렌더러 스레드 ----------------------------------------------------
+
+    def __run(self) -> None:
+        while True:
+            stopping = self.__drain(time.monotonic() + self.__interval)
+            self.__draw()
+            if stopping:
+                break
+
+    def __drain(self, deadline: float) -> bool:
+        """
+        deadline 까지 큐의 이벤트를 처리한다.
+        (이벤트가 많이 쌓여도 화면은 deadline 마다 한 번만 그린다)
+
+        Returns:
+            종료 신호를 받았는지 여부
+        """
+        while True:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                return False
+            try:
+                item = self.__queue.get(timeout=timeout)
+            except queue.Empty:
+                return False
+            if item is None:
+                return True
+            self.__handle(*item)
+
+    def __draw(self) -> None:
+        if not self.__quiet:
+            self.__progress.refresh()
+        if self.__log is not None:
+            self.__log.flush()
+
+    def __handle(self, ts: float, event: str, fields: Dict[str, Any]) -> None:
+        """이벤트 하나를 진행 막대 상태에 반영한다."""
+        progress = self.__progress
+        title_id = fields.get("title_id", 0)
+
+        if event in LOGGED_EVENTS:
+            self.__write_log(ts, event, fields)
+
+        if event == "download_start":
+            self.__titles[title_id] = fields.get("title", str(title_id))
+            pending = fields.get("pending", 0)
+            for task_id in (self.__overall, self.__phases["collect"], *self.__merge_task()):
+                self.__add_total(task_id, pending)
+        elif event == "episode_collected":
+            # 공유 속도 제한기가 현재 허용하는 상세 페이지 요청 속도를 URL 수집 막대에 함께 표시
+            rate = fields.get("rate")
+            description = "  URL 수집" if rate is None else f"  URL 수집 ({rate:.1f} req/s)"
+            progress.update(
+                self.__phases["collect"], advance=1, description=description
+            )
+            # 이미지가 없는 에피소드는 다운로드 단계로 넘어가지 않으므로 여기서 끝난 것으로 센다
+            if not fields.get("images"):
+                progress.advance(self.__overall)
+        elif event == "collect_failed":
+            self.__failures += 1
+            progress.advance(self.__phases["collect"])
+            progress.advance(self.__overall)
+        elif event == "episode_start":
+            images = fields.get("images", 0)
+            self.__add_total(self.__phases["download"], images)
+            self.__add_episode(title_id, fields.get("no", 0), images)
+        elif event == "image_done":
+            progress.advance(self.__phases["download"])
+            task_id = self.__episodes.get((title_id, fields.get("no", 0)))
+            if task_id is not None:
+                progress.advance(task_id)
+        elif event in ("image_failed", "image_error", "merge_failed"):
+            self.__failures += 1
+        elif event == "retry":
+            self.__retries += 1
+        elif event == "episode_saved":
+            progress.advance(self.__merge_task(create=True)[0])
+        elif event == "episode_done":
+            progress.advance(self.__overall)
+            self.__remove_episode(title_id, fields.get("no", 0))
+        else:
+            return
+
+        progress.update(
+            self.__overall,
+            description=f"전체 에피소드 (재시도 {self.__retries} / 실패 {self.__failures})",
+        )
+
+    def __merge_task(self, create: bool = False) -> Tuple[TaskID, ...]:
+        """
+        strip / cbz 모드의 병합 / 저장 단계 막대 (첫 episode_saved 이벤트를 받을 때 만든다)
+
+        Returns:
+            막대가 있으면 (막대,), 없으면 빈 튜플
+        """
+        task_id = self.__phases.get("merge")
+        if task_id is None and create:
+            total = self.__totals[self.__overall]
+            task_id = self.__phases["merge"] = self.__progress.add_task(
+                "  병합 / 저장", total=total
+            )
+            self.__totals[task_id] = total
+        return () if task_id is None else (task_id,)
+
+    def __add_total(self, task_id: TaskID, amount: int) -> None:
+        self.__totals[task_id] += amount
+        self.__progress.update(task_id, total=self.__totals[task_id])
+
+    def __add_episode(self, title_id: int, no: int, images: int) -> None:
+        if len(self.__titles) > 1:
+            description = f"    {self.__titles.get(title_id, title_id)} {no}화"
+        else:
+            description = f"    {no}화"
+        visible = len(self.__episodes) - len(self.__hidden) < MAX_EPISODE_BARS
+        task_id = self.__progress.add_task(description, total=images, visible=visible)
+        self.__episodes[(title_id, no)] = task_id
+        if not visible:
+            self.__hidden.append(task_id)
+
+    def __remove_episode(self, title_id: int, no: int) -> None:
+        task_id = self.__episodes.pop((title_id, no), None)
+        if task_id is None:
+            return
+        self.__progress.remove_task(task_id)
+        if task_id in self.__hidden:
+            self.__hidden.remove(task_id)
+        elif self.__hidden:
+            # 가려져 있던 다음 에피소드를 표시
+            self.__progress.update(self.__hidden.pop(0), visible=True)
+
+    def __write_log(self, ts: float, event: str, fields: Dict[str, Any]) -> None:
+        """재시도 / 실패 이벤트를 실패 로그 파일에 한 줄로 추가한다."""
+        if self.__log is None:
+            if not self.__log_path:
+                return
+            try:
+                self.__log = open(self.__log_path, "a", encoding="utf-8")
+            except OSError:
+                self.__log_path = ""  # 다시 열어보지 않음
+                return
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+        detail = " ".join(
+            f"{key}={value}" for key, value in fields.items() if value is not None
+        )
+        self.__log.write(f"{stamp} [{event}] {detail}\n")
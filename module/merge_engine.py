@@ -0,0 +1,262 @@
+import os
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from module.image_header import ImageSource, read_image_size
+
+# 분할 지점(패널 사이 여백)으로 인정할 행의 최대 분산 값과 최소 연속 행 수
+GUTTER_VARIANCE = 4.0
+MIN_GUTTER_ROWS = 4
+
+# 분산 계산 시 한 번에 처리할 행 수 (임시 배열 크기 제한용)
+VARIANCE_CHUNK_ROWS = 512
+
+
+@dataclass
+class MergeItem:
+    """병합할 이미지 하나의 배치 정보"""
+
+    index: int  # sources 안의 위치 (바이트 소스를 배치 정보에 붙잡아두지 않도록 위치만 기억)
+    width: int  # 원본 너비
+    height: int  # 원본 높이
+    out_height: int  # 결과 이미지에서 차지하는 높이 (너비를 맞춘 뒤의 높이)
+
+
+class MergeEngine:
+    """
+    여러 이미지를 세로로 이어붙이는 병합 엔진
+
+    1. 이미지 헤더만 읽어서 결과 이미지의 크기를 먼저 계산한다. (가장 작은 너비에 맞춤)
+    2. 결과 크기만큼의 배열을 한 번만 할당한다.
+    3. 이미지를 하나씩 디코딩해서 배열의 해당 위치에 바로 넣는다.
+       (너비가 같으면 그대로 복사하고, 더 넓은 이미지만 INTER_AREA 로 축소)
+
+    이미지 전체를 리스트로 디코딩한 뒤 vconcat 하는 방식과 달리,
+    메모리에는 결과 배열 하나와 디코딩 중인 이미지 하나만 올라간다.
+    """
+
+    def __init__(self, interpolation: int = cv2.INTER_AREA) -> None:
+        # 결과 너비는 가장 작은 너비이므로 리사이즈는 항상 축소 -> 축소에 적합한 INTER_AREA 사용
+        self.__interpolation = interpolation
+
+    def __place(self, img: np.ndarray, dst: np.ndarray) -> None:
+        """디코딩한 이미지를 결과 배열의 자리(dst)에 넣는다."""
+        if img.shape == dst.shape:
+            # 대부분의 네이버 웹툰처럼 너비가 같은 경우 리사이즈 없이 바로 복사
+            np.copyto(dst, img)
+        else:
+            # 미리 할당한 배열의 해당 위치에 바로 리사이즈 (중간 복사본을 만들지 않음)
+            cv2.resize(
+                img,
+                (dst.shape[1], dst.shape[0]),
+                dst=dst,
+                interpolation=self.__interpolation,
+            )
+
+    @staticmethod
+    def decode(source: ImageSource) -> np.ndarray:
+        """
+        이미지 파일 경로 또는 바이트를 BGR 배열로 디코딩하는 함수
+        (cv2.imread 는 한글 경로를 읽지 못하므로 numpy 로 읽어서 디코딩)
+        """
+        if isinstance(source, bytes):
+            buffer = np.frombuffer(source, np.uint8)
+        else:
+            buffer = np.fromfile(os.path.abspath(source), np.uint8)
+
+        img = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+        if img is None:
+            name = source if isinstance(source, str) else "<bytes>"
+            raise Exception(f"이미지를 읽을 수 없습니다 : {name}")
+        return img
+
+    def plan(self, sources: Sequence[ImageSource]) -> Tuple[int, List[MergeItem]]:
+        """
+        헤더만 읽어서 결과 이미지의 너비와 각 이미지의 배치를 계산하는 함수
+
+        Args:
+            sources: 병합할 이미지 (위에서부터 순서대로)
+
+        Returns:
+            (결과 너비, 이미지별 배치 정보)
+        """
+        sizes: List[Tuple[int, int]] = []
+        for source in sources:
+            size = read_image_size(source)
+            if size is None:
+                # PNG / JPEG 가 아니거나 헤더가 손상된 경우 디코딩해서 크기를 확인
+                height, width = self.decode(source).shape[:2]
+                size = (width, height)
+            sizes.append(size)
+
+        # 수직으로 합칠때, 큰 이미지가 있으면 작게 resize 후 붙인다
+        # https://note.nkmk.me/en/python-opencv-hconcat-vconcat-np-tile/
+        w_min = min(width for width, _ in sizes)
+        items = [
+            MergeItem(
+                index=index,
+                width=width,
+                height=height,
+                out_height=int(height * w_min / width),
+            )
+            for index, (width, height) in enumerate(sizes)
+        ]
+        return w_min, items
+
+    def merge(self, sources: Sequence[ImageSource]) -> np.ndarray:
+        """
+        이미지를 세로로 이어붙인 배열을 만드는 함수
+
+        Args:
+            sources: 병합할 이미지 (위에서부터 순서대로)
+
+        Returns:
+            병합된 BGR 배열
+        """
+        if not sources:
+            raise Exception("병합할 이미지가 없습니다.")
+
+        width, items = self.plan(sources)
+        canvas = np.empty(
+            (sum(item.out_height for item in items), width, 3), dtype=np.uint8
+        )
+
+        y = 0
+        for item in items:
+            img = self.decode(sources[item.index])
+            self.__place(img, canvas[y : y + item.out_height])
+            y += item.out_height
+            del img
+
+        return canvas
+
+    def write(self, sources: Sequence[ImageSource], output_path: str) -> None:
+        """
+        이미지를 세로로 이어붙여 파일로 저장하는 함수
+        (cv2.imwrite 는 한글 경로를 처리하지 못하므로 imencode 후 직접 저장)
+
+        Args:
+            sources: 병합할 이미지 (위에서부터 순서대로)
+            output_path: 저장할 파일 경로 (확장자로 형식 결정)
+        """
+        canvas = self.merge(sources)
+        self.__encode_to(canvas, output_path)
+
+    def write_segments(
+        self,
+        sources: Sequence[ImageSource],
+        output_dir: str,
+        max_height: int,
+        prefix: str = "output",
+        extension: str = ".png",
+    ) -> List[str]:
+        """
+        이미지를 세로로 이어붙이되, max_height 를 넘지 않는 여러 파일로 나눠 저장하는 함수
+
+        결과 전체를 한 번에 만들지 않고 (max_height + 가장 긴 이미지) 크기의 버퍼만 사용한다.
+        버퍼가 max_height 를 넘으면 패널 사이의 빈 여백(행 분산이 작은 구간)에서 잘라
+        그 부분을 바로 인코딩해 저장하고, 남은 부분을 버퍼 앞으로 옮긴 뒤 계속 채운다.
+
+        Args:
+            sources: 병합할 이미지 (위에서부터 순서대로)
+            output_dir: 저장할 폴더
+            max_height: 파일 하나의 최대 높이 (픽셀)
+            prefix: 파일 이름 앞부분 (output_001.png, output_002.png ...)
+            extension: 저장할 이미지 형식
+
+        Returns:
+            저장한 파일 경로 리스트
+        """
+        if not sources:
+            raise Exception("병합할 이미지가 없습니다.")
+        if max_height <= 0:
+            raise ValueError("max_height 는 0보다 커야 합니다.")
+
+        width, items = self.plan(sources)
+        tallest = max(item.out_height for item in items)
+        buffer = np.empty((max_height + tallest, width, 3), dtype=np.uint8)
+
+        filled = 0  # 버퍼에 채워진 행 수
+        boundaries: List[int] = []  # 버퍼 안에서 이미지와 이미지 사이의 경계 위치
+        output_paths: List[str] = []
+
+        def flush(rows: int) -> None:
+            """버퍼의 앞쪽 rows 행을 파일 하나로 저장한다."""
+            output_path = os.path.join(
+                output_dir, f"{prefix}_{len(output_paths) + 1:03}{extension}"
+            )
+            self.__encode_to(buffer[:rows], output_path)
+            output_paths.append(output_path)
+
+        for item in items:
+            img = self.decode(sources[item.index])
+            self.__place(img, buffer[filled : filled + item.out_height])
+            filled += item.out_height
+            boundaries.append(filled)
+            del img
+
+            # 최대 높이를 넘은 만큼 잘라서 바로 저장
+            while filled > max_height:
+                split = self.__find_split(buffer, max_height, boundaries)
+                flush(split)
+
+                remain = filled - split
+                buffer[:remain] = buffer[split:filled]
+                filled = remain
+                boundaries = [b - split for b in boundaries if b > split]
+
+        if filled > 0:
+            flush(filled)
+        return output_paths
+
+    @staticmethod
+    def __row_variance(rows: np.ndarray) -> np.ndarray:
+        """행마다 모든 픽셀(모든 채널) 값의 분산을 구한다. (큰 임시 배열을 피하려고 나눠서 계산)"""
+        variances = np.empty(rows.shape[0], dtype=np.float32)
+        for start in range(0, rows.shape[0], VARIANCE_CHUNK_ROWS):
+            chunk = rows[start : start + VARIANCE_CHUNK_ROWS]
+            variances[start : start + chunk.shape[0]] = chunk.reshape(
+                chunk.shape[0], -1
+            ).var(axis=1, dtype=np.float32)
+        return variances
+
+    def __find_split(
+        self, buffer: np.ndarray, max_height: int, boundaries: List[int]
+    ) -> int:
+        """
+        max_height 이하에서 자를 위치를 찾는 함수
+
+        1. 아래쪽 절반 구간에서 패널 사이 여백(분산이 작은 행이 연속된 구간)의 가운데
+        2. 여백이 없으면 같은 구간 안의 이미지 경계
+        3. 둘 다 없으면 max_height 위치
+        """
+        low = max(max_height // 2, 1)
+        variances = self.__row_variance(buffer[low:max_height])
+        blank = variances <= GUTTER_VARIANCE
+
+        # 연속된 빈 행 구간(run)의 시작 / 끝 위치 계산
+        edges = np.diff(np.concatenate(([0], blank.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        runs = [(s, e) for s, e in zip(starts, ends) if e - s >= MIN_GUTTER_ROWS]
+        if runs:
+            start, end = runs[-1]
+            return low + int((start + end) // 2)
+
+        candidates = [b for b in boundaries if low <= b <= max_height]
+        if candidates:
+            return max(candidates)
+        return max_height
+
+    @staticmethod
+    def __encode_to(image: np.ndarray, output_path: str) -> None:
+        """배열을 확장자에 맞게 인코딩해서 저장한다. (한글 경로 처리를 위해 imencode 사용)"""
+        extension = os.path.splitext(output_path)[1]  # 이미지 확장자
+        result, encoded_img = cv2.imencode(extension, image)
+        if not result:
+            raise Exception(f"이미지 인코딩 실패 : {output_path}")
+        with open(output_path, mode="w+b") as f:
+            encoded_img.tofile(f)
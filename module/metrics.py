@@ -0,0 +1,320 @@
+import json
+import math
+import os
+import random
+import time
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from module.settings import Setting
+
+# 지금 실행 중인 단계 (analyze / collect / download / merge)
+# asyncio 작업과 asyncio.to_thread 는 생성 시점의 컨텍스트를 복사하므로
+# 요청을 보내는 코드가 단계를 몰라도 HttpSession 의 trace 훅에서 단계별로 나눠 기록할 수 있다.
+current_phase: ContextVar[str] = ContextVar("nwebtoon_phase", default="other")
+
+# Prometheus 히스토그램 구간 (초)
+LATENCY_BUCKETS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 분위수 계산용으로 단계 + 호스트마다 남겨두는 지연 시간 표본 수
+# (요청이 이보다 많으면 균등 표본(reservoir sampling)으로 추정한다)
+LATENCY_RESERVOIR = 1024
+
+
+@dataclass
+class RequestSeries:
+    """단계 + 호스트 하나의 요청 측정값"""
+
+    statuses: Dict[str, int] = field(default_factory=dict)  # 상태 코드("200", "error") -> 요청 수
+    retries: int = 0
+    bytes: int = 0  # 받은 응답 본문 크기
+
+    # 지연 시간 (요청 시작 ~ 응답 헤더 수신, 초)
+    # 요청 수와 상관없이 메모리를 일정하게 쓰도록 구간별 개수와 정렬된 표본만 남긴다
+    latency_count: int = 0
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+    bucket_counts: List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    samples: List[float] = field(default_factory=list)  # 최대 LATENCY_RESERVOIR 개, 항상 정렬 상태
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+    def observe(self, latency: float) -> None:
+        """지연 시간 하나를 구간 개수와 표본에 반영한다."""
+        self.latency_count += 1
+        self.latency_sum += latency
+        self.latency_max = max(self.latency_max, latency)
+
+        # latency 이상인 첫 구간 (모든 구간보다 크면 +Inf 에만 포함)
+        index = bisect_left(LATENCY_BUCKETS, latency)
+        if index < len(LATENCY_BUCKETS):
+            self.bucket_counts[index] += 1
+
+        # reservoir sampling: 지금까지 받은 값 중 LATENCY_RESERVOIR 개를 균등하게 남긴다
+        if len(self.samples) < LATENCY_RESERVOIR:
+            insort(self.samples, latency)
+            return
+        slot = random.randrange(self.latency_count)
+        if slot < LATENCY_RESERVOIR:
+            # 표본은 정렬되어 있지만 어느 값을 버릴지는 무작위이므로 균등성은 그대로다
+            del self.samples[slot]
+            insort(self.samples, latency)
+
+    def percentile(self, q: float) -> float:
+        """지연 시간의 q 분위수 (표본의 nearest-rank, 요청이 없으면 0)"""
+        if not self.samples:
+            return 0.0
+        rank = min(max(math.ceil(q * len(self.samples)), 1), len(self.samples))
+        return self.samples[rank - 1]
+
+
+@dataclass
+class PhaseSpan:
+    """단계 하나의 실행 구간"""
+
+    first_start: Optional[float] = None
+    last_end: Optional[float] = None
+    busy_seconds: float = 0.0  # 단계에 들어가 있던 시간의 합 (동시 실행이면 wall 보다 클 수 있음)
+    entries: int = 0  # 단계에 들어간 횟수 (요청 / 에피소드 수)
+
+    @property
+    def wall_seconds(self) -> float:
+        """단계가 처음 시작된 시점부터 마지막으로 끝난 시점까지의 시간"""
+        if self.first_start is None or self.last_end is None:
+            return 0.0
+        return self.last_end - self.first_start
+
+
+class MetricsRegistry:
+    """
+    분석 / URL 수집 / 이미지 다운로드 / 병합 단계의 측정값을 모으는 클래스
+
+    - 요청 수(상태 코드별), 재시도 수, 받은 바이트, 지연 시간을 단계 + 호스트별로 기록한다.
+    - 실행이 끝나면 write() 로 JSON 요약과 Prometheus textfile 을 쓴다.
+      (MaxConcurrent / RateLimit 값을 감이 아니라 측정값으로 조정하기 위함)
+
+    HttpSession 이 하나씩 가지고 있고, 요청 수 / 지연 시간은 aiohttp trace 훅에서,
+    받은 바이트와 재시도는 요청을 보내는 코드에서 기록한다.
+    이벤트 루프 스레드에서만 기록하므로 잠금은 사용하지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self.__series: Dict[Tuple[str, str], RequestSeries] = {}  # (단계, 호스트) -> 측정값
+        self.__phases: Dict[str, PhaseSpan] = {}
+        self.__started_at = time.time()
+
+    def __get_series(self, host: str, phase: Optional[str] = None) -> RequestSeries:
+        key = (phase or current_phase.get(), host)
+        series = self.__series.get(key)
+        if series is None:
+            series = self.__series[key] = RequestSeries()
+        return series
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        with 블록 안에서 보내는 요청을 name 단계로 기록하고, 단계의 실행 구간을 잰다.
+
+        사용 예)
+            with metrics.phase("collect"):
+                await session.get(...)
+        """
+        token = current_phase.set(name)
+        span = self.__phases.setdefault(name, PhaseSpan())
+        start = time.perf_counter()
+        if span.first_start is None:
+            span.first_start = start
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            span.last_end = end if span.last_end is None else max(span.last_end, end)
+            span.busy_seconds += end - start
+            span.entries += 1
+            current_phase.reset(token)
+
+    def observe_request(
+        self, host: str, status: str, latency: float, phase: Optional[str] = None
+    ) -> None:
+        """
+        요청 하나의 결과를 기록한다.
+
+        Args:
+            host: 요청한 호스트
+            status: 상태 코드 문자열 (예외로 실패한 경우 "error")
+            latency: 요청 시작부터 응답 헤더를 받을 때까지 걸린 시간(초)
+            phase: 단계 (기본값: 현재 단계)
+        """
+        series = self.__get_series(host, phase)
+        series.statuses[status] = series.statuses.get(status, 0) + 1
+        series.observe(latency)
+
+    def add_bytes(self, host: str, size: int) -> None:
+        """현재 단계에서 host 로부터 받은 응답 본문 크기를 더한다."""
+        self.__get_series(host).bytes += size
+
+    def record_retry(self, url: str, phase: Optional[str] = None) -> None:
+        """phase 단계(기본값: 현재 단계)에서 url 의 호스트로 보낸 요청의 재시도 횟수를 더한다."""
+        self.__get_series(urlsplit(url).hostname or "", phase).retries += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        단계별 / 호스트별 요약을 만든다.
+
+        Returns:
+            {"phases": {단계: {"wall_seconds", "requests", "mb_per_sec", "hosts": {호스트: {...}}}}}
+        """
+        phases: Dict[str, Dict[str, Any]] = {}
+        names = sorted({phase for phase, _ in self.__series} | set(self.__phases))
+        for name in names:
+            span = self.__phases.get(name, PhaseSpan())
+            wall = span.wall_seconds
+            hosts: Dict[str, Any] = {}
+            for (phase, host), series in sorted(self.__series.items()):
+                if phase != name:
+                    continue
+                hosts[host] = {
+                    "requests": series.requests,
+                    "statuses": dict(sorted(series.statuses.items())),
+                    "retries": series.retries,
+                    "bytes": series.bytes,
+                    "mb_per_sec": round(series.bytes / 2**20 / wall, 3) if wall > 0 else 0.0,
+                    "latency_seconds": {
+                        "p50": round(series.percentile(0.50), 4),
+                        "p95": round(series.percentile(0.95), 4),
+                        "p99": round(series.percentile(0.99), 4),
+                        "max": round(series.latency_max, 4),
+                    },
+                }
+            total_bytes = sum(host["bytes"] for host in hosts.values())
+            phases[name] = {
+                "wall_seconds": round(wall, 3),
+                "busy_seconds": round(span.busy_seconds, 3),
+                "entries": span.entries,
+                "requests": sum(host["requests"] for host in hosts.values()),
+                "retries": sum(host["retries"] for host in hosts.values()),
+                "bytes": total_bytes,
+                "mb_per_sec": round(total_bytes / 2**20 / wall, 3) if wall > 0 else 0.0,
+                "hosts": hosts,
+            }
+        return {
+            "started_at": round(self.__started_at, 3),
+            "finished_at": round(time.time(), 3),
+            "phases": phases,
+        }
+
+    @staticmethod
+    def __labels(**labels: str) -> str:
+        """Prometheus 라벨 문자열 ({phase="download",host="..."})"""
+        parts = []
+        for name, value in labels.items():
+            value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            parts.append(f'{name}="{value}"')
+        return "{" + ",".join(parts) + "}"
+
+    def to_prometheus(self) -> str:
+        """node_exporter textfile collector 형식의 문자열을 만든다."""
+        lines: List[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        series_items = sorted(self.__series.items())
+
+        header("nwebtoon_requests_total", "counter", "HTTP requests by phase, host and status")
+        for (phase, host), series in series_items:
+            for status, count in sorted(series.statuses.items()):
+                labels = self.__labels(phase=phase, host=host, status=status)
+                lines.append(f"nwebtoon_requests_total{labels} {count}")
+
+        header("nwebtoon_retries_total", "counter", "Retried HTTP requests by phase and host")
+        for (phase, host), series in series_items:
+            lines.append(
+                f"nwebtoon_retries_total{self.__labels(phase=phase, host=host)} {series.retries}"
+            )
+
+        header("nwebtoon_response_bytes_total", "counter", "Response body bytes by phase and host")
+        for (phase, host), series in series_items:
+            lines.append(
+                f"nwebtoon_response_bytes_total{self.__labels(phase=phase, host=host)} {series.bytes}"
+            )
+
+        header(
+            "nwebtoon_request_duration_seconds",
+            "histogram",
+            "Time from request start to response headers by phase and host",
+        )
+        for (phase, host), series in series_items:
+            count = 0
+            for bound, bucket in zip(LATENCY_BUCKETS, series.bucket_counts):
+                # bound 이하인 요청 수 (누적)
+                count += bucket
+                labels = self.__labels(phase=phase, host=host, le=f"{bound:g}")
+                lines.append(f"nwebtoon_request_duration_seconds_bucket{labels} {count}")
+            labels = self.__labels(phase=phase, host=host, le="+Inf")
+            lines.append(
+                f"nwebtoon_request_duration_seconds_bucket{labels} {series.latency_count}"
+            )
+            labels = self.__labels(phase=phase, host=host)
+            lines.append(
+                f"nwebtoon_request_duration_seconds_sum{labels} {series.latency_sum:.6f}"
+            )
+            lines.append(
+                f"nwebtoon_request_duration_seconds_count{labels} {series.latency_count}"
+            )
+
+        header("nwebtoon_phase_wall_seconds", "gauge", "Wall time from first start to last end of a phase")
+        for name, span in sorted(self.__phases.items()):
+            lines.append(
+                f"nwebtoon_phase_wall_seconds{self.__labels(phase=name)} {span.wall_seconds:.6f}"
+            )
+
+        header("nwebtoon_phase_busy_seconds", "gauge", "Summed time spent inside a phase")
+        for name, span in sorted(self.__phases.items()):
+            lines.append(
+                f"nwebtoon_phase_busy_seconds{self.__labels(phase=name)} {span.busy_seconds:.6f}"
+            )
+
+        header("nwebtoon_last_run_timestamp_seconds", "gauge", "Unix time the metrics were written")
+        lines.append(f"nwebtoon_last_run_timestamp_seconds {time.time():.3f}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, json_path: str, prometheus_path: str) -> None:
+        """
+        JSON 요약과 Prometheus textfile 을 쓴다.
+        (textfile collector 가 쓰는 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체)
+        """
+        outputs = (
+            (json_path, json.dumps(self.summary(), ensure_ascii=False, indent=2)),
+            (prometheus_path, self.to_prometheus()),
+        )
+        for path, content in outputs:
+            if not path:
+                continue
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+
+def export_metrics(metrics: MetricsRegistry, settings: Setting) -> None:
+    """설정에서 측정값 기록을 켠 경우 JSON 요약과 Prometheus textfile 을 쓴다."""
+    if not settings.metrics_enabled:
+        return
+    try:
+        metrics.write(settings.metrics_json_path, settings.metrics_prometheus_path)
+        print(
+            f"측정값 저장: {settings.metrics_json_path}, {settings.metrics_prometheus_path}"
+        )
+    except OSError as e:
+        print(f"측정값을 저장하지 못했습니다. ({e})")
@@ -0,0 +1,47 @@
+import json
+import sys
+import threading
+import time
+from typing import Any, Optional, TextIO
+
+
+class ProgressReporter:
+    """
+    다운로드 / 병합 진행 상황 이벤트를 받는 기본 클래스 (아무것도 하지 않음)
+
+    대화형 실행에서는 이 기본 구현을 사용하고, 배치 실행(CLI)에서는
+    JsonLinesReporter 로 바꿔서 다른 프로그램이 진행 상황을 읽을 수 있게 한다.
+    """
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """
+        진행 상황 이벤트 하나를 기록한다.
+
+        Args:
+            event: 이벤트 이름 (download_start, episode_done ...)
+            fields: 이벤트 데이터 (JSON 으로 변환 가능한 값)
+        """
+
+
+class JsonLinesReporter(ProgressReporter):
+    """
+    진행 상황 이벤트를 한 줄에 JSON 하나씩(JSON Lines) 출력하는 클래스
+
+    출력 예)
+        {"ts": 1700000000.12, "event": "episode_done", "title_id": 758037, "no": 3, "success": true}
+
+    사람이 읽는 메시지는 stderr 로 보내고 이벤트만 stdout 으로 내보내면
+    여러 프로세스를 동시에 실행해도 각 출력을 그대로 모아서 처리할 수 있다.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        self.__stream = stream if stream is not None else sys.stdout
+        # 병합 작업자 스레드에서도 이벤트를 보내므로 한 줄씩 통째로 쓰도록 잠금
+        self.__lock = threading.Lock()
+
+    def emit(self, event: str, **fields: Any) -> None:
+        record = {"ts": round(time.time(), 3), "event": event, **fields}
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self.__lock:
+            self.__stream.write(line + "\n")
+            self.__stream.flush()
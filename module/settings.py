@@ -13,6 +13,16 @@ class FileSettingType(StrEnum):
     Image = auto()
 
 
+# 다운로드 결과 형식
+#  files : 이미지를 한 장씩 파일로 저장 (기본값)
+#  strip : 에피소드 이미지를 메모리에 모아 두었다가 병합한 결과 파일(output.png ...)만 저장
+#  cbz   : 에피소드 이미지를 받는 대로 순번 순서대로 "[0001] 제목.cbz" 아카이브(무압축 ZIP)에 저장
+class OutputMode(StrEnum):
+    files = auto()
+    strip = auto()
+    cbz = auto()
+
+
 class Setting:
     def __init__(self, file_name="./settings.ini", encoding="UTF-8") -> None:
         try:
@@ -28,9 +38,64 @@ class Setting:
                 config["ZeroFill"]["Image"] = "4"
 
                 config["Download"] = {}  # 다운로드 관련 설정 섹션
-                config["Download"]["BatchSize"] = "5"  # 배치 크기
+                config["Download"]["BatchSize"] = "5"  # URL 수집 동시 요청 수
                 config["Download"]["MaxConcurrent"] = "10"  # 최대 동시 다운로드 수
-                config["Download"]["DelaySeconds"] = "1"  # 배치 간 대기 시간(초)
+                # 이어받기 시 이미 받은 파일의 체크섬까지 다시 검증할지 여부 (false 면 크기만 비교)
+                config["Download"]["VerifyChecksum"] = "false"
+                config["Download"]["OutputMode"] = "files"  # files / strip / cbz
+                # strip / cbz 모드에서 에피소드 이미지를 메모리에 둘 최대 크기(MB), 넘으면 임시 파일로 옮김
+                config["Download"]["StripMemoryMB"] = "64"
+                # files 모드에서 같은 이미지를 한 번만 받아 .objects 에 저장하고 하드 링크로 연결할지 여부
+                config["Download"]["Deduplicate"] = "false"
+
+                config["Network"] = {}  # 공유 HTTP 세션(커넥션 풀) 관련 설정 섹션
+                config["Network"]["ConnectionLimit"] = "100"  # 전체 최대 커넥션 수
+                config["Network"]["LimitPerHost"] = "20"  # 호스트당 최대 커넥션 수
+                config["Network"]["DnsCacheSeconds"] = "300"  # DNS 캐시 유지 시간(초)
+                config["Network"]["KeepAliveSeconds"] = "30"  # keep-alive 유지 시간(초)
+                # 웹툰 정보 API / 상세 페이지 주소 (벤치마크용 가짜 서버를 쓸 때만 변경)
+                config["Network"]["BaseUrl"] = "https://comic.naver.com"
+                # 에피소드 목록(list API) 페이지를 동시에 요청할 수
+                config["Network"]["ListConcurrency"] = "4"
+
+                config["RateLimit"] = {}  # 호스트별 요청 속도 제한 (AIMD) 설정 섹션
+                config["RateLimit"]["InitialRate"] = "5"  # 시작 속도 (초당 요청 수)
+                config["RateLimit"]["MinRate"] = "0.5"  # 최소 속도
+                config["RateLimit"]["MaxRate"] = "20"  # 최대 속도
+                config["RateLimit"]["IncreaseStep"] = "0.5"  # 연속 성공 시 증가량
+                config["RateLimit"]["DecreaseFactor"] = "0.5"  # 429/5xx 시 감소 배율
+                config["RateLimit"]["SuccessThreshold"] = "10"  # 증가에 필요한 연속 성공 수
+                config["RateLimit"]["DecreaseCooldown"] = "1"  # 감소 후 다시 감소하지 않는 시간(초)
+
+                config["Cache"] = {}  # 웹툰 정보(info / list API) 캐시 설정 섹션
+                config["Cache"]["Enabled"] = "true"
+                config["Cache"]["Path"] = "./cache"
+                config["Cache"]["TTLSeconds"] = "3600"  # 재검증 없이 캐시를 사용할 시간(초)
+                config["Cache"]["Offline"] = "false"  # true 면 네트워크 없이 캐시만 사용
+
+                config["Batch"] = {}  # 여러 웹툰 일괄 다운로드 설정 섹션
+                # 동시에 진행할 웹툰 수 (전체 동시 요청 수는 [Download] MaxConcurrent 를 웹툰끼리 나눠 씀)
+                config["Batch"]["MaxActiveTitles"] = "3"
+
+                config["Merge"] = {}  # 이미지 병합 / HTML 생성 설정 섹션
+                # 동시에 병합할 에피소드 수 (0 이면 CPU 코어 수)
+                config["Merge"]["Workers"] = "0"
+                # 결과 이미지 하나의 최대 높이(px), 넘으면 output_001.png ... 로 분할 (0 이면 분할 안 함)
+                config["Merge"]["MaxHeight"] = "0"
+                # 같은 너비 / 같은 테이블의 JPEG 는 디코딩 없이 output.jpg 로 이어붙이기 (안 되면 PNG 병합)
+                config["Merge"]["LosslessJpeg"] = "false"
+
+                config["Metrics"] = {}  # 단계별 요청 수 / 지연 시간 / 처리량 기록 설정 섹션
+                config["Metrics"]["Enabled"] = "false"
+                config["Metrics"]["JsonPath"] = "./metrics.json"  # 실행 결과 요약 (JSON)
+                # Prometheus node_exporter textfile collector 가 읽을 수 있는 형식
+                config["Metrics"]["PrometheusPath"] = "./nwebtoon.prom"
+
+                config["Progress"] = {}  # 다운로드 진행 상황 표시 설정 섹션
+                # live : 진행 막대 표시 / quiet : 진행 막대 없이 시작 / 결과 메시지만 출력
+                config["Progress"]["Mode"] = "live"
+                # 진행 막대를 다시 그리는 최대 횟수 (초당)
+                config["Progress"]["RefreshPerSecond"] = "4"
 
                 # DEFAULT 섹션은 기본적으로 생성되어 있어 생성없이 쓸 수 있다
                 config["DEFAULT"]["DownloadPath"] = "./Webtoon_Download"
@@ -55,7 +120,103 @@ class Setting:
             # 다운로드 관련 설정값 읽기
             self.__batch_size: int = int(config["Download"]["BatchSize"])
             self.__max_concurrent: int = int(config["Download"]["MaxConcurrent"])
-            self.__delay_seconds: float = float(config["Download"]["DelaySeconds"])
+            self.__verify_checksum: bool = config.getboolean(
+                "Download", "VerifyChecksum", fallback=False
+            )
+            self.__output_mode: OutputMode = OutputMode(
+                config.get("Download", "OutputMode", fallback="files").lower()
+            )
+            self.__strip_memory_mb: int = config.getint(
+                "Download", "StripMemoryMB", fallback=64
+            )
+            self.__deduplicate: bool = config.getboolean(
+                "Download", "Deduplicate", fallback=False
+            )
+
+            # 네트워크 관련 설정값 읽기
+            # (이전 버전에서 생성된 ini 파일에는 섹션이 없을 수 있으므로 기본값 사용)
+            self.__connection_limit: int = config.getint(
+                "Network", "ConnectionLimit", fallback=100
+            )
+            self.__limit_per_host: int = config.getint(
+                "Network", "LimitPerHost", fallback=20
+            )
+            self.__dns_cache_seconds: int = config.getint(
+                "Network", "DnsCacheSeconds", fallback=300
+            )
+            self.__keepalive_seconds: float = config.getfloat(
+                "Network", "KeepAliveSeconds", fallback=30
+            )
+            self.__base_url: str = config.get(
+                "Network", "BaseUrl", fallback="https://comic.naver.com"
+            ).rstrip("/")
+            self.__list_concurrency: int = config.getint(
+                "Network", "ListConcurrency", fallback=4
+            )
+
+            # 요청 속도 제한 관련 설정값 읽기
+            self.__initial_rate: float = config.getfloat(
+                "RateLimit", "InitialRate", fallback=5
+            )
+            self.__min_rate: float = config.getfloat(
+                "RateLimit", "MinRate", fallback=0.5
+            )
+            self.__max_rate: float = config.getfloat("RateLimit", "MaxRate", fallback=20)
+            self.__increase_step: float = config.getfloat(
+                "RateLimit", "IncreaseStep", fallback=0.5
+            )
+            self.__decrease_factor: float = config.getfloat(
+                "RateLimit", "DecreaseFactor", fallback=0.5
+            )
+            self.__success_threshold: int = config.getint(
+                "RateLimit", "SuccessThreshold", fallback=10
+            )
+            self.__decrease_cooldown: float = config.getfloat(
+                "RateLimit", "DecreaseCooldown", fallback=1
+            )
+
+            # 웹툰 정보 캐시 관련 설정값 읽기
+            self.__cache_enabled: bool = config.getboolean(
+                "Cache", "Enabled", fallback=True
+            )
+            self.__cache_path: str = config.get("Cache", "Path", fallback="./cache")
+            self.__cache_ttl_seconds: float = config.getfloat(
+                "Cache", "TTLSeconds", fallback=3600
+            )
+            self.__offline: bool = config.getboolean("Cache", "Offline", fallback=False)
+
+            # 일괄 다운로드 관련 설정값 읽기
+            self.__batch_max_active_titles: int = config.getint(
+                "Batch", "MaxActiveTitles", fallback=3
+            )
+
+            # 이미지 병합 관련 설정값 읽기
+            self.__merge_workers: int = config.getint("Merge", "Workers", fallback=0)
+            self.__merge_max_height: int = config.getint(
+                "Merge", "MaxHeight", fallback=0
+            )
+            self.__merge_lossless_jpeg: bool = config.getboolean(
+                "Merge", "LosslessJpeg", fallback=False
+            )
+
+            # 단계별 측정값 기록 관련 설정값 읽기
+            self.__metrics_enabled: bool = config.getboolean(
+                "Metrics", "Enabled", fallback=False
+            )
+            self.__metrics_json_path: str = config.get(
+                "Metrics", "JsonPath", fallback="./metrics.json"
+            )
+            self.__metrics_prometheus_path: str = config.get(
+                "Metrics", "PrometheusPath", fallback="./nwebtoon.prom"
+            )
+
+            # 진행 상황 표시 관련 설정값 읽기
+            self.__progress_quiet: bool = (
+                config.get("Progress", "Mode", fallback="live").lower() == "quiet"
+            )
+            self.__progress_refresh_per_second: float = config.getfloat(
+                "Progress", "RefreshPerSecond", fallback=4
+            )
 
         except Exception as e:
             print(e)
@@ -89,8 +250,124 @@ class Setting:
         return self.__max_concurrent
 
     @property
-    def delay_seconds(self) -> float:
-        return self.__delay_seconds
+    def verify_checksum(self) -> bool:
+        return self.__verify_checksum
+
+    @property
+    def output_mode(self) -> OutputMode:
+        return self.__output_mode
+
+    @property
+    def strip_memory_mb(self) -> int:
+        return self.__strip_memory_mb
+
+    @property
+    def deduplicate(self) -> bool:
+        return self.__deduplicate
+
+    @property
+    def connection_limit(self) -> int:
+        return self.__connection_limit
+
+    @property
+    def limit_per_host(self) -> int:
+        return self.__limit_per_host
+
+    @property
+    def dns_cache_seconds(self) -> int:
+        return self.__dns_cache_seconds
+
+    @property
+    def keepalive_seconds(self) -> float:
+        return self.__keepalive_seconds
+
+    @property
+    def base_url(self) -> str:
+        return self.__base_url
+
+    @property
+    def list_concurrency(self) -> int:
+        return self.__list_concurrency
+
+    @property
+    def initial_rate(self) -> float:
+        return self.__initial_rate
+
+    @property
+    def min_rate(self) -> float:
+        return self.__min_rate
+
+    @property
+    def max_rate(self) -> float:
+        return self.__max_rate
+
+    @property
+    def increase_step(self) -> float:
+        return self.__increase_step
+
+    @property
+    def decrease_factor(self) -> float:
+        return self.__decrease_factor
+
+    @property
+    def success_threshold(self) -> int:
+        return self.__success_threshold
+
+    @property
+    def decrease_cooldown(self) -> float:
+        return self.__decrease_cooldown
+
+    @property
+    def cache_enabled(self) -> bool:
+        return self.__cache_enabled
+
+    @property
+    def cache_path(self) -> str:
+        return self.__cache_path
+
+    @property
+    def cache_ttl_seconds(self) -> float:
+        return self.__cache_ttl_seconds
+
+    @property
+    def offline(self) -> bool:
+        return self.__offline
+
+    @property
+    def batch_max_active_titles(self) -> int:
+        return self.__batch_max_active_titles
+
+    @property
+    def merge_workers(self) -> int:
+        return self.__merge_workers
+
+    @property
+    def merge_max_height(self) -> int:
+        return self.__merge_max_height
+
+    @property
+    def merge_lossless_jpeg(self) -> bool:
+        return self.__merge_lossless_jpeg
+
+    @property
+    def metrics_enabled(self) -> bool:
+        return self.__metrics_enabled
+
+    @property
+    def metrics_json_path(self) -> str:
+        return self.__metrics_json_path
+
+    @property
+    def metrics_prometheus_path(self) -> str:
+        return self.__metrics_prometheus_path
+
+    @property
+    def progress_quiet(self) -> bool:
+        return self.__progress_quiet
+
+    @property
+    def progress_refresh_per_second(self) -> float:
+        return self.__progress_refresh_per_second
 
 
 if __name__ == "__main__":
@@ -1,9 +1,23 @@
 import asyncio
-import aiohttp
+import random
 import sys
 import os
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Set,
+    Tuple,
+    Optional,
+    TypeVar,
+)
+from contextlib import aclosing
+from dataclasses import dataclass, field
+
+import aiohttp
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 sys.path.append(
@@ -11,11 +25,16 @@ sys.path.append(
 )
 
 # 기존 pydantic 타입 정의 import
-from module.headers import headers
+from module.progress import ProgressReporter
+from module.settings import Setting
+from module.webtoon.metadata_cache import MetadataCache
+from module.webtoon.session import HttpSession
 from type.api.article_list import NWebtoonArticleListData
 from type.api.comic_info import NWebtoonMainData, WebtoonCode
 from type.api.webtoon_type import WebtoonType, to_webtoon_type
 
+T = TypeVar("T")
+
 
 @dataclass
 class EpisodeInfo:
@@ -39,6 +58,136 @@ class WebtoonMetadata:
     total_count: int = 0
     page_size: int = 0
     total_pages: int = 0
+    # 메타데이터를 가져오면서 받은 list API 첫 페이지 (descending 이면 최신화 페이지)
+    first_page: List[EpisodeInfo] = field(default_factory=list)
+    descending: bool = False
+
+
+class EpisodeIndex:
+    """
+    에피소드 위치(no 오름차순, 0부터) -> 에피소드 정보를 필요한 list API 페이지만 요청해서 채우는 지연 색인
+
+    list API 의 오름차순 p 페이지에는 (p-1)*page_size ~ p*page_size-1 번째 에피소드가 들어있으므로
+    화수 범위를 페이지 범위로 바꿔 그 페이지만 요청한다. (1,200화 웹툰의 1~5화는 첫 페이지 하나만 요청)
+    한 번 받은 에피소드는 기억해 두고 다시 요청하지 않는다.
+
+    이벤트 루프 하나에서 한 번에 하나의 코루틴만 사용한다고 가정하므로 잠금은 사용하지 않는다.
+    """
+
+    def __init__(
+        self,
+        total_count: int,
+        page_size: int,
+        fetch_pages: Callable[[List[int]], AsyncIterator[List[EpisodeInfo]]],
+    ) -> None:
+        """
+        Args:
+            total_count: 전체 에피소드 수
+            page_size: list API 한 페이지의 에피소드 수
+            fetch_pages: 페이지 번호 리스트를 받아 페이지별 에피소드 리스트를 순서대로 돌려주는 함수
+        """
+        self.__total_count = total_count
+        self.__page_size = max(page_size, 1)
+        self.__fetch_pages = fetch_pages
+        self.__episodes: Dict[int, EpisodeInfo] = {}  # 위치 -> 에피소드 정보
+        self.__lock_boundary: Optional[int] = None
+
+    def page_of(self, position: int) -> int:
+        """position 번째(0부터) 에피소드가 들어있는 오름차순 페이지 번호"""
+        return position // self.__page_size + 1
+
+    def add(self, start: int, episodes: List[EpisodeInfo]) -> None:
+        """start 위치부터 이어지는 에피소드들을 색인에 넣는다. (이미 받은 페이지 / 전체 목록 재사용)"""
+        for offset, episode in enumerate(episodes):
+            self.__episodes[start + offset] = episode
+
+    async def __ensure(self, start: int, stop: int) -> None:
+        """start ~ stop-1 위치 중 아직 없는 에피소드가 들어있는 페이지만 요청한다."""
+        missing_pages = [
+            page
+            for page in range(self.page_of(start), self.page_of(stop - 1) + 1)
+            if any(
+                position not in self.__episodes
+                for position in range(
+                    max(start, (page - 1) * self.__page_size),
+                    min(stop, page * self.__page_size),
+                )
+            )
+        ]
+        if not missing_pages:
+            return
+
+        async with aclosing(self.__fetch_pages(missing_pages)) as pages:
+            page_iter = iter(missing_pages)
+            async for episodes in pages:
+                self.add((next(page_iter) - 1) * self.__page_size, episodes)
+
+    async def get_range(self, start: int, stop: int) -> List[EpisodeInfo]:
+        """
+        start ~ stop-1 위치(0부터)의 에피소드를 가져오는 함수
+
+        Returns:
+            no 오름차순 에피소드 리스트
+        """
+        start, stop = max(start, 0), min(stop, self.__total_count)
+        if start >= stop:
+            return []
+        await self.__ensure(start, stop)
+
+        episodes = []
+        for position in range(start, stop):
+            episode = self.__episodes.get(position)
+            if episode is None:
+                # 목록을 받는 사이에 에피소드가 삭제된 경우 등
+                raise Exception(f"{position + 1}번째 에피소드 정보를 찾을 수 없습니다.")
+            episodes.append(episode)
+        return episodes
+
+    async def __is_locked(self, position: int) -> bool:
+        return (await self.get_range(position, position + 1))[0].thumbnail_lock
+
+    async def find_lock_boundary(self) -> int:
+        """
+        첫 번째 잠금(thumbnail_lock) 에피소드의 위치 (= 앞에서부터 다운로드 가능한 에피소드 수)
+
+        잠금 에피소드(미리보기 / 유료)는 최신화 쪽에 몰려 있으므로 전체 목록을 훑지 않고
+        마지막 에피소드부터 1, 2, 4 ... 화씩 앞으로 가며 잠기지 않은 에피소드를 찾은 뒤
+        그 사이를 이진 탐색한다. 이미 받은 페이지 안의 탐색은 요청이 없으므로
+        잠금이 최신 페이지 안에서 끝나면 추가 요청 없이 끝난다.
+        잠금 에피소드 뒤에 다시 잠기지 않은 에피소드가 있는 경우는 고려하지 않는다.
+
+        Returns:
+            다운로드 가능한 에피소드 수
+        """
+        if self.__lock_boundary is not None:
+            return self.__lock_boundary
+
+        total = self.__total_count
+        if total == 0 or not await self.__is_locked(total - 1):
+            self.__lock_boundary = total
+            return total
+
+        # lo: 잠기지 않은 위치 (-1 이면 아직 모름), hi: 잠긴 위치
+        lo, hi = -1, total - 1
+        step = 1
+        while hi > 0:
+            probe = max(hi - step, 0)
+            if await self.__is_locked(probe):
+                hi = probe
+                step *= 2
+            else:
+                lo = probe
+                break
+
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if await self.__is_locked(mid):
+                hi = mid
+            else:
+                lo = mid
+
+        self.__lock_boundary = hi
+        return hi
 
 
 class WebtoonAnalyzer:
@@ -49,18 +198,39 @@ class WebtoonAnalyzer:
         title_id: int,
         nid_aut: Optional[str] = None,
         nid_ses: Optional[str] = None,
+        http: Optional[HttpSession] = None,
+        reporter: Optional[ProgressReporter] = None,
     ) -> None:
         self.__title_id = title_id
 
+        # 공유 HTTP 세션 (없으면 분석하는 동안만 사용할 세션을 직접 생성)
+        self.__http = http
+
+        # 재시도 같은 진행 상황 이벤트를 받을 객체 (기본값은 아무것도 하지 않음)
+        self.__reporter = reporter if reporter is not None else ProgressReporter()
+
+        settings = Setting()
+
         # API 요청에 사용할 URL
-        self.__info_url = "https://comic.naver.com/api/article/list/info"
-        self.__list_url = "https://comic.naver.com/api/article/list"
+        self.__info_url = f"{settings.base_url}/api/article/list/info"
+        self.__list_url = f"{settings.base_url}/api/article/list"
+
+        # 에피소드 목록 페이지를 동시에 요청할 수
+        self.__list_concurrency = max(settings.list_concurrency, 1)
 
         # 성인 웹툰 접근용 쿠키 설정
         self.__cookies = {}
         if nid_aut and nid_ses:
             self.__cookies = {"NID_AUT": nid_aut, "NID_SES": nid_ses}
 
+        # info / list API 응답 디스크 캐시 (TTL + 조건부 재검증 + 오프라인 모드)
+        self.__cache = MetadataCache(
+            settings.cache_path,
+            settings.cache_ttl_seconds,
+            offline=settings.offline,
+            enabled=settings.cache_enabled,
+        )
+
         # 멤버 변수 선언 - 실제 데이터는 비동기 함수에서 설정
         self.__title_name = ""
         self.__total_count = 0
@@ -73,6 +243,11 @@ class WebtoonAnalyzer:
         self.__downloadable_episodes: List[EpisodeInfo] = []
         self.__full_episodes: List[EpisodeInfo] = []
 
+        # 화수 범위에 필요한 list API 페이지만 요청하는 지연 색인 (list API 접근이 불가하면 None)
+        self.__index: Optional[EpisodeIndex] = None
+        # 다운로드 가능한 화수를 이미 구했는지 여부 (전체 목록을 받지 않았으면 처음 필요할 때 탐색)
+        self.__downloadable_resolved = False
+
     """
     self의 경우 생성된 객체(instance) 를 가르키므로,
     생성자 순서에선 생성된 객체가 없이 설계도 (class) 만 있어서
@@ -84,31 +259,80 @@ class WebtoonAnalyzer:
 
     @classmethod
     async def create(
-        cls, title_id: int, nid_aut: Optional[str] = None, nid_ses: Optional[str] = None
+        cls,
+        title_id: int,
+        nid_aut: Optional[str] = None,
+        nid_ses: Optional[str] = None,
+        http: Optional[HttpSession] = None,
+        load_episodes: bool = True,
+        reporter: Optional[ProgressReporter] = None,
     ) -> "WebtoonAnalyzer":
-        """비동기 팩토리 메서드로 WebtoonAnalyzer 인스턴스를 생성하고 초기화"""
-        instance = cls(title_id, nid_aut, nid_ses)  # 여기서 일반생성자 __init__ 실행
-        await instance.__initialize()  # 비동기 함수 실행
+        """
+        비동기 팩토리 메서드로 WebtoonAnalyzer 인스턴스를 생성하고 초기화
+
+        http 에 공유 세션을 넘기면 분석에 사용한 커넥션을 다운로드 단계에서도 재사용한다.
+        load_episodes 가 False 면 메타데이터만 가져오고 전체 에피소드 목록은 요청하지 않는다.
+        (동기화 모드에서 fetch_new_episodes 로 최신 페이지만 요청할 때 사용)
+        reporter 를 넘기면 info / list API 재시도를 retry 이벤트로 알린다.
+        """
+        instance = cls(
+            title_id, nid_aut, nid_ses, http, reporter
+        )  # 여기서 일반생성자 __init__ 실행
+        await instance.__initialize(load_episodes)  # 비동기 함수 실행
         return instance
 
-    async def __initialize(self) -> None:
+    async def __initialize(self, load_episodes: bool = True) -> None:
         """웹툰 메타데이터를 가져와 멤버 변수 초기화하는 내부 비동기 함수(메서드)"""
+        await self.__with_http(lambda: self.__analyze(load_episodes))
+
+    async def __with_http(self, func: Callable[[], Awaitable[T]]) -> T:
+        """공유 세션이 없으면 func 를 실행하는 동안만 사용할 세션을 만들어 실행한다."""
+        if self.__http is None:
+            async with HttpSession() as http:
+                self.__http = http
+                try:
+                    return await func()
+                finally:
+                    self.__http = None
+
+        await self.__http.open()
+        return await func()
+
+    async def __analyze(self, load_episodes: bool = True) -> None:
+        """메타데이터와 에피소드 목록을 가져와 멤버 변수에 저장하는 함수"""
 
         # 웹툰 메타데이터 가져오기
-        metadata: WebtoonMetadata = await self.__fetch_webtoon_metadata()
+        # (에피소드 목록을 받지 않는 경우 최신화부터 정렬된 첫 페이지를 요청해 fetch_new_episodes 와 캐시를 공유)
+        metadata: WebtoonMetadata = await self.__fetch_webtoon_metadata(
+            descending=not load_episodes
+        )
 
         # 에피소드 정보 가져오기 기준을 '성인 여부'가 아니라 'list API가 반환한 페이지 수'로 판단
         # (성인 웹툰이라도 쿠키가 있으면 list API 접근 가능하므로 total_pages>0이면 수집 시도)
+        index: Optional[EpisodeIndex] = None
         if metadata.total_pages and metadata.total_pages > 0:
+            index = EpisodeIndex(
+                metadata.total_count,
+                metadata.page_size,
+                lambda pages: self.__iter_list_pages(pages),
+            )
+            # 메타데이터와 함께 받은 첫 페이지는 다시 요청하지 않는다
+            if metadata.descending:
+                index.add(metadata.total_count - len(metadata.first_page), metadata.first_page)
+            else:
+                index.add(0, metadata.first_page)
+
+        if load_episodes and index is not None:
             # 모든 에피소드 정보 가져오기
             all_episodes = await self.__get_all_episodes(metadata)
+            index.add(0, all_episodes)
 
             # 다운로드 가능한 에피소드 찾기
             downloadable_count, downloadable_episodes = (
                 self.__find_downloadable_episodes(all_episodes)
             )
         else:
-            # list API 접근이 불가(성인+미인증 등)한 경우 빈 값으로 설정
+            # list API 접근이 불가(성인+미인증 등)하거나 목록을 요청하지 않은 경우 빈 값으로 설정
             all_episodes = []
             downloadable_count = 0
             downloadable_episodes = []
@@ -125,11 +349,16 @@ class WebtoonAnalyzer:
         self.__downloadable_episodes = downloadable_episodes
         self.__full_episodes = all_episodes
         self.__title_id = metadata.title_id
+        self.__index = index
+        self.__downloadable_resolved = load_episodes or index is None
 
-    async def __fetch_webtoon_metadata(self) -> WebtoonMetadata:
+    async def __fetch_webtoon_metadata(self, descending: bool = False) -> WebtoonMetadata:
         """
         웹툰 API 데이터를 활용해 메타데이터를 가져오는 함수
 
+        Args:
+            descending: True 면 list API 첫 페이지를 최신화부터 정렬해서 요청
+
         Returns:
             웹툰 메타데이터 (전체 화수, 페이지 크기, 전체 페이지 수)
         """
@@ -138,89 +367,277 @@ class WebtoonAnalyzer:
         info_url = f"{self.__info_url}?titleId={self.__title_id}"
 
         # list api 첫 번째 페이지 요청을 활용해 전체 화수, 페이지 크기, 전체 페이지 수를 얻는다.
-        list_url = f"{self.__list_url}?titleId={self.__title_id}&page=1"
-
-        async with aiohttp.ClientSession(
-            headers=headers, cookies=self.__cookies
-        ) as session:
-            # info API 요청
-            async with session.get(info_url) as info_response:
-                if info_response.status != 200:
-                    raise Exception(f"Info API 요청 실패: {info_response.status}")
-
-                info_data = await info_response.json()
-                comic_info = NWebtoonMainData.from_dict(info_data)
-
-                # 웹툰 설명 가져오기
-                synopsis: str = comic_info.synopsis
-
-                # 일반 웹툰 / 베스트도전 / 도전만화 구분 (API 코드 -> 내부 문자열 enum 매핑)
-                webtoon_code: WebtoonCode = comic_info.webtoonLevelCode
-                webtoon_type: WebtoonType = to_webtoon_type(webtoon_code)
-
-                # 성인 웹툰 여부 확인 (age.type이 RATE_18이면 성인 웹툰)
-                is_adult: bool = comic_info.age.type == "RATE_18"
-
-                # 제목 가져오기
-                title_name: str = comic_info.titleName
-
-            # list API 요청
-            # 일반 웹툰이거나, 성인 웹툰이더라도 인증 쿠키가 있으면 시도
-            if (not is_adult) or (is_adult and self.__cookies):
-                async with session.get(list_url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        # pydantic 모델을 사용하여 데이터 검증
-                        article_list_data = NWebtoonArticleListData.from_dict(data)
-
-                        # API 응답에서 실제 값들을 가져옴
-                        total_count = article_list_data.totalCount
-                        page_size = article_list_data.pageInfo.pageSize
-                        total_pages = article_list_data.pageInfo.totalPages
-                    else:
-                        # 인증이 있어도 실패할 수 있으므로 0으로 설정 (다운로드 비활성)
-                        total_count = 0
-                        page_size = 0
-                        total_pages = 0
+        list_url = self.__get_list_page_url(1, descending)
+
+        # info API 요청 (캐시에 있으면 재사용)
+        info_status, info_data = await self.__request_json(info_url)
+        if info_status != 200:
+            raise Exception(f"Info API 요청 실패: {info_status}")
+
+        comic_info = NWebtoonMainData.from_dict(info_data)
+
+        # 웹툰 설명 가져오기
+        synopsis: str = comic_info.synopsis
+
+        # 일반 웹툰 / 베스트도전 / 도전만화 구분 (API 코드 -> 내부 문자열 enum 매핑)
+        webtoon_code: WebtoonCode = comic_info.webtoonLevelCode
+        webtoon_type: WebtoonType = to_webtoon_type(webtoon_code)
+
+        # 성인 웹툰 여부 확인 (age.type이 RATE_18이면 성인 웹툰)
+        is_adult: bool = comic_info.age.type == "RATE_18"
+
+        # 제목 가져오기
+        title_name: str = comic_info.titleName
+
+        # list API 요청
+        # 일반 웹툰이거나, 성인 웹툰이더라도 인증 쿠키가 있으면 시도
+        if (not is_adult) or (is_adult and self.__cookies):
+            status, data = await self.__request_json(list_url)
+            if status == 200:
+                # pydantic 모델을 사용하여 데이터 검증
+                article_list_data = NWebtoonArticleListData.from_dict(data)
+
+                # API 응답에서 실제 값들을 가져옴
+                total_count = article_list_data.totalCount
+                page_size = article_list_data.pageInfo.pageSize
+                total_pages = article_list_data.pageInfo.totalPages
+                first_page = self.__to_episode_infos(article_list_data)
             else:
-                # 성인 웹툰 + 미인증 등으로 list API 접근 불가
+                # 인증이 있어도 실패할 수 있으므로 0으로 설정 (다운로드 비활성)
                 total_count = 0
                 page_size = 0
                 total_pages = 0
+                first_page = []
+        else:
+            # 성인 웹툰 + 미인증 등으로 list API 접근 불가
+            total_count = 0
+            page_size = 0
+            total_pages = 0
+            first_page = []
+
+        return WebtoonMetadata(
+            title_id=self.__title_id,
+            title_name=title_name,
+            synopsis=synopsis,
+            is_adult=is_adult,
+            webtoon_type=webtoon_type,
+            total_count=total_count,
+            page_size=page_size,
+            total_pages=total_pages,
+            first_page=first_page,
+            descending=descending,
+        )
+
+    async def __request_json(self, url: str, revalidate: bool = False) -> Tuple[int, Any]:
+        """
+        info / list API 를 요청하고, 429 / 5xx / 네트워크 오류면 지수 백오프로 재시도하는 함수
+
+        429 응답의 Retry-After 는 __request_json_once 에서 공유 속도 제한기에 반영되므로
+        다음 시도의 limiter.acquire() 가 그 시각까지 기다린다. (같은 호스트의 다른 요청도 함께 대기)
 
-            return WebtoonMetadata(
+        Args:
+            url: 요청할 API URL
+            revalidate: True 면 TTL 안의 캐시라도 조건부 요청으로 변경 여부를 확인
+
+        Returns:
+            (상태 코드, 응답 JSON) - 재시도 한도를 넘으면 마지막 시도의 결과 (네트워크 오류면 예외 발생)
+        """
+        max_retries = 3
+        backoff_base = 1.0  # 1 -> 2 -> 4 초
+
+        for attempt in range(max_retries):
+            try:
+                status, data = await self.__request_json_once(url, revalidate)
+                if status != 429 and status < 500:
+                    return status, data
+                reason = f"HTTP {status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # 응답 없이 실패한 경우에도 속도를 낮춘다
+                self.__http.limiter.feedback(url, None)
+                reason = str(e) or e.__class__.__name__
+
+            # 0~20% 지터 추가로 동시에 실패한 페이지들의 재시도 충돌 방지
+            delay = backoff_base * (2**attempt) * (1 + random.uniform(0, 0.2))
+            # 화면에 출력하지 않고 측정값과 retry 이벤트로만 알린다 (다운로더와 같은 형식)
+            self.__http.metrics.record_retry(url, phase="analyze")
+            self.__reporter.emit(
+                "retry",
                 title_id=self.__title_id,
-                title_name=title_name,
-                synopsis=synopsis,
-                is_adult=is_adult,
-                webtoon_type=webtoon_type,
-                total_count=total_count,
-                page_size=page_size,
-                total_pages=total_pages,
+                no=None,
+                url=url,
+                reason=reason,
+                attempt=attempt + 1,
+                max_retries=max_retries,
+                delay=round(delay, 2),
             )
+            await asyncio.sleep(delay)
 
-    async def __get_episode_list_page(self, page: int) -> NWebtoonArticleListData:
+        # 마지막 시도는 결과(또는 예외)를 그대로 돌려준다
+        return await self.__request_json_once(url, revalidate)
+
+    async def __request_json_once(self, url: str, revalidate: bool = False) -> Tuple[int, Any]:
+        """
+        info / list API 를 캐시를 거쳐 한 번 요청하는 함수
+
+        1. TTL 안의 캐시(또는 오프라인 모드)면 요청 없이 캐시를 반환한다. (revalidate 면 건너뜀)
+        2. TTL 이 지났으면 ETag / Last-Modified 로 조건부 요청을 보내고 304 면 캐시를 반환한다.
+        3. 200 이면 새 응답을 캐시에 저장하고 반환한다.
+
+        Args:
+            url: 요청할 API URL
+            revalidate: True 면 TTL 안의 캐시라도 조건부 요청으로 변경 여부를 확인
+
+        Returns:
+            (상태 코드, 응답 JSON) - 캐시를 사용한 경우 상태 코드는 200, 실패 시 JSON 은 None
+        """
+        authenticated = bool(self.__cookies)
+        entry = self.__cache.load(url, authenticated)
+
+        if self.__cache.offline:
+            if entry is None:
+                raise Exception(f"오프라인 모드이지만 캐시가 없습니다: {url}")
+            return 200, entry.data
+
+        if not revalidate and entry is not None and entry.is_fresh(self.__cache.ttl_seconds):
+            return 200, entry.data
+
+        # 공유 세션의 커넥션을 재사용하고, 상세 페이지 요청과 같은 호스트 속도 제한을 공유한다
+        session = self.__http.session
+        limiter = self.__http.limiter
+        conditional_headers = entry.conditional_headers() if entry else {}
+
+        # 여러 웹툰을 동시에 받는 경우 전체 동시 요청 한도를 웹툰별로 공정하게 나눠 쓴다
+        with self.__http.metrics.phase("analyze"):
+            await limiter.acquire(url)
+            async with self.__http.slot(self.__title_id), session.get(
+                url, headers=conditional_headers, cookies=self.__cookies
+            ) as response:
+                limiter.feedback(url, response.status, response.headers.get("Retry-After"))
+
+                if response.status == 304 and entry is not None:
+                    # 변경 없음 -> 저장된 응답을 재사용하고 확인 시각만 갱신
+                    self.__cache.touch(entry, authenticated)
+                    return 200, entry.data
+
+                if response.status != 200:
+                    return response.status, None
+
+                data = await response.json()
+                self.__http.metrics.add_bytes(
+                    response.url.host or "", response.content.total_bytes
+                )
+                self.__cache.store(
+                    url,
+                    authenticated,
+                    data,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+                return 200, data
+
+    def __get_list_page_url(self, page: int, descending: bool = False) -> str:
+        """list API 페이지 URL (descending 이면 최신화부터 정렬)"""
+        url = f"{self.__list_url}?titleId={self.__title_id}&page={page}"
+        if descending:
+            url += "&sort=DESC"
+        return url
+
+    async def __get_episode_list_page(
+        self, page: int, descending: bool = False, revalidate: bool = False
+    ) -> NWebtoonArticleListData:
         """
         특정 페이지의 에피소드 리스트를 가져오는 함수
 
         Args:
             page: 페이지 번호
+            descending: True 면 최신화부터 정렬된 페이지를 요청
+            revalidate: True 면 TTL 안의 캐시라도 조건부 요청으로 확인
 
         Returns:
             해당 페이지의 pydantic 모델 데이터
         """
-        url = f"{self.__list_url}?titleId={self.__title_id}&page={page}"
+        url = self.__get_list_page_url(page, descending)
+
+        status, data = await self.__request_json(url, revalidate)
+        if status == 200:
+            # pydantic 모델을 사용하여 데이터 검증 및 변환
+            return NWebtoonArticleListData.from_dict(data)
+        else:
+            raise Exception(f"페이지 {page} 요청 실패: {status}")
+
+    async def __iter_list_pages(
+        self, pages: List[int], descending: bool = False, revalidate: bool = False
+    ) -> AsyncIterator[List[EpisodeInfo]]:
+        """
+        list API 페이지들을 최대 ListConcurrency 개씩 동시에 요청하고, pages 순서대로 돌려주는 함수
 
-        async with aiohttp.ClientSession(
-            headers=headers, cookies=self.__cookies
-        ) as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    # pydantic 모델을 사용하여 데이터 검증 및 변환
-                    return NWebtoonArticleListData.from_dict(data)
+        작업자는 pages 순서대로 페이지를 가져가므로 앞 페이지가 먼저 도착하는 경향이 있고,
+        앞 페이지가 도착하는 즉시 돌려주므로 다음 단계가 마지막 페이지를 기다리지 않아도 된다.
+        실패한 페이지는 __request_json 이 그 페이지만 다시 요청하고, 성공한 페이지는 캐시에 저장되므로
+        재시도 한도를 넘어 실패하더라도 다시 실행하면 남은 페이지만 요청한다.
+
+        Args:
+            pages: 요청할 페이지 번호 리스트
+            descending: True 면 최신화부터 정렬된 페이지를 요청
+            revalidate: True 면 TTL 안의 캐시라도 조건부 요청으로 확인
+
+        Returns:
+            페이지 하나의 에피소드 리스트를 차례로 돌려주는 비동기 제너레이터
+            (재시도 한도를 넘어 실패한 페이지가 있으면 그 앞 페이지까지 돌려준 뒤 예외 발생)
+        """
+        loop = asyncio.get_running_loop()
+        results = {page: loop.create_future() for page in pages}
+        page_iter = iter(pages)
+
+        async def worker() -> None:
+            # 이벤트 루프는 단일 스레드이므로 next() 호출 사이에 경쟁 상태가 없다
+            for page in page_iter:
+                try:
+                    response = await self.__get_episode_list_page(
+                        page, descending, revalidate
+                    )
+                except Exception as e:
+                    results[page].set_exception(e)
                 else:
-                    raise Exception(f"페이지 {page} 요청 실패: {response.status}")
+                    results[page].set_result(self.__to_episode_infos(response))
+
+        worker_count = max(min(self.__list_concurrency, len(pages)), 1)
+        workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        try:
+            for page in pages:
+                yield await results[page]
+        finally:
+            # 중간에 실패하거나 소비자가 멈추면 남은 요청을 취소한다
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            # 돌려주지 못한 페이지의 예외는 확인한 것으로 처리 (미확인 예외 경고 방지)
+            for future in results.values():
+                if future.done() and not future.cancelled():
+                    future.exception()
+
+    @staticmethod
+    def __to_episode_infos(response: NWebtoonArticleListData) -> List[EpisodeInfo]:
+        """list API 페이지 응답을 no 오름차순 에피소드 정보 리스트로 변환"""
+        episodes = [
+            EpisodeInfo(
+                no=episode.no,
+                subtitle=episode.subtitle,
+                thumbnail_lock=episode.thumbnailLock,
+            )
+            for episode in response.articleList
+        ]
+        episodes.sort(key=lambda x: x.no)
+        return episodes
+
+    async def __iter_all_episodes(self, total_pages: int) -> AsyncIterator[EpisodeInfo]:
+        """1 ~ total_pages 페이지의 에피소드를 페이지가 도착하는 대로 no 오름차순으로 돌려준다."""
+        # 소비자가 중간에 멈춰도 남은 페이지 요청이 바로 취소되도록 명시적으로 닫는다
+        pages = self.__iter_list_pages(list(range(1, total_pages + 1)))
+        async with aclosing(pages):
+            async for episodes in pages:
+                for episode in episodes:
+                    yield episode
 
     async def __get_all_episodes(self, metadata: WebtoonMetadata) -> List[EpisodeInfo]:
         """
@@ -233,38 +650,120 @@ class WebtoonAnalyzer:
         if metadata.total_pages is None:
             return []
 
-        # 모든 페이지를 병렬로 요청 (no=1 ~ no=끝)
-        tasks = []
-        for page in range(1, metadata.total_pages + 1):
-            task = self.__get_episode_list_page(page)
-            tasks.append(task)
-
-        # 모든 요청을 동시에 실행
-        responses: List[NWebtoonArticleListData] = await asyncio.gather(*tasks)
-
-        # 모든 에피소드 정보를 수집
-        all_episodes: list[EpisodeInfo] = []
-
-        for response in responses:
-            # pydantic 모델의 articleList에서 에피소드 정보 추출
-            for episode in response.articleList:
-                episode_info = EpisodeInfo(
-                    no=episode.no,
-                    subtitle=episode.subtitle,
-                    thumbnail_lock=episode.thumbnailLock,
-                )
-                all_episodes.append(episode_info)
+        all_episodes = [
+            episode async for episode in self.__iter_all_episodes(metadata.total_pages)
+        ]
 
-        # no 순으로 오름차순 정렬
+        # no 순으로 오름차순 정렬 (API 가 페이지 안에서 순서를 보장하지 않는 경우 대비)
         all_episodes.sort(key=lambda x: x.no)
 
         return all_episodes
 
+    async def fetch_new_episodes(self, known_episodes: Set[int]) -> List[EpisodeInfo]:
+        """
+        이미 받은 에피소드 이후에 올라온 새 에피소드만 가져오는 함수 (동기화 모드)
+
+        list API 를 최신화부터 정렬해서 한 페이지씩 요청하고,
+        이미 받은 에피소드 중 가장 최신화에 도달하면 더 이상 요청하지 않는다.
+        (주간 업데이트라면 보통 첫 페이지 1번 요청으로 끝남)
+
+        새 에피소드를 놓치지 않도록 목록 페이지는 캐시 TTL 과 상관없이 항상 조건부 요청으로 확인하고,
+        이미 받은 에피소드가 없으면 나머지 페이지를 ListConcurrency 개씩 동시에 요청한다.
+
+        Args:
+            known_episodes: 이미 다운로드한 에피소드 번호 집합 (비어있으면 전체 에피소드)
+
+        Returns:
+            새 에피소드 중 다운로드 가능한(잠금되지 않은) 에피소드 리스트 (no 오름차순)
+        """
+        if not self.__total_pages:
+            return []
+
+        latest_known = max(known_episodes, default=0)
+
+        async def fetch() -> List[EpisodeInfo]:
+            # 첫 페이지의 전체 페이지 수를 사용한다 (메타데이터가 캐시에서 왔으면 예전 값일 수 있음)
+            response = await self.__get_episode_list_page(1, descending=True, revalidate=True)
+            total_pages = response.pageInfo.totalPages
+            new_episodes = self.__to_episode_infos(response)
+
+            if not known_episodes:
+                # 전체를 받아야 하므로 한 페이지씩 기다리지 않고 나머지 페이지를 동시에 요청
+                pages = self.__iter_list_pages(
+                    list(range(2, total_pages + 1)), descending=True, revalidate=True
+                )
+                async with aclosing(pages):
+                    async for episodes in pages:
+                        new_episodes.extend(episodes)
+                return new_episodes
+
+            page = 1
+            # 이 페이지에 이미 받은 에피소드가 있으면 이후 페이지는 모두 예전 에피소드
+            while (
+                response.articleList
+                and all(episode.no > latest_known for episode in response.articleList)
+                and page < total_pages
+            ):
+                page += 1
+                response = await self.__get_episode_list_page(
+                    page, descending=True, revalidate=True
+                )
+                new_episodes.extend(self.__to_episode_infos(response))
+            return [episode for episode in new_episodes if episode.no > latest_known]
+
+        new_episodes = await self.__with_http(fetch)
+
+        # no 순으로 오름차순 정렬 후 잠금되지 않은 에피소드만 남긴다
+        new_episodes.sort(key=lambda x: x.no)
+        _, downloadable_episodes = self.__find_downloadable_episodes(new_episodes)
+        return downloadable_episodes
+
+    async def find_downloadable_count(self) -> int:
+        """
+        다운로드 가능한 화수를 구하는 함수
+
+        전체 목록을 받은 경우 이미 구한 값을 반환하고, 메타데이터만 받은 경우
+        EpisodeIndex 로 잠금 경계가 있는 페이지만 요청해서 찾는다. (최신 페이지는 이미 받아둔 상태)
+
+        Returns:
+            다운로드 가능한 화수
+        """
+        if not self.__downloadable_resolved and self.__index is not None:
+            self.__downloadable_count = await self.__with_http(
+                self.__index.find_lock_boundary
+            )
+            self.__downloadable_resolved = True
+        return self.__downloadable_count
+
+    async def get_downloadable_episodes(self, start: int, end: int) -> List[EpisodeInfo]:
+        """
+        다운로드 가능한 에피소드 중 start ~ end 화를 가져오는 함수 (1부터 시작, 양 끝 포함)
+
+        전체 목록을 받은 경우 잘라서 반환하고, 메타데이터만 받은 경우
+        범위가 들어있는 list API 페이지만 요청한다.
+
+        Args:
+            start: 시작 화수
+            end: 끝 화수
+
+        Returns:
+            에피소드 리스트 (no 오름차순)
+        """
+        downloadable_count = await self.find_downloadable_count()
+        if start < 1 or end > downloadable_count or start > end:
+            raise ValueError(
+                f"잘못된 화수 범위입니다. (1화 ~ {downloadable_count}화 범위에서 선택해주세요.)"
+            )
+
+        if self.__downloadable_episodes:
+            return self.__downloadable_episodes[start - 1 : end]
+        return await self.__with_http(lambda: self.__index.get_range(start - 1, end))
+
     def __find_downloadable_episodes(
         self, episodes: List[EpisodeInfo]
     ) -> Tuple[int, List[EpisodeInfo]]:
         """
-        다운로드 가능한 에피소드 수를 찾는 함수
+        다운로드 가능한 에피소드 수를 찾는 함수 (전체 목록을 처음부터 훑음)
 
         Args:
             episodes: 정렬된 에피소드 리스트
@@ -289,7 +788,7 @@ class WebtoonAnalyzer:
 
     @property
     def downloadable_count(self) -> int:
-        """다운로드 가능한 화수"""
+        """다운로드 가능한 화수 (메타데이터만 받은 경우 find_downloadable_count() 호출 후 유효)"""
         return self.__downloadable_count
 
     @property
@@ -0,0 +1,295 @@
+import asyncio
+import re
+import sys
+import os
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from module.metrics import export_metrics
+from module.progress import ProgressReporter
+from module.settings import Setting
+from module.webtoon.analyzer import WebtoonAnalyzer
+from module.webtoon.downloader import WebtoonDownloader
+from module.webtoon.fair_scheduler import FairSemaphore
+from module.webtoon.session import HttpSession
+
+
+@dataclass
+class TitleJob:
+    """일괄 다운로드할 웹툰 하나의 작업"""
+
+    title_id: int
+    start: Optional[int] = None  # 시작 화수 (None 이면 다운로드 가능한 전체)
+    end: Optional[int] = None  # 끝 화수
+    sync: bool = False  # True 면 이미 받은 에피소드 이후의 새 에피소드만 다운로드
+    line: int = 0  # 작업 파일에서의 줄 번호 (오류 표시용)
+
+    @property
+    def range_text(self) -> str:
+        if self.sync:
+            return "새 에피소드"
+        if self.start is None:
+            return "전체"
+        return f"{self.start}-{self.end}"
+
+
+@dataclass
+class TitleResult:
+    """웹툰 하나의 일괄 다운로드 결과"""
+
+    job: TitleJob
+    title_name: str = ""
+    episodes: int = 0  # 다운로드를 요청한 에피소드 수
+    success: bool = False
+    elapsed: float = 0.0  # 분석부터 다운로드 완료까지 걸린 시간(초)
+    requests: int = 0  # 공정 스케줄러에서 자리를 받은 횟수 (실제로 보낸 요청 수)
+    error: Optional[str] = None
+
+
+def parse_title_id(text: str) -> int:
+    """
+    웹툰 ID 또는 URL 에서 웹툰 ID 를 꺼내는 함수
+    (일괄 / 명령줄 실행은 사람이 고를 수 없으므로 검색어는 받지 않는다)
+
+    Raises:
+        ValueError: 웹툰 ID 또는 URL 이 아닌 경우
+    """
+    match = re.search(r"titleId=(\d+)", text) or re.fullmatch(r"(\d+)", text.strip())
+    if match is None:
+        raise ValueError(f"웹툰 ID 또는 URL 이 아닙니다. ({text})")
+    return int(match.group(1))
+
+
+def parse_range(text: str) -> Tuple[int, int]:
+    """
+    "5" 또는 "1-10" 형식의 화수 범위를 (시작, 끝)으로 변환하는 함수
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    match = re.fullmatch(r"(\d+)(?:-(\d+))?", text.strip())
+    if match is None:
+        raise ValueError(f"화수 범위가 잘못되었습니다. ({text})")
+    return int(match.group(1)), int(match.group(2) or match.group(1))
+
+
+def parse_job_line(line: str, line_no: int = 0) -> Optional[TitleJob]:
+    """
+    작업 파일의 한 줄을 작업으로 변환하는 함수
+
+    형식) <웹툰 ID 또는 URL> [화수 범위 | new]
+        758037
+        758037 1-10
+        758037 new     -> 이미 받은 에피소드 이후의 새 에피소드만 (동기화)
+        https://comic.naver.com/webtoon/list?titleId=758037 5
+
+    Args:
+        line: 작업 파일의 한 줄
+        line_no: 줄 번호
+
+    Returns:
+        작업 (빈 줄이나 # 주석이면 None)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    line = line.split("#", 1)[0].strip()
+    if not line:
+        return None
+
+    parts = line.split()
+    if len(parts) > 2:
+        raise ValueError(f"{line_no}번째 줄: 형식이 잘못되었습니다. ({line})")
+
+    try:
+        job = TitleJob(title_id=parse_title_id(parts[0]), line=line_no)
+        if len(parts) == 2:
+            if parts[1].lower() == "new":
+                job.sync = True
+            else:
+                job.start, job.end = parse_range(parts[1])
+    except ValueError as e:
+        raise ValueError(f"{line_no}번째 줄: {e}") from e
+    return job
+
+
+def load_jobs(path: str) -> List[TitleJob]:
+    """작업 파일(한 줄에 웹툰 하나)을 읽어서 작업 리스트를 만든다."""
+    jobs: List[TitleJob] = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            job = parse_job_line(line, line_no)
+            if job is not None:
+                jobs.append(job)
+    return jobs
+
+
+class BatchDownloader:
+    """
+    여러 웹툰을 하나의 공유 세션과 동시 요청 한도로 함께 다운로드하는 클래스
+
+    - 모든 웹툰이 하나의 HttpSession(커넥션 풀 + 호스트별 속도 제한)을 공유한다.
+    - 분석(list API), URL 수집(상세 페이지), 이미지 다운로드 요청은 모두 하나의 FairSemaphore 를
+      거치므로, 전체 동시 요청 수는 MaxConcurrent 를 넘지 않고 웹툰별로 라운드 로빈으로 나눠 쓴다.
+      (에피소드가 수천 개인 웹툰이 있어도 작은 웹툰이 뒤로 밀리지 않는다)
+    - 동시에 진행하는 웹툰 수는 [Batch] MaxActiveTitles 로 제한한다.
+    """
+
+    def __init__(
+        self,
+        jobs: List[TitleJob],
+        nid_aut: Optional[str] = None,
+        nid_ses: Optional[str] = None,
+        settings: Optional[Setting] = None,
+        reporter: Optional[ProgressReporter] = None,
+        max_concurrent: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        max_active_titles: Optional[int] = None,
+    ) -> None:
+        self.__jobs = jobs
+        self.__nid_aut = nid_aut
+        self.__nid_ses = nid_ses
+        self.__settings = settings if settings is not None else Setting()
+        self.__reporter = reporter if reporter is not None else ProgressReporter()
+
+        # 명령줄 인자로 넘긴 값이 없으면 설정값 사용
+        self.__max_concurrent = max(
+            max_concurrent or self.__settings.max_concurrent, 1
+        )
+        self.__batch_size = batch_size
+        self.__max_active_titles = max(
+            max_active_titles or self.__settings.batch_max_active_titles, 1
+        )
+
+    async def run(self) -> List[TitleResult]:
+        """
+        모든 작업을 실행하고 웹툰별 결과를 반환하는 함수 (한 웹툰이 실패해도 나머지는 계속 진행)
+
+        Returns:
+            작업 순서와 같은 순서의 결과 리스트
+        """
+        scheduler = FairSemaphore(self.__max_concurrent)
+        active_titles = asyncio.Semaphore(self.__max_active_titles)
+
+        async with HttpSession(self.__settings, scheduler) as http:
+            results = await asyncio.gather(
+                *(self.__run_job(job, http, active_titles) for job in self.__jobs)
+            )
+            # 모든 웹툰이 같은 세션을 쓰므로 전체 실행의 측정값이 한 번에 기록된다
+            export_metrics(http.metrics, self.__settings)
+
+        for result in results:
+            result.requests = scheduler.granted.get(result.job.title_id, 0)
+            self.__reporter.emit(
+                "title_done",
+                title_id=result.job.title_id,
+                title=result.title_name,
+                range=result.job.range_text,
+                success=result.success,
+                episodes=result.episodes,
+                requests=result.requests,
+                elapsed=round(result.elapsed, 3),
+                error=result.error,
+            )
+        self.print_summary(results)
+        return results
+
+    async def __run_job(
+        self, job: TitleJob, http: HttpSession, active_titles: asyncio.Semaphore
+    ) -> TitleResult:
+        """웹툰 하나를 분석하고 다운로드한다."""
+        result = TitleResult(job=job)
+        async with active_titles:
+            start_time = time.perf_counter()
+            try:
+                # 동기화 / 화수 범위 작업은 전체 에피소드 목록 대신 메타데이터만 가져온다
+                # (범위 작업은 범위가 들어있는 목록 페이지만 나중에 요청)
+                analyzer = await WebtoonAnalyzer.create(
+                    job.title_id,
+                    self.__nid_aut,
+                    self.__nid_ses,
+                    http=http,
+                    load_episodes=not job.sync and job.start is None,
+                    reporter=self.__reporter,
+                )
+                result.title_name = analyzer.title_name
+                if analyzer.is_adult and not (self.__nid_aut and self.__nid_ses):
+                    raise Exception("성인 웹툰은 NID_AUT / NID_SES 쿠키가 필요합니다.")
+
+                downloader = WebtoonDownloader(
+                    analyzer.title_id,
+                    analyzer.downloadable_episodes,
+                    analyzer.title_name,
+                    analyzer.webtoon_type,
+                    self.__nid_aut,
+                    self.__nid_ses,
+                    http=http,
+                    reporter=self.__reporter,
+                )
+                if job.sync:
+                    known_episodes = downloader.known_episodes()
+                    new_episodes = await analyzer.fetch_new_episodes(known_episodes)
+                    result.episodes = len(new_episodes)
+                    result.success = not new_episodes or await downloader.download_episodes(
+                        new_episodes, self.__batch_size, self.__max_concurrent
+                    )
+                elif job.start is None:
+                    result.episodes = len(analyzer.downloadable_episodes)
+                    result.success = await downloader.download_episodes(
+                        analyzer.downloadable_episodes,
+                        self.__batch_size,
+                        self.__max_concurrent,
+                    )
+                else:
+                    episodes = await analyzer.get_downloadable_episodes(job.start, job.end)
+                    result.episodes = len(episodes)
+                    result.success = await downloader.download_episodes(
+                        episodes, self.__batch_size, self.__max_concurrent
+                    )
+            except Exception as e:
+                result.error = str(e)
+                print(f"[{job.title_id}] 일괄 다운로드 실패 - {e}")
+            result.elapsed = time.perf_counter() - start_time
+        return result
+
+    @staticmethod
+    def print_summary(results: List[TitleResult]) -> None:
+        """웹툰별 결과를 표로 출력한다."""
+        table = Table(title="📚 일괄 다운로드 결과")
+        table.add_column("ID", style="cyan")
+        table.add_column("웹툰명")
+        table.add_column("범위")
+        table.add_column("에피소드", justify="right")
+        table.add_column("요청", justify="right")
+        table.add_column("시간", justify="right")
+        table.add_column("결과")
+
+        for result in results:
+            if result.success:
+                status = "[green]성공[/green]"
+            elif result.error:
+                status = f"[red]실패: {result.error}[/red]"
+            else:
+                status = "[yellow]일부 실패[/yellow]"
+            table.add_row(
+                str(result.job.title_id),
+                result.title_name or "-",
+                result.job.range_text,
+                str(result.episodes),
+                str(result.requests),
+                f"{result.elapsed:.1f}s",
+                status,
+            )
+
+        success_count = sum(result.success for result in results)
+        table.caption = f"성공 {success_count}개 / 전체 {len(results)}개"
+        Console().print(table)
@@ -1,13 +1,12 @@
 import asyncio
 import aiohttp
-import aiofiles
 import sys
 import os
 import time
 import random
+import re
 from dataclasses import dataclass, field
-from typing import List, Optional
-from bs4 import BeautifulSoup
+from typing import Awaitable, Callable, List, Optional, Set, Union
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
@@ -23,8 +22,18 @@ sys.path.append(
 
 from module.webtoon.analyzer import EpisodeInfo, WebtoonAnalyzer
 from module.headers import headers
-from module.settings import Setting, FileSettingType
+from module.webtoon.session import HttpSession
+from module.webtoon.manifest import DownloadManifest, FileDigest
+from module.webtoon.part_file import PartFile
+from module.webtoon.episode_buffer import BufferedImage, EpisodeBuffer
+from module.webtoon.object_store import ObjectStore, StoredImage
+from module.webtoon.image_extractor import extract_image_urls
+from module.settings import Setting, FileSettingType, OutputMode
+from module.image_merger import ImageMerger
+from module.cbz_archive import ARCHIVE_EXTENSION, CbzWriter
 from module.file_processor import FileProcessor
+from module.progress import ProgressReporter
+from module.metrics import export_metrics
 
 
 @dataclass
@@ -34,6 +43,32 @@ class EpisodeImageInfo(EpisodeInfo):
     img_urls: List[str] = field(default_factory=list)
 
 
+@dataclass
+class EpisodeProgress:
+    """이미지 다운로드가 진행 중인 에피소드의 카운터를 담는 데이터 클래스"""
+
+    no: int
+    total: int  # 다운로드할 이미지 수
+    done: int = 0  # 결과가 나온 이미지 수
+    success: int = 0  # 성공한 이미지 수
+    # strip / cbz 모드에서 이미지를 모아두는 버퍼 (files 모드면 None)
+    buffer: Optional[EpisodeBuffer] = None
+    # cbz 모드에서 이미지를 순서대로 써넣는 아카이브 (그 외 모드면 None)
+    archive: Optional[CbzWriter] = None
+    # 여러 작업자가 아카이브에 동시에 쓰지 않고 순번 순서를 지키도록 하는 잠금
+    archive_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+@dataclass
+class ImageJob:
+    """작업자가 작업 큐에서 꺼내 처리하는 이미지 하나의 다운로드 작업"""
+
+    episode: EpisodeImageInfo
+    img_idx: int
+    img_url: str
+    progress: EpisodeProgress
+
+
 class WebtoonDownloader:
     """웹툰 다운로드 관련 기능을 담당하는 클래스"""
 
@@ -46,6 +81,8 @@ class WebtoonDownloader:
         webtoon_type: WebtoonType,
         nid_aut: Optional[str] = None,
         nid_ses: Optional[str] = None,
+        http: Optional[HttpSession] = None,
+        reporter: Optional[ProgressReporter] = None,
     ) -> None:
         #
         self.__title_id = title_id
@@ -53,20 +90,81 @@ class WebtoonDownloader:
         self.__webtoon_title = webtoon_title
         self.__webtoon_type = webtoon_type
 
-        # 요청에 사용할 상세 페이지 URL (웹툰 타입에 따라 세그먼트 달라짐)
-        self.__detail_url = (
-            f"https://comic.naver.com/{self.__webtoon_type.value}/detail"
-        )
-
         # 설정 및 파일 처리 객체 초기화
         self.__settings = Setting()
         self.__file_processor = FileProcessor()
 
+        # 요청에 사용할 상세 페이지 URL (웹툰 타입에 따라 세그먼트 달라짐)
+        self.__detail_url = (
+            f"{self.__settings.base_url}/{self.__webtoon_type.value}/detail"
+        )
+
         # 성인 웹툰용 쿠키 설정
         self.__cookies = {}
         if nid_aut and nid_ses:
             self.__cookies = {"NID_AUT": nid_aut, "NID_SES": nid_ses}
 
+        # 공유 HTTP 세션 (없으면 download() 동안만 사용할 세션을 직접 생성)
+        self.__http = http
+
+        # 이어받기용 다운로드 기록 (download() 에서 불러옴)
+        self.__manifest: Optional[DownloadManifest] = None
+
+        # 중복 이미지 제거용 저장소 (Deduplicate 설정 시 download() 에서 불러옴)
+        self.__store: Optional[ObjectStore] = None
+
+        # 진행 상황 이벤트를 받을 객체 (기본값은 아무것도 하지 않음, CLI 에서는 JSON Lines 출력)
+        self.__reporter = reporter if reporter is not None else ProgressReporter()
+
+        # 이번 다운로드에서 받은 이미지 수와 바이트 수 (처리량 계산용)
+        self.__downloaded_images = 0
+        self.__downloaded_bytes = 0
+
+    def __emit_retry(
+        self,
+        url: str,
+        reason: str,
+        attempt: int,
+        max_retries: int,
+        delay: float,
+        no: Optional[int] = None,
+    ) -> None:
+        """
+        재시도 횟수를 측정값에 더하고 retry 이벤트를 보내는 함수
+        (재시도는 화면에 출력하지 않고 진행 막대의 재시도 수와 실패 로그로만 보여준다)
+
+        Args:
+            url: 재시도할 요청 URL
+            reason: 재시도 이유 (HTTP 상태 코드 / 예외 메시지)
+            attempt: 실패한 시도 번호 (0부터 시작)
+            max_retries: 최대 재시도 횟수
+            delay: 재시도 전 대기 시간(초)
+            no: 에피소드 번호 (상세 페이지 요청인 경우)
+        """
+        self.__http.metrics.record_retry(url)
+        self.__reporter.emit(
+            "retry",
+            title_id=self.__title_id,
+            no=no,
+            url=url,
+            reason=reason,
+            attempt=attempt + 1,
+            max_retries=max_retries,
+            delay=round(delay, 2),
+        )
+
+    def __emit_collect_failed(self, no: int, reason: str) -> None:
+        """에피소드의 이미지 URL 수집 최종 실패를 collect_failed 이벤트로 알리는 함수"""
+        self.__reporter.emit(
+            "collect_failed", title_id=self.__title_id, no=no, reason=reason
+        )
+
+    def __emit_image_failed(self, img_url: str, reason: str) -> None:
+        """이미지 다운로드 최종 실패를 image_failed 이벤트로 알리는 함수"""
+        self.__reporter.emit(
+            "image_failed", title_id=self.__title_id, url=img_url, reason=reason
+        )
+
     async def __get_episode_images(
         self, episode: EpisodeImageInfo, verbose: bool = False
     ) -> EpisodeImageInfo:
@@ -87,187 +185,171 @@ class WebtoonDownloader:
         backoff_base = 1.0  # 초 단위, 1 -> 2 -> 4 ...
 
         try:
-            async with aiohttp.ClientSession(
-                headers=headers, cookies=self.__cookies
-            ) as session:
-                last_error: Optional[Exception] = None
-                for attempt in range(max_retries + 1):
-                    try:
-                        # 각 요청에 타임아웃을 부여해 무한 대기 방지
-                        async with session.get(
-                            url, timeout=aiohttp.ClientTimeout(total=10)
-                        ) as response:
-                            if response.status == 200:
-                                # HTML 내용 가져오기 시간 측정
-                                html_start_time = time.time()
-                                html_content = await response.text()
-                                html_end_time = time.time()
-                                html_time = html_end_time - html_start_time
-
-                                # BeautifulSoup 파싱 시간 측정
-                                parse_start_time = time.time()
-                                soup = BeautifulSoup(html_content, "lxml")
-
-                                # div.wt_viewer 태그 안의 모든 img 태그 찾기
-                                viewer = soup.select_one("div.wt_viewer")
-
-                                if viewer:
-                                    img_tags = viewer.find_all("img")  # type: ignore
-                                    img_urls = []
-
-                                    for img in img_tags:
-                                        src = img.get("src")  # type: ignore
-                                        if src:
-                                            img_urls.append(src)
+            # 에피소드마다 세션을 만들지 않고 공유 세션의 커넥션을 재사용한다
+            session = self.__http.session
+            limiter = self.__http.limiter
+            for attempt in range(max_retries + 1):
+                try:
+                    # 호스트 전체 요청 속도 제한 (Retry-After 대기 중이면 여기서 함께 대기)
+                    await limiter.acquire(url)
+
+                    # 각 요청에 타임아웃을 부여해 무한 대기 방지
+                    # (여러 웹툰을 동시에 받는 경우 전체 동시 요청 한도를 웹툰별로 공정하게 나눠 쓴다)
+                    async with self.__http.slot(self.__title_id), session.get(
+                        url,
+                        cookies=self.__cookies,
+                        timeout=aiohttp.ClientTimeout(total=10),
+                    ) as response:
+                        # 응답 결과로 요청 속도 조절 (AIMD)
+                        retry_after = limiter.feedback(
+                            url, response.status, response.headers.get("Retry-After")
+                        )
+                        if response.status == 200:
+                            # HTML 내용 가져오기 시간 측정
+                            html_start_time = time.time()
+                            html_content = await response.text()
+                            html_end_time = time.time()
+                            self.__http.metrics.add_bytes(
+                                response.url.host or "", response.content.total_bytes
+                            )
+                            html_time = html_end_time - html_start_time
+
+                            # div.wt_viewer 태그 안의 모든 img 태그 찾기 (파싱 시간 측정)
+                            # 뷰어 부분만 스트리밍 파싱하고, 구조가 다르면 BeautifulSoup 으로 대체
+                            parse_start_time = time.time()
+                            img_urls = extract_image_urls(html_content)
+
+                            parse_end_time = time.time()
+                            parse_time = parse_end_time - parse_start_time
+                            total_parse_time = parse_end_time - html_start_time
+
+                            episode.img_urls = img_urls
+                            rate = limiter.rate(url)
+                            # 에피소드마다 화면에 출력하지 않고 진행 상황 이벤트로만 알린다
+                            self.__reporter.emit(
+                                "episode_collected",
+                                title_id=self.__title_id,
+                                no=episode.no,
+                                images=len(img_urls),
+                                rate=round(rate, 2),
+                            )
+                            if verbose:
+                                print(
+                                    f"  {episode.no}화: {len(img_urls)}개 이미지 URL 수집 완료 (HTML: {html_time:.3f}s, 파싱: {parse_time:.3f}s, 총: {total_parse_time:.3f}s, {rate:.1f} req/s)"
+                                )
+                            # 성공 시 재시도 루프 종료
+                            break
+                        else:
+                            # 비정상 응답 상태코드일 때 재시도 (429 등)
+                            if attempt < max_retries:
+                                # Retry-After 헤더가 있으면 우선 적용
+                                # (속도 제한기에도 반영되어 다른 요청들도 같이 대기한다)
+                                if retry_after is not None:
+                                    delay = retry_after
                                 else:
-                                    img_urls = []
+                                    delay = backoff_base * (2**attempt)
 
-                                parse_end_time = time.time()
-                                parse_time = parse_end_time - parse_start_time
-                                total_parse_time = parse_end_time - html_start_time
-
-                                episode.img_urls = img_urls
-                                if verbose:
-                                    print(
-                                        f"  {episode.no}화: {len(img_urls)}개 이미지 URL 수집 완료 (HTML: {html_time:.3f}s, 파싱: {parse_time:.3f}s, 총: {total_parse_time:.3f}s)"
-                                    )
-                                else:
-                                    print(
-                                        f"  {episode.no}화: {len(img_urls)}개 이미지 URL 수집 완료"
-                                    )
-                                # 성공 시 재시도 루프 종료
-                                break
+                                self.__emit_retry(
+                                    url, f"HTTP {response.status}", attempt, max_retries, delay, episode.no
+                                )
+                                await asyncio.sleep(delay)
+                                continue
                             else:
-                                # 비정상 응답 상태코드일 때 재시도 (429 등)
-                                if attempt < max_retries:
-                                    # 429인 경우 Retry-After 헤더를 우선 적용
-                                    if response.status == 429:
-                                        retry_after = response.headers.get(
-                                            "Retry-After"
-                                        )
-                                        if retry_after and retry_after.isdigit():
-                                            delay = float(retry_after)
-                                        else:
-                                            delay = backoff_base * (2**attempt)
-                                    else:
-                                        delay = backoff_base * (2**attempt)
-
-                                    print(
-                                        f"  {episode.no}화: HTTP {response.status} (재시도 {attempt+1}/{max_retries}, {delay:.1f}s 대기)"
-                                    )
-                                    await asyncio.sleep(delay)
-                                    continue
-                                else:
-                                    print(
-                                        f"  {episode.no}화: HTTP 요청 실패 ({response.status}), 재시도 한도 초과"
-                                    )
-                                    episode.img_urls = []
-                    except Exception as e:
-                        # 네트워크 오류 등 예외 발생 시 재시도
-                        last_error = e
-                        if attempt < max_retries:
-                            delay = backoff_base * (2**attempt)
-                            print(
-                                f"  {episode.no}화: 요청 중 오류 발생 - {e} (재시도 {attempt+1}/{max_retries}, {delay:.1f}s 대기)"
-                            )
-                            await asyncio.sleep(delay)
-                            continue
-                        else:
-                            print(
-                                f"  {episode.no}화: 이미지 URL 수집 중 오류 발생 - {e} (재시도 한도 초과)"
-                            )
-                            episode.img_urls = []
-                else:
-                    # for-else: break 없이 종료된 경우 (모든 시도 실패)
-                    if last_error is not None:
-                        print(f"  {episode.no}화: 최종 실패 - {last_error}")
-                    episode.img_urls = []
+                                self.__emit_collect_failed(
+                                    episode.no, f"HTTP 요청 실패 ({response.status}), 재시도 한도 초과"
+                                )
+                                episode.img_urls = []
+                except Exception as e:
+                    # 네트워크 오류 등 예외 발생 시 속도를 낮추고 재시도
+                    limiter.feedback(url, None)
+                    if attempt < max_retries:
+                        delay = backoff_base * (2**attempt)
+                        self.__emit_retry(url, str(e), attempt, max_retries, delay, episode.no)
+                        await asyncio.sleep(delay)
+                        continue
+                    else:
+                        self.__emit_collect_failed(
+                            episode.no, f"이미지 URL 수집 중 오류 발생 - {e} (재시도 한도 초과)"
+                        )
+                        episode.img_urls = []
+            else:
+                # for-else: break 없이 종료된 경우 (모든 시도 실패, 실패 이벤트는 위에서 이미 보냄)
+                episode.img_urls = []
         except Exception as e:
-            # 세션 생성 등 상위 레벨 예외 처리
-            print(f"  {episode.no}화: 이미지 URL 수집 중 오류 발생 - {e}")
+            # 세션 접근 등 상위 레벨 예외 처리
+            self.__emit_collect_failed(episode.no, f"이미지 URL 수집 중 오류 발생 - {e}")
             episode.img_urls = []
 
         return episode
 
-    async def get_episodes_with_images_batch(
-        self, episodes: List[EpisodeImageInfo], batch_size: int
-    ) -> List[EpisodeImageInfo]:
+    async def __collect_episode_images(
+        self,
+        episodes: List[EpisodeImageInfo],
+        concurrency: int,
+        on_collected: Callable[[EpisodeImageInfo], Awaitable[None]],
+    ) -> None:
         """
-        에피소드들의 이미지 URL을 배치 단위로 가져오는 함수
+        고정된 수의 작업자로 에피소드들의 이미지 URL을 수집하는 함수
+
+        배치 사이에 고정 시간을 쉬는 대신, 모든 요청이 공유 속도 제한기(AdaptiveRateLimiter)를
+        거치므로 서버 상태에 맞춰 자동으로 빨라지거나 느려진다.
 
         Args:
             episodes: 이미지 URL을 수집할 에피소드 리스트
-            batch_size: 한 번에 처리할 에피소드 수
-
-        Returns:
-            이미지 URL이 포함된 에피소드 리스트
+            concurrency: 동시에 상세 페이지를 요청할 작업자 수
+            on_collected: 에피소드 하나의 수집이 끝날 때마다 호출할 콜백
         """
-        if not episodes:
-            print("수집할 에피소드가 없습니다.")
-            return []
-
-        print(f"\n{len(episodes)}개 에피소드의 이미지 URL을 수집합니다...")
-        print(f"배치 크기: {batch_size}개씩 처리")
-        print(
-            "URL 수집 중 길게 멈추거나 작동하지 않을 시 프로그램 종료 후 조금 기다린 후 다시 실행해주세요."
-        )
-        print(
-            "URL 수집에 문제가 많이 발생할 경우 settings.ini 파일에서 batchsize의 값을 줄이고 delayseconds를 늘려보세요."
-        )
-
-        episodes_with_images = []
-        total_episodes = len(episodes)
-
-        # 배치 단위로 처리
-        for i in range(0, total_episodes, batch_size):
-            batch = episodes[i : i + batch_size]
-            print(
-                f"\n배치 {i//batch_size + 1}/{(total_episodes + batch_size - 1)//batch_size} 처리 중... ({i+1}~{min(i+batch_size, total_episodes)}화)"
-            )
-
-            # 현재 배치의 이미지 URL을 병렬로 가져오기
-            tasks = []
-            for episode in batch:
-                task = self.__get_episode_images(episode)
-                tasks.append(task)
-
-            # 현재 배치의 요청을 동시에 실행
-            batch_results: List[EpisodeImageInfo] = await asyncio.gather(
-                *tasks, return_exceptions=True
-            )
-
-            # 결과 처리
-            for j, result in enumerate(batch_results):
-                if isinstance(result, Exception):
-                    print(f"  {batch[j].no}화: 오류 발생 - {result}")
-                    batch[j].img_urls = []
-                    episodes_with_images.append(batch[j])
-                else:
-                    episodes_with_images.append(result)
+        episode_iter = iter(episodes)
+
+        async def worker() -> None:
+            # 이벤트 루프는 단일 스레드이므로 next() 호출 사이에 경쟁 상태가 없다
+            for episode in episode_iter:
+                try:
+                    with self.__http.metrics.phase("collect"):
+                        result = await self.__get_episode_images(episode)
+                except Exception as e:
+                    self.__emit_collect_failed(episode.no, f"오류 발생 - {e}")
+                    episode.img_urls = []
+                    result = episode
+                await on_collected(result)
 
-            # 서버 부하 방지를 위한 잠시 대기
-            if i + batch_size < total_episodes:
-                delay = self.__settings.delay_seconds
-                print(f"서버 부하 방지를 위해 {delay}초 대기합니다.")
-                await asyncio.sleep(delay)
+        worker_count = max(min(concurrency, len(episodes)), 1)
+        await self.__run_tasks([worker() for _ in range(worker_count)])
 
-        print(f"\n총 {len(episodes_with_images)}개 에피소드의 이미지 URL 수집 완료!")
+    @staticmethod
+    async def __run_tasks(coros: List[Awaitable[None]]) -> None:
+        """
+        코루틴들을 동시에 실행하고 모두 끝날 때까지 기다리는 함수
 
-        return episodes_with_images
+        asyncio.gather 와 달리 하나가 예외로 끝나거나 바깥에서 취소되면 나머지를 바로 취소하고,
+        모두 정리된 뒤 처음 발생한 예외를 그대로 다시 발생시킨다.
+        """
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def __download_single_image(
-        self, session: aiohttp.ClientSession, img_url: str, file_path: Path
-    ) -> bool:
+        self,
+        session: aiohttp.ClientSession,
+        img_url: str,
+        part_file: Union[PartFile, BufferedImage],
+    ) -> Optional[FileDigest]:
         """
         단일 이미지를 다운로드하는 함수
 
         Args:
             session: aiohttp 세션
             img_url: 이미지 URL
-            file_path: 저장할 파일 경로
+            part_file: 받은 데이터를 쓸 대상
+                (PartFile: *.part 파일에 받다가 완료되면 최종 이름으로 바꿈, 중단 시 Range 요청으로 이어받기
+                 BufferedImage: strip 모드에서 에피소드 버퍼에 받음)
 
         Returns:
-            다운로드 성공 여부
+            다운로드한 이미지의 크기와 체크섬 (실패 시 None)
         """
         # 요청 안정성을 높이기 위해 이미지 다운로드에 재시도(지수 백오프 + 지터) 적용
         max_retries = 5
@@ -275,181 +357,565 @@ class WebtoonDownloader:
 
         for attempt in range(max_retries + 1):
             try:
-                # 첫 시도 시 다운로드할 이미지 URL 출력 (진행 상황 표시)
-                if attempt == 0:
-                    print(img_url, flush=True)
-                async with session.get(img_url, headers=headers) as response:
-                    if response.status == 200:
-                        # 디렉토리가 없으면 생성
-                        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-                        async with aiofiles.open(file_path, "wb") as f:
-                            async for chunk in response.content.iter_chunked(8192):
-                                await f.write(chunk)
-                        return True
+                async with self.__http.slot(self.__title_id), session.get(
+                    img_url,
+                    headers={**headers, **part_file.request_headers()},
+                    cookies=self.__cookies,
+                ) as response:
+                    if response.status in (200, 206):
+                        # 저장하면서 크기와 체크섬을 함께 계산 (매니페스트 기록용)
+                        digest = await part_file.write(response)
+                        self.__http.metrics.add_bytes(
+                            response.url.host or "", response.content.total_bytes
+                        )
+                        self.__downloaded_images += 1
+                        self.__downloaded_bytes += digest.size
+                        return digest
                     else:
+                        # 이어받을 범위가 잘못된 경우 (416) 받던 파일을 버리고 처음부터 다시 받는다
+                        if response.status == 416:
+                            part_file.discard()
+
                         # 상태 코드가 비정상인 경우 재시도
                         if attempt < max_retries:
                             delay = backoff_base * (2**attempt)
                             # 0~20% 지터 추가로 동시 재시도 충돌 방지
                             delay *= 1 + random.uniform(0, 0.2)
-                            print(
-                                f"실패: {img_url} (HTTP {response.status}) -> 재시도 {attempt+1}/{max_retries} ({delay:.1f}s 대기)"
+                            self.__emit_retry(
+                                img_url, f"HTTP {response.status}", attempt, max_retries, delay
                             )
                             await asyncio.sleep(delay)
                             continue
                         else:
-                            print(
-                                f"실패: {img_url} (HTTP {response.status}), 재시도 한도 초과"
+                            self.__emit_image_failed(
+                                img_url, f"HTTP {response.status}, 재시도 한도 초과"
                             )
-                            return False
+                            return None
             except Exception as e:
                 # 네트워크 오류 등 예외 발생 시 재시도
                 if attempt < max_retries:
                     delay = backoff_base * (2**attempt)
                     delay *= 1 + random.uniform(0, 0.2)
-                    print(
-                        f"오류: {img_url} - {e} -> 재시도 {attempt+1}/{max_retries} ({delay:.1f}s 대기)"
-                    )
+                    self.__emit_retry(img_url, str(e), attempt, max_retries, delay)
                     await asyncio.sleep(delay)
                     continue
                 else:
-                    print(f"오류: {img_url} - {e} (재시도 한도 초과)")
-                    return False
+                    self.__emit_image_failed(img_url, f"{e} (재시도 한도 초과)")
+                    return None
 
         # 모든 경로가 반환되도록 안전망 리턴 (정상 동작 중엔 도달하지 않음)
-        return False
+        return None
 
-    async def __download_all_images_concurrent(
-        self, episodes: List[EpisodeImageInfo], max_concurrent: Optional[int] = None
-    ) -> List[bool]:
+    def __get_title_dir(self) -> Path:
+        """웹툰 제목으로 된 다운로드 폴더 경로 (매니페스트도 이 폴더에 저장됨)"""
+        # 윈도우 파일시스템 금지문자 / 마침표 처리: 제목 처리
+        safe_title: str = self.__file_processor.remove_forbidden_str(
+            self.__webtoon_title
+        )
+        return Path(self.__settings.download_path) / safe_title
+
+    def known_episodes(self) -> Set[int]:
+        """
+        이미 다운로드한 에피소드 번호를 찾는 함수 (동기화 모드에서 사용)
+
+        매니페스트에 완료로 기록된 에피소드와, 매니페스트가 없던 시절에 받은
+        "[0001] 제목" 형식의 에피소드 폴더(또는 .cbz 아카이브)를 모두 이미 받은 것으로 본다.
+        (매니페스트에 미완료로 기록된 에피소드는 폴더가 있어도 제외)
+
+        Returns:
+            이미 다운로드한 에피소드 번호 집합
+        """
+        title_dir = self.__get_title_dir()
+        manifest = DownloadManifest.load(
+            title_dir, self.__title_id, self.__settings.verify_checksum
+        )
+
+        folder_episodes: Set[int] = set()
+        if title_dir.is_dir():
+            for entry in title_dir.iterdir():
+                match = re.match(r"\[(\d+)\]", entry.name)
+                # cbz 모드로 받은 "[0001] 제목.cbz" 아카이브도 받은 에피소드로 본다
+                is_episode = entry.is_dir() or (
+                    entry.is_file() and entry.name.lower().endswith(ARCHIVE_EXTENSION)
+                )
+                if is_episode and match:
+                    folder_episodes.add(int(match.group(1)))
+
+        return (
+            folder_episodes - manifest.incomplete_episodes
+        ) | manifest.completed_episodes
+
+    def __get_episode_dir(self, episode: EpisodeInfo) -> Path:
+        """에피소드 이미지(또는 병합 결과)가 저장될 "[0001] 제목" 폴더 경로"""
+        # settings에서 folder zero fill 값 가져오기
+        folder_zfill: int = self.__settings.get_zero_fill(FileSettingType.Folder)
+
+        # 가져온 zero fill 값 에피소드 번호에 적용
+        episode_no_zfill: str = str(episode.no).zfill(folder_zfill)
+
+        # 윈도우 파일시스템 금지문자 / 마침표 처리: 에피소드 제목 처리
+        safe_subtitle: str = self.__file_processor.remove_forbidden_str(
+            episode.subtitle
+        )
+
+        # 다운로드 폴더 경로 만들기
+        return self.__get_title_dir() / f"[{episode_no_zfill}] {safe_subtitle}"
+
+    def __get_image_path(
+        self, episode: EpisodeImageInfo, img_url: str, img_idx: int
+    ) -> Path:
         """
-        모든 에피소드의 이미지를 동시성 제한을 걸어 한꺼번에 다운로드하는 함수
+        이미지가 저장될 파일 경로를 만드는 함수
 
         Args:
-            episodes: 이미지 URL이 포함된 에피소드 리스트
-            max_concurrent: 최대 동시 다운로드 수 (기본값: 10)
+            episode: 이미지가 속한 에피소드 정보
+            img_url: 이미지 URL (확장자 추출용)
+            img_idx: 에피소드 안에서의 이미지 순번 (0부터 시작)
 
         Returns:
-            각 에피소드의 다운로드 성공 여부 리스트
+            저장할 파일 경로
         """
-        if not episodes:
-            print("다운로드할 에피소드가 없습니다.")
-            return []
+        download_dir = self.__get_episode_dir(episode)
 
-        # 설정에서 최대 동시 다운로드 수 가져오기
-        if max_concurrent is None:
-            max_concurrent = self.__settings.max_concurrent
+        # 파일 확장자 추출 (기본값: .jpg)
+        ext = ".jpg"
+        if "." in img_url.split("/")[-1]:
+            ext = "." + img_url.split(".")[-1].split("?")[0]
+
+        # 동일하게 settings에서 image zero fill 값 가져와서 이미지 파일명에 적용
+        image_zfill: int = self.__settings.get_zero_fill(FileSettingType.Image)
+        img_filename: str = str(img_idx + 1).zfill(image_zfill)
+        return download_dir / f"{img_filename}{ext}"
 
-        # 전체 이미지 수 계산
-        total_images = sum(len(episode.img_urls) for episode in episodes)
-        print(
-            f"총 {len(episodes)}개 에피소드, {total_images}개 이미지를 동시 다운로드합니다..."
+    def __start_episode(self, episode: EpisodeImageInfo) -> Optional[EpisodeProgress]:
+        """
+        에피소드의 이미지 다운로드를 시작하기 전에 진행 상황 카운터를 만드는 함수
+
+        Args:
+            episode: 이미지 URL이 포함된 에피소드 정보
+
+        Returns:
+            진행 상황 카운터 (다운로드할 이미지가 없으면 None)
+        """
+        if not episode.img_urls:
+            # 수집 실패는 collect_failed 로 이미 알렸으므로 건너뛴 사실만 알린다
+            self.__reporter.emit(
+                "episode_skipped",
+                title_id=self.__title_id,
+                no=episode.no,
+                reason="다운로드할 이미지 URL이 없습니다.",
+            )
+            return None
+
+        if self.__manifest is not None:
+            self.__manifest.start_episode(
+                episode.no, episode.subtitle, len(episode.img_urls)
+            )
+
+        self.__reporter.emit(
+            "episode_start",
+            title_id=self.__title_id,
+            no=episode.no,
+            images=len(episode.img_urls),
         )
-        print(f"최대 동시 다운로드: {max_concurrent}개")
 
-        # 세마포어로 전체 이미지 다운로드 동시성 제한
-        semaphore = asyncio.Semaphore(max_concurrent)
+        output_mode = self.__settings.output_mode
+        buffer, archive = None, None
+        if output_mode in (OutputMode.strip, OutputMode.cbz):
+            buffer = EpisodeBuffer(
+                len(episode.img_urls), self.__settings.strip_memory_mb * 1024 * 1024
+            )
+        if output_mode == OutputMode.cbz:
+            archive = CbzWriter(str(self.__get_archive_path(episode)))
+        return EpisodeProgress(
+            no=episode.no, total=len(episode.img_urls), buffer=buffer, archive=archive
+        )
 
-        async def download_single_episode_image(session, episode, img_url, img_idx):
-            """단일 에피소드의 단일 이미지 다운로드"""
-            async with semaphore:
-                # settings에서 folder zero fill 값 가져오기
-                folder_zfill: int = self.__settings.get_zero_fill(
-                    FileSettingType.Folder
-                )
+    async def __finish_image(
+        self, job: ImageJob, success: bool, results: dict[int, bool]
+    ) -> None:
+        """
+        이미지 하나의 결과를 에피소드 카운터에 반영하고, 마지막 이미지면 에피소드를 마무리하는 함수
+        (strip 모드면 모아둔 이미지를 바로 병합해서 결과 파일만 저장하고,
+         cbz 모드면 아카이브를 완성한다)
 
-                # 가져온 zero fill 값 에피소드 번호에 적용
-                episode_no_zfill: str = str(episode.no).zfill(folder_zfill)
+        Args:
+            job: 결과가 나온 이미지 작업
+            success: 이미지 다운로드 성공 여부
+            results: 에피소드 번호 -> 성공 여부를 기록할 딕셔너리
+        """
+        progress = job.progress
+        progress.done += 1
+        if success:
+            progress.success += 1
+        self.__reporter.emit(
+            "image_done",
+            title_id=self.__title_id,
+            no=progress.no,
+            index=job.img_idx,
+            success=success,
+        )
+        if progress.done < progress.total:
+            return
+
+        # 성공한 에피소드는 episode_done 으로 충분하므로 일부 이미지가 실패한 경우만 따로 알린다
+        if progress.success < progress.total:
+            self.__reporter.emit(
+                "episode_incomplete",
+                title_id=self.__title_id,
+                no=progress.no,
+                images=progress.total,
+                succeeded=progress.success,
+            )
+        episode_success = progress.success == progress.total
 
-                # 윈도우 파일시스템 금지문자 / 마침표 처리: 제목과 에피소드 제목 처리
-                safe_title: str = self.__file_processor.remove_forbidden_str(
-                    self.__webtoon_title
-                )
-                safe_subtitle: str = self.__file_processor.remove_forbidden_str(
-                    episode.subtitle
+        if progress.archive is not None:
+            try:
+                episode_success = await self.__commit_archive(
+                    job.episode, progress.archive, episode_success
                 )
+            finally:
+                progress.buffer.close()
+            if not episode_success and self.__manifest is not None:
+                await asyncio.to_thread(self.__manifest.finish_episode, progress.no, False)
+        elif progress.buffer is not None:
+            try:
+                if episode_success:
+                    episode_success = await self.__merge_episode(job.episode, progress.buffer)
+            finally:
+                progress.buffer.close()
+            if not episode_success and self.__manifest is not None:
+                await asyncio.to_thread(self.__manifest.finish_episode, progress.no, False)
+        elif self.__manifest is not None:
+            # 매니페스트 전체를 다시 쓰므로 스레드에서 저장
+            await asyncio.to_thread(
+                self.__manifest.finish_episode, progress.no, episode_success
+            )
+        results[progress.no] = episode_success
+        self.__reporter.emit(
+            "episode_done",
+            title_id=self.__title_id,
+            no=progress.no,
+            success=episode_success,
+            images=progress.total,
+            succeeded=progress.success,
+        )
+
+    async def __merge_episode(
+        self, episode: EpisodeImageInfo, buffer: EpisodeBuffer
+    ) -> bool:
+        """
+        strip 모드에서 버퍼에 모은 에피소드 이미지를 병합해서 저장하는 함수
 
-                # 다운로드 폴더 경로 만들기
-                download_dir: Path = (
-                    Path("Webtoon_Download")
-                    / safe_title
-                    / f"[{episode_no_zfill}] {safe_subtitle}"
+        Args:
+            episode: 병합할 에피소드 정보
+            buffer: 에피소드의 모든 이미지가 담긴 버퍼
+
+        Returns:
+            병합 성공 여부
+        """
+        episode_dir = self.__get_episode_dir(episode)
+        episode_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            # 디코딩 / 인코딩은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+            # (버퍼의 이미지는 병합 스레드가 하나씩 읽으므로 StripMemoryMB 를 넘은 부분은 디스크에 남아 있다)
+            with self.__http.metrics.phase("merge"):
+                output_paths = await asyncio.to_thread(
+                    ImageMerger.merge_sources,
+                    buffer.images(),
+                    str(episode_dir),
+                    self.__settings.merge_max_height,
+                    self.__settings.merge_lossless_jpeg,
                 )
+        except Exception as e:
+            self.__reporter.emit(
+                "merge_failed",
+                title_id=self.__title_id,
+                no=episode.no,
+                reason=f"이미지 병합 중 오류 발생 - {e}",
+            )
+            return False
 
-                # 파일 확장자 추출 (기본값: .jpg)
-                ext = ".jpg"
-                if "." in img_url.split("/")[-1]:
-                    ext = "." + img_url.split(".")[-1].split("?")[0]
+        self.__reporter.emit(
+            "episode_saved",
+            title_id=self.__title_id,
+            no=episode.no,
+            outputs=[os.path.basename(p) for p in output_paths],
+        )
+        if self.__manifest is not None:
+            # 결과 파일 체크섬 계산과 매니페스트 저장도 병합처럼 스레드에서 실행
+            await asyncio.to_thread(
+                self.__manifest.finish_episode_outputs,
+                episode.no,
+                [Path(p) for p in output_paths],
+            )
+        return True
+
+    def __get_archive_path(self, episode: EpisodeInfo) -> Path:
+        """cbz 모드에서 에피소드를 저장할 "[0001] 제목.cbz" 파일 경로"""
+        episode_dir = self.__get_episode_dir(episode)
+        return episode_dir.with_name(episode_dir.name + ARCHIVE_EXTENSION)
+
+    async def __write_ready_images(self, job: ImageJob) -> None:
+        """cbz 모드에서 차례가 된 이미지들을 순번 순서대로 아카이브에 써넣는다."""
+        progress = job.progress
+        # 꺼내기와 쓰기를 같은 잠금 안에서 해야 늦게 꺼낸 이미지가 먼저 써지지 않는다
+        async with progress.archive_lock:
+            images = []
+            for img_idx, data in progress.buffer.pop_ready():
+                img_url = job.episode.img_urls[img_idx]
+                # 아카이브 안의 파일 이름도 files 모드와 같은 zero fill 이름 사용 (0001.jpg ...)
+                name = self.__get_image_path(job.episode, img_url, img_idx).name
+                images.append((name, data))
+            if images:
+                await asyncio.to_thread(progress.archive.write_all, images)
+
+    async def __commit_archive(
+        self, episode: EpisodeImageInfo, archive: CbzWriter, success: bool
+    ) -> bool:
+        """
+        cbz 모드에서 에피소드 아카이브를 완성하는 함수 (실패한 에피소드는 작성 중이던 아카이브를 삭제)
+
+        Args:
+            episode: 에피소드 정보
+            archive: 이미지를 써넣던 아카이브
+            success: 에피소드의 모든 이미지 다운로드 성공 여부
 
-                # 동일하게 settings에서 image zero fill 값 가져와서 이미지 파일명에 적용
-                image_zfill: int = self.__settings.get_zero_fill(FileSettingType.Image)
-                img_filename: str = str(img_idx + 1).zfill(image_zfill)
-                file_path: Path = download_dir / f"{img_filename}{ext}"
-                # 다운로드 시작 전 URL을 출력하여 진행 상황 표시
-                print(f"[{episode.no}화] {img_idx+1}: {img_url}", flush=True)
-                return await self.__download_single_image(session, img_url, file_path)
+        Returns:
+            아카이브 저장 성공 여부
+        """
+        if not success or archive.count != len(episode.img_urls):
+            await asyncio.to_thread(archive.discard)
+            return False
 
         try:
-            async with aiohttp.ClientSession(cookies=self.__cookies) as session:
-                # 모든 에피소드의 모든 이미지를 하나의 태스크 리스트로 생성
-                all_tasks = []
-                episode_task_counts = []  # 각 에피소드별 태스크 수 기록
-
-                for episode in episodes:
-                    if not hasattr(episode, "img_urls") or not episode.img_urls:
-                        print(f"  {episode.no}화: 다운로드할 이미지 URL이 없습니다.")
-                        episode_task_counts.append(0)
-                        continue
+            # 중앙 디렉터리 기록과 이름 바꾸기도 블로킹 파일 작업이므로 스레드에서 실행
+            await asyncio.to_thread(archive.commit)
+        except Exception as e:
+            self.__reporter.emit(
+                "merge_failed",
+                title_id=self.__title_id,
+                no=episode.no,
+                reason=f"아카이브 저장 중 오류 발생 - {e}",
+            )
+            await asyncio.to_thread(archive.discard)
+            return False
 
-                    episode_task_counts.append(len(episode.img_urls))
+        self.__reporter.emit(
+            "episode_saved",
+            title_id=self.__title_id,
+            no=episode.no,
+            outputs=[os.path.basename(archive.path)],
+        )
+        if self.__manifest is not None:
+            # 아카이브 전체의 체크섬 계산과 매니페스트 저장은 스레드에서 실행
+            await asyncio.to_thread(
+                self.__manifest.finish_episode_outputs, episode.no, [Path(archive.path)]
+            )
+        return True
 
-                    # 해당 에피소드의 모든 이미지 태스크 생성
-                    for img_idx, img_url in enumerate(episode.img_urls):
-                        task = download_single_episode_image(
-                            session, episode, img_url, img_idx
-                        )
-                        all_tasks.append(task)
-
-                # 모든 이미지를 동시에 다운로드 (세마포어로 동시성 제한)
-                print(f"\n전체 {len(all_tasks)}개 이미지 다운로드 시작...")
-                print("=" * 60)
-                all_results = await asyncio.gather(*all_tasks, return_exceptions=True)
-                print("=" * 60)
-
-                # 에피소드별 결과 집계
-                episode_results = []
-                result_idx = 0
-
-                for i, episode in enumerate(episodes):
-                    task_count = episode_task_counts[i]
-                    if task_count == 0:
-                        episode_results.append(False)
-                        continue
+    async def __download_image_job(self, job: ImageJob) -> bool:
+        """
+        작업 큐에서 꺼낸 이미지 하나를 다운로드하는 함수
 
-                    # 해당 에피소드의 결과들 추출
-                    episode_task_results = all_results[
-                        result_idx : result_idx + task_count
-                    ]
-                    result_idx += task_count
+        Args:
+            job: 다운로드할 이미지 작업
 
-                    # 성공 개수 계산
-                    success_count = sum(
-                        1 for result in episode_task_results if result is True
+        Returns:
+            다운로드 성공 여부 (이미 받아둔 이미지면 True)
+        """
+        episode, img_idx, img_url = job.episode, job.img_idx, job.img_url
+
+        # strip / cbz 모드는 이미지 파일을 남기지 않고 에피소드 버퍼에 받는다
+        if job.progress.buffer is not None:
+            digest = await self.__download_single_image(
+                self.__http.session, img_url, BufferedImage(job.progress.buffer, img_idx)
+            )
+            if digest is not None and job.progress.archive is not None:
+                await self.__write_ready_images(job)
+            return digest is not None
+
+        file_path = self.__get_image_path(episode, img_url, img_idx)
+        manifest = self.__manifest
+
+        # 이전 실행에서 이미 받아서 검증까지 끝난 이미지는 건너뛴다
+        # (파일 확인 / 체크섬 검증도 블로킹 파일 작업이므로 스레드에서 실행)
+        if manifest is not None and await asyncio.to_thread(
+            manifest.is_image_complete, episode.no, img_idx, img_url, file_path
+        ):
+            return True
+
+        # 저장소에 이미 있는 이미지면 GET 없이 기존 이미지에 연결한다
+        store = self.__store
+        if store is not None:
+            sha256 = await self.__find_stored(store, img_url)
+            if sha256 is not None:
+                digest = await asyncio.to_thread(store.link, sha256, file_path, img_url)
+                if manifest is not None:
+                    await asyncio.to_thread(
+                        manifest.record_image, episode.no, img_idx, img_url, file_path, digest
                     )
-                    episode_success = success_count == task_count
-                    episode_results.append(episode_success)
+                return True
+
+        part_file = PartFile(file_path, img_url)
+        digest = await self.__download_single_image(
+            self.__http.session,
+            img_url,
+            part_file
+            if store is None
+            else StoredImage(store, part_file, file_path, img_url),
+        )
 
-                    print(f"  {episode.no}화: {success_count}/{task_count}개 성공")
+        if digest is None:
+            return False
+        if manifest is not None:
+            # 저널을 모아서 쓰는 경우가 있으므로 스레드에서 기록
+            await asyncio.to_thread(
+                manifest.record_image, episode.no, img_idx, img_url, file_path, digest
+            )
+        return True
 
-                return episode_results
+    async def __find_stored(self, store: ObjectStore, img_url: str) -> Optional[str]:
+        """
+        이미지가 저장소에 이미 있는지 GET 을 보내기 전에 확인하는 함수
 
-        except Exception as e:
-            print(f"이미지 다운로드 중 오류 발생: {e}")
-            return [False] * len(episodes)
+        1. 이전에 받은 URL 이면 요청 없이 찾는다.
+        2. 처음 보는 URL 이면 HEAD 요청의 ETag / Content-Length 로 찾는다.
+           (HEAD 가 실패하면 저장소에 없는 것으로 보고 GET 으로 받는다)
+
+        Returns:
+            저장된 blob 의 sha256 (없으면 None)
+        """
+        sha256 = await asyncio.to_thread(store.find, img_url)
+        if sha256 is not None or not store.has_etags:
+            return sha256
+
+        try:
+            async with self.__http.slot(self.__title_id), self.__http.session.head(
+                img_url, headers=headers, cookies=self.__cookies
+            ) as response:
+                if response.status != 200:
+                    return None
+                etag = response.headers.get("ETag")
+                size = response.content_length
+        except Exception:
+            return None
+        if not etag or size is None:
+            return None
+        return await asyncio.to_thread(store.find, img_url, etag, size)
+
+    async def __download_pipeline(
+        self,
+        episodes: List[EpisodeImageInfo],
+        batch_size: int,
+        max_concurrent: Optional[int] = None,
+    ) -> List[bool]:
+        """
+        이미지 URL 수집(생산자)과 이미지 다운로드(소비자)를 동시에 진행하는 함수
+
+        1. 상세 페이지 파싱이 끝난 에피소드는 즉시 제한된 크기의 에피소드 큐에 들어간다.
+        2. 분배기가 에피소드를 꺼내 이미지 단위 작업으로 나눠 제한된 크기의 작업 큐에 넣는다.
+        3. max_concurrent 개의 고정된 작업자가 작업 큐에서 이미지를 하나씩 꺼내 다운로드한다.
+
+        이미지마다 코루틴을 미리 만들지 않고, 두 큐가 가득 차면 앞 단계가 잠시 멈추므로
+        웹툰의 전체 이미지 수와 상관없이 메모리 사용량이 일정하게 유지된다.
+        에피소드별 성공 개수는 결과가 나올 때마다 카운터에 반영된다.
+
+        Args:
+            episodes: 다운로드할 에피소드 리스트
+            batch_size: URL 수집 시 동시에 상세 페이지를 요청할 에피소드 수
+            max_concurrent: 최대 동시 이미지 다운로드 수 (기본값: 설정값)
+
+        Returns:
+            각 에피소드의 다운로드 성공 여부 리스트 (episodes 순서와 동일)
+        """
+        if not episodes:
+            print("다운로드할 에피소드가 없습니다.")
+            return []
+
+        # 설정에서 최대 동시 다운로드 수 가져오기
+        if max_concurrent is None:
+            max_concurrent = self.__settings.max_concurrent
+        worker_count = max(max_concurrent, 1)
+
+        # URL 수집은 끝났지만 아직 작업으로 나누지 못한 에피소드를 담는 큐
+        # (None 은 URL 수집 종료를 알리는 신호)
+        episode_queue: asyncio.Queue[Optional[EpisodeImageInfo]] = asyncio.Queue(
+            maxsize=max(batch_size, 1) * 2
+        )
+
+        # 작업자가 꺼내갈 이미지 작업 큐 (None 은 작업자 종료 신호)
+        job_queue: asyncio.Queue[Optional[ImageJob]] = asyncio.Queue(
+            maxsize=worker_count * 2
+        )
+
+        self.__reporter.emit(
+            "pipeline_start",
+            title_id=self.__title_id,
+            episodes=len(episodes),
+            batch_size=batch_size,
+            max_concurrent=max_concurrent,
+        )
+
+        results: dict[int, bool] = {}
+
+        # 종료 신호(None)는 정상적으로 끝난 경우에만 보낸다
+        # (한 단계가 예외로 끝나면 __run_tasks 가 나머지 단계를 취소하므로 기다리는 쪽이 없다)
+        async def produce() -> None:
+            """이미지 URL을 수집해서 완료되는 대로 에피소드 큐에 넣는다"""
+            await self.__collect_episode_images(episodes, batch_size, episode_queue.put)
+            await episode_queue.put(None)
+
+        async def dispatch() -> None:
+            """에피소드를 이미지 작업으로 나눠 작업 큐에 넣는다"""
+            while True:
+                episode = await episode_queue.get()
+                if episode is None:
+                    break
+
+                progress = self.__start_episode(episode)
+                if progress is None:
+                    results[episode.no] = False
+                    continue
+
+                for img_idx, img_url in enumerate(episode.img_urls):
+                    await job_queue.put(ImageJob(episode, img_idx, img_url, progress))
+
+            for _ in range(worker_count):
+                await job_queue.put(None)
+
+        async def work() -> None:
+            """작업 큐가 닫힐 때까지 이미지를 하나씩 꺼내 다운로드한다"""
+            while True:
+                job = await job_queue.get()
+                if job is None:
+                    break
+                try:
+                    with self.__http.metrics.phase("download"):
+                        success = await self.__download_image_job(job)
+                except Exception as e:
+                    self.__reporter.emit(
+                        "image_error",
+                        title_id=self.__title_id,
+                        no=job.episode.no,
+                        url=job.img_url,
+                        reason=f"이미지 다운로드 중 오류 발생 - {e}",
+                    )
+                    success = False
+                await self.__finish_image(job, success, results)
+
+        await self.__run_tasks(
+            [produce(), dispatch(), *(work() for _ in range(worker_count))]
+        )
+
+        return [results.get(episode.no, False) for episode in episodes]
 
     async def download(
-        self, start: int, end: int, batch_size: Optional[int] = None
+        self,
+        start: int,
+        end: int,
+        batch_size: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
     ) -> bool:
         """
         웹툰 다운로드 함수
@@ -457,7 +923,8 @@ class WebtoonDownloader:
         Args:
             start: 시작 화수 (1부터 시작)
             end: 끝 화수 (1부터 시작)
-            batch_size: 한 번에 처리할 배치 크기
+            batch_size: URL 수집 시 동시에 상세 페이지를 요청할 에피소드 수
+            max_concurrent: 최대 동시 이미지 다운로드 수 (기본값: 설정값)
 
         Returns:
             다운로드 성공 여부
@@ -465,10 +932,6 @@ class WebtoonDownloader:
         if not self.__episodes:
             raise ValueError("다운로드할 에피소드가 없습니다.")
 
-        # 설정에서 배치 크기 가져오기
-        if batch_size is None:
-            batch_size = self.__settings.batch_size
-
         # 1-based index를 0-based index로 변환
         start_idx: int = start - 1
         end_idx: int = end - 1
@@ -480,10 +943,38 @@ class WebtoonDownloader:
             )
 
         # 다운로드 할 에피소드 부분 추출
-        selected_episodes: List[EpisodeImageInfo] = self.__episodes[
+        selected_episodes: List[EpisodeInfo] = self.__episodes[
             start_idx : end_idx + 1
         ]
 
+        return await self.download_episodes(
+            selected_episodes, batch_size, max_concurrent
+        )
+
+    async def download_episodes(
+        self,
+        selected_episodes: List[EpisodeInfo],
+        batch_size: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+    ) -> bool:
+        """
+        지정한 에피소드들을 다운로드하는 함수 (화수 범위 대신 에피소드 목록을 직접 받음)
+
+        Args:
+            selected_episodes: 다운로드할 에피소드 리스트 (동기화 모드의 새 에피소드 등)
+            batch_size: URL 수집 시 동시에 상세 페이지를 요청할 에피소드 수
+            max_concurrent: 최대 동시 이미지 다운로드 수 (기본값: 설정값)
+
+        Returns:
+            다운로드 성공 여부
+        """
+        if not selected_episodes:
+            raise ValueError("다운로드할 에피소드가 없습니다.")
+
+        # 설정에서 URL 수집 동시 요청 수 가져오기
+        if batch_size is None:
+            batch_size = self.__settings.batch_size
+
         # Rich를 사용해서 예쁜 다운로드 시작 메시지 출력
         console = Console()
 
@@ -494,7 +985,7 @@ class WebtoonDownloader:
 
         table.add_row("웹툰 제목:", f"{self.__webtoon_title} ({self.__title_id})")
         table.add_row("에피소드 수:", f"{len(selected_episodes)}개")
-        table.add_row("배치 크기:", str(batch_size))
+        table.add_row("URL 수집 동시 요청:", str(batch_size))
         table.add_row(
             "다운로드 할 에피소드:",
             f"{selected_episodes[0].no}화 ~ {selected_episodes[-1].no}화",
@@ -513,6 +1004,12 @@ class WebtoonDownloader:
         )
         console.print(panel)
 
+        # 공유 세션이 없으면 다운로드가 끝날 때까지만 사용할 세션을 만든다
+        owns_http = self.__http is None
+        if owns_http:
+            self.__http = HttpSession(self.__settings)
+        await self.__http.open()
+
         try:
             # EpisodeInfo를 EpisodeImageInfo로 변환
             episode_image_infos: List[EpisodeImageInfo] = []
@@ -524,27 +1021,72 @@ class WebtoonDownloader:
                 )
                 episode_image_infos.append(episode_image_info)
 
-            # 배치 단위로 이미지 URL 수집
-            print("이미지 URL 수집 시작")
-            episodes_with_images = await self.get_episodes_with_images_batch(
-                episode_image_infos, batch_size
-            )
-
-            console.print(
-                f"\n[green]✓[/green] 총 {len(episodes_with_images)}개 에피소드의 이미지 URL 수집 완료!"
+            # 이전 실행의 다운로드 기록을 불러와 이미 완료된 에피소드는 상세 페이지 요청부터 건너뛴다
+            self.__manifest = DownloadManifest.load(
+                self.__get_title_dir(),
+                self.__title_id,
+                self.__settings.verify_checksum,
             )
+            pending_episodes = [
+                episode
+                for episode in episode_image_infos
+                if not self.__manifest.is_episode_complete(episode.no)
+            ]
+            skipped_count = len(episode_image_infos) - len(pending_episodes)
+
+            # 중복 제거는 이미지를 파일로 저장하는 files 모드에서만 사용
+            if (
+                self.__settings.deduplicate
+                and self.__settings.output_mode == OutputMode.files
+            ):
+                self.__store = ObjectStore.load(Path(self.__settings.download_path))
+            if skipped_count > 0:
+                console.print(
+                    f"[green]✓[/green] 이미 다운로드가 완료된 에피소드 {skipped_count}개를 건너뜁니다."
+                )
 
-            # 모든 에피소드의 이미지를 한꺼번에 다운로드 (동시성 제한 적용)
+            # 이미지 URL 수집과 다운로드를 파이프라인으로 동시에 진행
+            # (URL 수집이 끝난 에피소드부터 바로 이미지 다운로드 시작)
             console.print("\n[yellow]📥 다운로드 시작[/yellow]")
-            download_results = await self.__download_all_images_concurrent(
-                episodes_with_images
+            self.__reporter.emit(
+                "download_start",
+                title_id=self.__title_id,
+                title=self.__webtoon_title,
+                episodes=len(episode_image_infos),
+                pending=len(pending_episodes),
+                skipped=skipped_count,
+            )
+            self.__downloaded_images = 0
+            self.__downloaded_bytes = 0
+            start_time = time.perf_counter()
+            download_results = await self.__download_pipeline(
+                pending_episodes, batch_size, max_concurrent
             )
+            elapsed = time.perf_counter() - start_time
 
-            # 결과 요약
-            success_count = sum(download_results)
-            total_count = len(download_results)
+            # 결과 요약 (건너뛴 에피소드는 성공으로 집계)
+            success_count = sum(download_results) + skipped_count
+            total_count = len(episode_image_infos)
             success_rate = (success_count / total_count * 100) if total_count > 0 else 0
 
+            self.__reporter.emit(
+                "download_done",
+                title_id=self.__title_id,
+                success=success_rate == 100,
+                episodes=total_count,
+                succeeded=success_count,
+                skipped=skipped_count,
+                images=self.__downloaded_images,
+                bytes=self.__downloaded_bytes,
+                elapsed=round(elapsed, 3),
+                images_per_sec=round(self.__downloaded_images / elapsed, 2)
+                if elapsed > 0
+                else 0.0,
+                mb_per_sec=round(self.__downloaded_bytes / 2**20 / elapsed, 3)
+                if elapsed > 0
+                else 0.0,
+            )
+
             # 결과 테이블 생성
             result_table = Table(show_header=False, box=None, padding=(0, 1))
             result_table.add_column("라벨", style="cyan bold", width=12)
@@ -553,6 +1095,31 @@ class WebtoonDownloader:
             result_table.add_row("성공:", f"{success_count}개")
             result_table.add_row("전체:", f"{total_count}개")
             result_table.add_row("성공률:", f"{success_rate:.1f}%")
+            result_table.add_row("건너뜀:", f"{skipped_count}개 (이미 완료)")
+
+            # 공유 세션 덕분에 절약한 TCP/TLS 핸드셰이크 수 표시
+            stats = self.__http.stats
+            result_table.add_row(
+                "커넥션:",
+                f"신규 {stats.new_connections}개 / 재사용 {stats.reused_connections}개 ({stats.reuse_rate:.1f}%)",
+            )
+            result_table.add_row(
+                "요청:",
+                f"{stats.requests}개 (핸드셰이크 {stats.saved_handshakes}회 절약)",
+            )
+
+            # 중복 이미지 재사용 결과와 저장소 전체의 중복 제거 비율 표시
+            if self.__store is not None:
+                store_stats = await asyncio.to_thread(self.__store.stats)
+                result_table.add_row(
+                    "중복 제거:",
+                    f"재사용 {self.__store.reused}개 ({self.__store.saved_bytes / 2**20:.1f}MB 절약)",
+                )
+                result_table.add_row(
+                    "저장소:",
+                    f"{store_stats.objects}개 / {store_stats.stored_bytes / 2**20:.1f}MB "
+                    f"(중복 제거 비율 {store_stats.dedup_ratio:.2f}x)",
+                )
 
             # 성공률에 따라 색상 및 아이콘 결정
             if success_rate == 100:
@@ -580,11 +1147,27 @@ class WebtoonDownloader:
 
         except Exception as e:
             console.print(f"[red]❌ 다운로드 중 오류 발생: {e}[/red]")
+            self.__reporter.emit(
+                "download_error", title_id=self.__title_id, error=str(e)
+            )
             import traceback
 
             traceback.print_exc()
             return False
 
+        finally:
+            if self.__store is not None:
+                self.__store.save()
+                self.__store = None
+            # 중간에 멈춘 에피소드의 이미지 기록(저널)까지 매니페스트에 합쳐서 저장
+            if self.__manifest is not None:
+                self.__manifest.save()
+            # 공유 세션의 측정값은 세션을 만든 쪽(main.py / BatchDownloader)이 한 번만 쓴다
+            if owns_http:
+                export_metrics(self.__http.metrics, self.__settings)
+                await self.__http.close()
+                self.__http = None
+
     @property
     def title_id(self) -> int:
         """타이틀 id"""
@@ -609,6 +1192,8 @@ class WebtoonDownloader:
 # WebtoonDownloader 테스트 함수
 async def test_downloader(title_id: int, start: int, end: int):
     """WebtoonDownloader의 download() 함수를 테스트"""
+    # 분석 ~ 다운로드 전체에서 공유할 HTTP 세션
+    http = HttpSession()
     try:
         # Rich를 사용해서 웹툰 정보 수집 과정을 표시 (하나의 패널에서 상태 갱신)
         console = Console()
@@ -647,7 +1232,7 @@ async def test_downloader(title_id: int, start: int, end: int):
         with Live(
             analyzer_panel(title_id), console=console, refresh_per_second=4
         ) as live:
-            analyzer = await WebtoonAnalyzer.create(title_id)
+            analyzer = await WebtoonAnalyzer.create(title_id, http=http)
             live.update(analyzer_panel(title_id, analyzer))
 
         # 성인 웹툰 인증용 쿠키
@@ -673,6 +1258,7 @@ async def test_downloader(title_id: int, start: int, end: int):
             analyzer.webtoon_type,
             nid_aut,
             nid_ses,
+            http=http,
         )
 
         success = await downloader.download(start, end)
@@ -681,6 +1267,9 @@ async def test_downloader(title_id: int, start: int, end: int):
     except Exception as e:
         print(f"테스트 중 오류 발생: {e}")
 
+    finally:
+        await http.close()
+
 
 async def test_case():
     """WebtoonDownloader 테스트 - 지정된 title ID들로 테스트"""
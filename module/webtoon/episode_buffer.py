@@ -0,0 +1,151 @@
+import tempfile
+from typing import Dict, List, Sequence, Tuple, Union, overload
+
+import aiohttp
+
+from module.webtoon.manifest import FileDigest
+from module.webtoon.part_file import IncompleteDownloadError
+
+
+class EpisodeBuffer:
+    """
+    에피소드 하나의 이미지 바이트를 파일로 저장하지 않고 모아두는 버퍼 (strip / cbz 모드용)
+
+    SpooledTemporaryFile 을 사용해서 모은 크기가 max_memory 이하면 메모리에만 두고,
+    넘으면 자동으로 임시 파일로 옮긴다. (이미지 순서와 상관없이 받는 대로 뒤에 붙이고
+    순번별 위치만 기록해두었다가, 병합할 때 순번 순서대로 꺼낸다)
+
+    cbz 모드에서는 pop_ready() 로 차례가 된 이미지만 바로 꺼내 아카이브에 쓰고,
+    순서가 앞선 이미지를 기다리는 동안만 뒤의 이미지를 버퍼에 보관한다.
+    """
+
+    def __init__(self, image_count: int, max_memory: int) -> None:
+        self.__image_count = image_count
+        self.__file = tempfile.SpooledTemporaryFile(max_size=max_memory)
+        self.__spans: Dict[int, Tuple[int, int]] = {}  # 이미지 순번 -> (시작 위치, 크기)
+        self.__size = 0
+        self.__added = 0  # 지금까지 받은 이미지 수
+        self.__next_idx = 0  # pop_ready() 로 다음에 꺼낼 순번
+
+    def add(self, idx: int, data: Union[bytes, bytearray]) -> None:
+        """받은 이미지 바이트를 버퍼 끝에 붙이고 위치를 기록한다."""
+        self.__file.seek(self.__size)
+        self.__file.write(data)
+        self.__spans[idx] = (self.__size, len(data))
+        self.__size += len(data)
+        self.__added += 1
+
+    def read(self, idx: int) -> bytes:
+        """순번에 해당하는 이미지 바이트를 읽는다."""
+        start, size = self.__spans[idx]
+        self.__file.seek(start)
+        return self.__file.read(size)
+
+    def images(self) -> "BufferImages":
+        """
+        받은 이미지를 순번 순서대로 하나씩 읽는 시퀀스
+        (병합 스레드가 필요한 이미지만 그때그때 읽으므로 에피소드 전체를 메모리에 올리지 않는다)
+        """
+        return BufferImages(self, sorted(self.__spans))
+
+    def pop_ready(self) -> List[Tuple[int, bytes]]:
+        """
+        앞 순번부터 빠짐없이 이어지는 이미지들을 꺼내는 함수
+
+        Returns:
+            (순번, 이미지 바이트) 리스트 (앞 순번 이미지를 아직 못 받았으면 빈 리스트)
+        """
+        ready = []
+        while self.__next_idx in self.__spans:
+            ready.append((self.__next_idx, self.read(self.__next_idx)))
+            del self.__spans[self.__next_idx]
+            self.__next_idx += 1
+
+        # 기다리는 이미지가 없으면 버퍼를 비워서 메모리 / 임시 파일 크기를 다시 줄인다
+        if not self.__spans:
+            self.__file.seek(0)
+            self.__file.truncate()
+            self.__size = 0
+        return ready
+
+    def close(self) -> None:
+        """버퍼를 닫는다. (임시 파일로 옮겨졌으면 삭제됨)"""
+        self.__file.close()
+
+    @property
+    def complete(self) -> bool:
+        """모든 이미지를 받았으면 True"""
+        return self.__added == self.__image_count
+
+    @property
+    def size(self) -> int:
+        """지금 버퍼에 들어있는 바이트 수"""
+        return self.__size
+
+    @property
+    def spilled(self) -> bool:
+        """메모리 한도를 넘어서 임시 파일로 옮겨졌으면 True"""
+        return bool(getattr(self.__file, "_rolled", False))
+
+
+class BufferImages(Sequence[bytes]):
+    """EpisodeBuffer 의 이미지를 인덱스로 접근할 때마다 읽어오는 시퀀스 (EpisodeBuffer.images() 참고)"""
+
+    def __init__(self, buffer: EpisodeBuffer, order: List[int]) -> None:
+        self.__buffer = buffer
+        self.__order = order  # 시퀀스 위치 -> 이미지 순번
+
+    def __len__(self) -> int:
+        return len(self.__order)
+
+    @overload
+    def __getitem__(self, index: int) -> bytes: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[bytes]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[bytes, List[bytes]]:
+        if isinstance(index, slice):
+            return [self.__buffer.read(idx) for idx in self.__order[index]]
+        return self.__buffer.read(self.__order[index])
+
+
+class BufferedImage:
+    """
+    PartFile 대신 사용하는 다운로드 대상 (응답 본문을 EpisodeBuffer 에 넣는다)
+
+    메모리에 받으므로 이어받기는 하지 않고, 실패하면 다음 시도에서 처음부터 다시 받는다.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, buffer: EpisodeBuffer, img_idx: int) -> None:
+        self.__buffer = buffer
+        self.__img_idx = img_idx
+
+    def request_headers(self) -> Dict[str, str]:
+        return {}
+
+    def discard(self) -> None:
+        pass
+
+    async def write(self, response: aiohttp.ClientResponse) -> FileDigest:
+        """
+        응답 본문을 모두 받은 뒤 버퍼에 넣는 함수
+
+        Args:
+            response: 상태 코드가 200 인 응답
+
+        Returns:
+            받은 이미지의 크기 (버퍼에 받은 이미지는 매니페스트에 기록하지 않으므로 체크섬은 계산하지 않음)
+        """
+        total = response.content_length
+        data = bytearray()
+        async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+            data.extend(chunk)
+
+        if total is not None and len(data) != total:
+            raise IncompleteDownloadError(f"{len(data)}/{total} 바이트만 받았습니다.")
+
+        self.__buffer.add(self.__img_idx, data)
+        return FileDigest(len(data), "")
@@ -0,0 +1,89 @@
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Hashable
+
+
+class FairSemaphore:
+    """
+    여러 작업(웹툰)이 하나의 동시 요청 한도를 공정하게 나눠 쓰도록 하는 세마포어
+
+    asyncio.Semaphore 는 먼저 기다린 순서(FIFO)대로 자리를 주기 때문에
+    이미지가 수만 장인 웹툰이 대기열을 가득 채우면 작은 웹툰은 그 뒤에서 한참 기다려야 한다.
+    이 세마포어는 작업(owner)마다 대기열을 따로 두고, 자리가 나면 작업들을
+    라운드 로빈으로 돌아가며 하나씩 깨운다. (대기 중인 작업이 N개면 각 작업이 1/N 씩 사용)
+
+    사용 예)
+        scheduler = FairSemaphore(10)
+        async with scheduler.slot(title_id):
+            await session.get(...)
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("limit 은 1 이상이어야 합니다.")
+        self.__limit = limit
+        self.__active = 0  # 사용 중인 자리 수
+        # owner -> 대기 중인 요청들 (맨 앞 owner 가 다음 차례)
+        self.__waiters: "OrderedDict[Hashable, Deque[asyncio.Future]]" = OrderedDict()
+        self.__granted: Dict[Hashable, int] = {}  # owner 별로 자리를 받은 횟수 (통계용)
+
+    async def acquire(self, owner: Hashable) -> None:
+        """owner 의 차례가 올 때까지 기다렸다가 자리 하나를 차지한다."""
+        if self.__active < self.__limit and not self.__waiters:
+            self.__active += 1
+            self.__granted[owner] = self.__granted.get(owner, 0) + 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self.__waiters.setdefault(owner, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 자리를 넘겨받은 직후 취소된 경우 다음 차례에게 다시 넘긴다
+                self.release()
+            else:
+                queue = self.__waiters.get(owner)
+                if queue is not None and future in queue:
+                    queue.remove(future)
+                    if not queue:
+                        del self.__waiters[owner]
+            raise
+        self.__granted[owner] = self.__granted.get(owner, 0) + 1
+
+    def release(self) -> None:
+        """자리를 반납한다. 기다리는 요청이 있으면 다음 차례의 owner 에게 바로 넘긴다."""
+        while self.__waiters:
+            owner, queue = next(iter(self.__waiters.items()))
+            future = queue.popleft()
+            if queue:
+                # 이번 차례를 쓴 owner 는 맨 뒤로 보낸다 (라운드 로빈)
+                self.__waiters.move_to_end(owner)
+            else:
+                del self.__waiters[owner]
+
+            if not future.done():
+                future.set_result(None)  # 자리를 그대로 넘겨주므로 사용 중인 수는 그대로
+                return
+
+        self.__active -= 1
+
+    @asynccontextmanager
+    async def slot(self, owner: Hashable) -> AsyncIterator[None]:
+        """async with 로 자리를 차지하고, 블록이 끝나면 반납한다."""
+        await self.acquire(owner)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @property
+    def limit(self) -> int:
+        """전체 동시 요청 한도"""
+        return self.__limit
+
+    @property
+    def granted(self) -> Dict[Hashable, int]:
+        """owner 별로 자리를 받은 횟수"""
+        return dict(self.__granted)
@@ -0,0 +1,133 @@
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+# 이미지 뷰어 div 의 class 이름 (div.wt_viewer)
+VIEWER_CLASS = "wt_viewer"
+
+
+class _ViewerClosed(Exception):
+    """뷰어 div 가 닫혀서 더 이상 파싱할 필요가 없을 때 사용하는 내부 예외"""
+
+
+class _ViewerImageParser(HTMLParser):
+    """div.wt_viewer 안의 img[src] 만 모으고, 뷰어 div 가 닫히면 파싱을 멈추는 파서"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.img_urls: List[str] = []
+        self.found = False  # 뷰어 div 를 찾았는지
+        self.closed = False  # 뷰어 div 가 닫혔는지
+        self.__depth = 0  # 뷰어 div 안에서 열려있는 div 수
+
+    def handle_starttag(
+        self, tag: str, attrs: List[Tuple[str, Optional[str]]]
+    ) -> None:
+        if self.__depth == 0:
+            if tag == "div" and VIEWER_CLASS in (dict(attrs).get("class") or "").split():
+                self.found = True
+                self.__depth = 1
+            return
+
+        if tag == "div":
+            self.__depth += 1
+        elif tag == "img":
+            src = dict(attrs).get("src")
+            if src:
+                self.img_urls.append(src)
+
+    def handle_startendtag(
+        self, tag: str, attrs: List[Tuple[str, Optional[str]]]
+    ) -> None:
+        # <img ... /> 형태도 같은 방식으로 처리 (self-closing div 는 깊이에 영향 없음)
+        if tag == "img" and self.__depth > 0:
+            src = dict(attrs).get("src")
+            if src:
+                self.img_urls.append(src)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.__depth > 0 and tag == "div":
+            self.__depth -= 1
+            if self.__depth == 0:
+                self.closed = True
+                raise _ViewerClosed()
+
+
+def extract_image_urls_fast(html: str) -> Optional[List[str]]:
+    """
+    상세 페이지 HTML 에서 div.wt_viewer 안의 이미지 URL 을 빠르게 추출하는 함수
+
+    전체 문서를 트리로 만들지 않고, 뷰어 div 가 시작되는 위치부터 스트리밍 파싱하다가
+    뷰어 div 가 닫히면 바로 멈춘다. (앞쪽 <head> / 스크립트와 뒤쪽 댓글 영역은 읽지 않음)
+
+    Args:
+        html: 상세 페이지 HTML
+
+    Returns:
+        이미지 URL 리스트, 페이지 구조가 예상과 달라 확신할 수 없으면 None
+    """
+    # class 속성에 wt_viewer 가 처음 등장하는 <div 태그부터 파싱한다
+    marker = html.find(VIEWER_CLASS)
+    while marker != -1:
+        start = html.rfind("<div", 0, marker)
+        # marker 가 해당 <div 태그 안(태그가 닫히기 전)에 있는지 확인
+        if start != -1 and html.find(">", start, marker) == -1:
+            break
+        marker = html.find(VIEWER_CLASS, marker + len(VIEWER_CLASS))
+    else:
+        return None
+
+    parser = _ViewerImageParser()
+    try:
+        parser.feed(html[start:])
+        parser.close()
+    except _ViewerClosed:
+        pass
+
+    # 뷰어를 못 찾았거나, 닫히지 않았거나, 이미지가 하나도 없으면 구조가 바뀐 것으로 본다
+    if not parser.found or not parser.closed or not parser.img_urls:
+        return None
+    return parser.img_urls
+
+
+def extract_image_urls_bs4(html: str) -> List[str]:
+    """
+    BeautifulSoup 으로 전체 문서를 파싱해서 div.wt_viewer 안의 이미지 URL 을 추출하는 함수
+    (빠른 추출기가 실패했을 때 사용하는 기존 방식)
+
+    Args:
+        html: 상세 페이지 HTML
+
+    Returns:
+        이미지 URL 리스트 (뷰어가 없으면 빈 리스트)
+    """
+    # 빠른 추출기가 성공하면 필요 없으므로 실제로 사용할 때만 불러온다
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "lxml")
+    viewer = soup.select_one(f"div.{VIEWER_CLASS}")
+    if viewer is None:
+        return []
+
+    img_urls: List[str] = []
+    for img in viewer.find_all("img"):
+        src = img.get("src")  # type: ignore
+        if src:
+            img_urls.append(src)  # type: ignore
+    return img_urls
+
+
+def extract_image_urls(html: str) -> List[str]:
+    """
+    상세 페이지 HTML 에서 이미지 URL 을 추출하는 함수
+    (빠른 추출기를 먼저 사용하고, 실패하면 BeautifulSoup 으로 다시 파싱)
+
+    Args:
+        html: 상세 페이지 HTML
+
+    Returns:
+        이미지 URL 리스트
+    """
+    img_urls = extract_image_urls_fast(html)
+    if img_urls is None:
+        img_urls = extract_image_urls_bs4(html)
+    return img_urls
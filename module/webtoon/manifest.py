@@ -0,0 +1,325 @@
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, TextIO
+
+
+class FileDigest(NamedTuple):
+    """다운로드한 파일의 크기와 체크섬"""
+
+    size: int
+    sha256: str
+
+
+@dataclass
+class ImageRecord:
+    """다운로드가 완료된 이미지 하나의 기록"""
+
+    url: str
+    file: str  # 웹툰 폴더 기준 상대 경로
+    size: int
+    sha256: str
+
+
+@dataclass
+class EpisodeRecord:
+    """에피소드 하나의 다운로드 기록"""
+
+    subtitle: str = ""
+    image_count: int = 0  # 상세 페이지에서 찾은 이미지 수
+    complete: bool = False
+    images: Dict[str, ImageRecord] = field(default_factory=dict)  # 이미지 순번(0부터) -> 기록
+    # strip / cbz 모드로 받은 경우 이미지 대신 결과 파일(병합 이미지, 아카이브)을 기록 (파일 이름 -> 기록)
+    outputs: Dict[str, ImageRecord] = field(default_factory=dict)
+
+
+class DownloadManifest:
+    """
+    웹툰별 다운로드 기록(매니페스트)을 관리하는 클래스
+
+    Webtoon_Download/<웹툰 제목>/.nwebtoon_manifest.json 에 완료된 이미지의 URL, 크기, 체크섬을 기록해두고
+    다시 실행했을 때 이미 받은 이미지와 에피소드는 건너뛸 수 있게 한다.
+
+    매니페스트 파일은 에피소드가 끝날 때만 다시 쓰고, 그 사이에 받은 이미지는
+    .nwebtoon_manifest.journal 에 덧붙여 둔다. 중간에 종료되어도 다음 실행에서
+    저널을 다시 반영하므로 이미 검증한 이미지는 다시 받지 않는다.
+    (저널은 JOURNAL_BATCH_SIZE 줄씩 모아서 한 번에 쓰므로 종료 직전의 몇 줄은 잃을 수 있고,
+     그 이미지는 다음 실행에서 다시 받는다)
+
+    파일을 읽고 쓰는 메서드는 작업자 스레드(asyncio.to_thread)에서 실행하므로
+    기록을 읽고 쓰는 메서드는 모두 잠금 안에서 실행한다.
+    """
+
+    FILE_NAME = ".nwebtoon_manifest.json"
+    JOURNAL_NAME = ".nwebtoon_manifest.journal"
+    JOURNAL_BATCH_SIZE = 32  # 저널에 한 번에 쓰는 기록 줄 수
+    VERSION = 1
+
+    def __init__(self, title_dir: Path, title_id: int, verify_checksum: bool = False) -> None:
+        self.__title_dir = title_dir
+        self.__path = title_dir / self.FILE_NAME
+        self.__journal_path = title_dir / self.JOURNAL_NAME
+        self.__journal: Optional[TextIO] = None  # 첫 기록 때 추가 모드로 연다
+        self.__journal_pending: List[str] = []  # 아직 저널에 쓰지 않은 기록 줄
+        self.__title_id = title_id
+        # True 면 파일 크기뿐 아니라 체크섬까지 다시 계산해서 검증한다 (느리지만 확실함)
+        self.__verify_checksum = verify_checksum
+        self.__episodes: Dict[str, EpisodeRecord] = {}
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls, title_dir: Path, title_id: int, verify_checksum: bool = False
+    ) -> "DownloadManifest":
+        """매니페스트 파일과 남아 있는 저널을 읽어서 객체를 만든다. (없거나 손상된 경우 빈 매니페스트)"""
+        manifest = cls(title_dir, title_id, verify_checksum)
+        try:
+            with open(manifest.__path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != cls.VERSION or data.get("title_id") != title_id:
+                # 다른 웹툰이나 다른 형식의 기록이면 저널도 믿을 수 없다
+                return manifest
+            for no, episode in data.get("episodes", {}).items():
+                images = {
+                    idx: ImageRecord(**image)
+                    for idx, image in episode.pop("images", {}).items()
+                }
+                outputs = {
+                    name: ImageRecord(**output)
+                    for name, output in episode.pop("outputs", {}).items()
+                }
+                manifest.__episodes[no] = EpisodeRecord(
+                    **episode, images=images, outputs=outputs
+                )
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"매니페스트 파일이 손상되어 새로 작성합니다. ({e})")
+        manifest.__replay_journal()
+        return manifest
+
+    def __replay_journal(self) -> None:
+        """지난 실행이 매니페스트를 저장하기 전에 남긴 저널을 반영한다."""
+        try:
+            with open(self.__journal_path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                if "image" in entry:
+                    self.__set_image(
+                        entry["episode"],
+                        entry["image"],
+                        ImageRecord(
+                            url=entry["url"],
+                            file=entry["file"],
+                            size=entry["size"],
+                            sha256=entry["sha256"],
+                        ),
+                    )
+                else:
+                    self.__set_episode(
+                        entry["episode"], entry["subtitle"], entry["image_count"]
+                    )
+            except (ValueError, TypeError, KeyError):
+                # 종료 직전에 쓰다 만 마지막 줄
+                continue
+
+    def __append_journal(self, entry: Dict[str, Any]) -> None:
+        """저널에 쓸 기록 한 줄을 모아둔다. (파일에는 쓰지 않음)"""
+        self.__journal_pending.append(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def __flush_journal(self) -> None:
+        """모아둔 기록을 저널 끝에 덧붙인다. (다음 save() 까지 유지)"""
+        if not self.__journal_pending:
+            return
+        if self.__journal is None:
+            self.__title_dir.mkdir(parents=True, exist_ok=True)
+            self.__journal = open(self.__journal_path, "a", encoding="utf-8")
+            if self.__journal.tell() > 0:
+                # 지난 실행이 쓰다 만 줄과 이어지지 않도록 줄을 바꿔둔다 (빈 줄은 읽을 때 건너뜀)
+                self.__journal.write("\n")
+        self.__journal.write("".join(self.__journal_pending))
+        self.__journal.flush()
+        self.__journal_pending.clear()
+
+    def save(self) -> None:
+        """임시 파일에 쓴 뒤 교체해서 중간에 종료돼도 매니페스트가 깨지지 않게 저장한다."""
+        with self.__lock:
+            self.__save()
+
+    def __save(self) -> None:
+        self.__title_dir.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": self.VERSION,
+            "title_id": self.__title_id,
+            "episodes": {no: asdict(episode) for no, episode in self.__episodes.items()},
+        }
+        tmp_path = self.__path.with_name(self.__path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.__path)
+
+        # 저널의 내용과 모아둔 기록은 모두 매니페스트에 들어갔으므로 비운다
+        # (교체 직후 종료되어 저널이 남아도 같은 기록을 다시 반영할 뿐이다)
+        self.__journal_pending.clear()
+        if self.__journal is not None:
+            self.__journal.close()
+            self.__journal = None
+        try:
+            os.remove(self.__journal_path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def file_digest(path: Path) -> FileDigest:
+        """파일의 크기와 sha256 체크섬을 계산한다."""
+        sha256 = hashlib.sha256()
+        size = 0
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha256.update(chunk)
+                size += len(chunk)
+        return FileDigest(size, sha256.hexdigest())
+
+    def __verify(self, record: ImageRecord) -> bool:
+        """기록된 파일이 실제로 존재하고 크기(및 체크섬)가 일치하는지 확인한다."""
+        path = self.__title_dir / record.file
+        try:
+            if path.stat().st_size != record.size:
+                return False
+        except OSError:
+            return False
+        if self.__verify_checksum:
+            return self.file_digest(path).sha256 == record.sha256
+        return True
+
+    def __relative(self, file_path: Path) -> str:
+        return Path(os.path.relpath(file_path, self.__title_dir)).as_posix()
+
+    def is_episode_complete(self, no: int) -> bool:
+        """에피소드의 모든 이미지(strip / cbz 모드는 결과 파일)가 받아져 있고 검증을 통과하면 True"""
+        with self.__lock:
+            episode = self.__episodes.get(str(no))
+            if episode is None or not episode.complete:
+                return False
+            if episode.outputs:
+                return all(self.__verify(record) for record in episode.outputs.values())
+            if len(episode.images) != episode.image_count:
+                return False
+            return all(self.__verify(record) for record in episode.images.values())
+
+    def is_image_complete(self, no: int, img_idx: int, url: str, file_path: Path) -> bool:
+        """같은 URL의 이미지가 같은 경로에 이미 받아져 있으면 True"""
+        with self.__lock:
+            episode = self.__episodes.get(str(no))
+            record = None if episode is None else episode.images.get(str(img_idx))
+        if record is None or record.url != url:
+            return False
+        if record.file != self.__relative(file_path):
+            return False
+        return self.__verify(record)
+
+    def start_episode(self, no: int, subtitle: str, image_count: int) -> None:
+        """
+        상세 페이지에서 이미지 수를 알아낸 에피소드를 기록한다.
+        (이벤트 루프에서 호출하므로 저널에는 모아두기만 하고, 다음 record_image() 가 함께 쓴다)
+        """
+        with self.__lock:
+            self.__set_episode(str(no), subtitle, image_count)
+            self.__append_journal(
+                {"episode": str(no), "subtitle": subtitle, "image_count": image_count}
+            )
+
+    def __set_episode(self, no: str, subtitle: str, image_count: int) -> None:
+        episode = self.__episodes.setdefault(no, EpisodeRecord())
+        episode.subtitle = subtitle
+        if episode.image_count != image_count:
+            # 이미지 구성이 바뀌었으면 이전 기록은 믿을 수 없으므로 처음부터 다시 기록한다
+            episode.complete = False
+            episode.images.clear()
+            episode.outputs.clear()
+        episode.image_count = image_count
+
+    def record_image(
+        self, no: int, img_idx: int, url: str, file_path: Path, digest: FileDigest
+    ) -> None:
+        """
+        다운로드가 끝난 이미지를 기록한다. (에피소드가 끝나기 전에도 저널에 모아서 남긴다)
+
+        저널을 쓸 수 있으므로 asyncio.to_thread 로 실행한다.
+        """
+        record = ImageRecord(
+            url=url,
+            file=self.__relative(file_path),
+            size=digest.size,
+            sha256=digest.sha256,
+        )
+        with self.__lock:
+            self.__set_image(str(no), str(img_idx), record)
+            self.__append_journal(
+                {"episode": str(no), "image": str(img_idx), **asdict(record)}
+            )
+            if len(self.__journal_pending) >= self.JOURNAL_BATCH_SIZE:
+                self.__flush_journal()
+
+    def __set_image(self, no: str, img_idx: str, record: ImageRecord) -> None:
+        episode = self.__episodes.setdefault(no, EpisodeRecord())
+        episode.images[img_idx] = record
+
+    def finish_episode(self, no: int, success: bool) -> None:
+        """에피소드 다운로드 결과를 기록하고 매니페스트를 저장한다. (asyncio.to_thread 로 실행)"""
+        with self.__lock:
+            episode = self.__episodes.setdefault(str(no), EpisodeRecord())
+            episode.complete = success and len(episode.images) == episode.image_count
+            self.__save()
+
+    def finish_episode_outputs(self, no: int, output_paths: List[Path]) -> None:
+        """
+        이미지 파일 대신 결과 파일로 저장한 에피소드를 완료로 기록하고 매니페스트를 저장한다.
+        (strip 모드의 병합 결과 파일, cbz 모드의 아카이브 크기와 체크섬을 기록)
+
+        결과 파일 전체의 체크섬을 계산하므로 asyncio.to_thread 로 실행한다.
+        """
+        # 체크섬은 잠금 밖에서 계산해서 다른 에피소드의 기록을 막지 않는다
+        outputs: Dict[str, ImageRecord] = {}
+        for output_path in output_paths:
+            digest = self.file_digest(output_path)
+            outputs[output_path.name] = ImageRecord(
+                url="",
+                file=self.__relative(output_path),
+                size=digest.size,
+                sha256=digest.sha256,
+            )
+        with self.__lock:
+            episode = self.__episodes.setdefault(str(no), EpisodeRecord())
+            episode.images.clear()
+            episode.outputs = outputs
+            episode.complete = True
+            self.__save()
+
+    @property
+    def completed_episodes(self) -> set[int]:
+        """완료로 기록된 에피소드 번호 집합 (파일 검증은 하지 않음)"""
+        with self.__lock:
+            return {
+                int(no) for no, episode in self.__episodes.items() if episode.complete
+            }
+
+    @property
+    def incomplete_episodes(self) -> set[int]:
+        """다운로드를 시작했지만 완료되지 않은 에피소드 번호 집합"""
+        with self.__lock:
+            return {
+                int(no) for no, episode in self.__episodes.items() if not episode.complete
+            }
+
+    @property
+    def path(self) -> Path:
+        """매니페스트 파일 경로"""
+        return self.__path
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class CacheEntry:
+    """캐시 파일 하나에 저장되는 API 응답"""
+
+    url: str
+    fetched_at: float  # 마지막으로 서버에서 확인한 시각 (time.time())
+    data: Any  # API 응답 JSON
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, ttl_seconds: float) -> bool:
+        """TTL 이 지나지 않아 서버에 다시 묻지 않아도 되면 True"""
+        return (time.time() - self.fetched_at) < ttl_seconds
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """재검증 요청에 사용할 If-None-Match / If-Modified-Since 헤더"""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class MetadataCache:
+    """
+    WebtoonAnalyzer 가 요청하는 info / list API 응답을 디스크에 저장하는 캐시 클래스
+
+    - TTL 안의 응답은 요청 없이 그대로 사용한다.
+    - TTL 이 지나면 ETag / Last-Modified 로 조건부 요청을 보내고, 304 면 저장된 응답을 재사용한다.
+    - 오프라인 모드에서는 TTL 과 상관없이 캐시만 사용한다.
+
+    캐시 키는 요청 URL(titleId, page 포함) + 로그인 쿠키 사용 여부이며, 쿠키 값 자체는 저장하지 않는다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ttl_seconds: float,
+        offline: bool = False,
+        enabled: bool = True,
+    ) -> None:
+        self.__cache_dir = Path(cache_dir)
+        self.__ttl_seconds = ttl_seconds
+        self.__offline = offline
+        self.__enabled = enabled or offline
+
+    def __path(self, url: str, authenticated: bool) -> Path:
+        key = f"{url}|{'auth' if authenticated else 'anon'}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.__cache_dir / f"{digest}.json"
+
+    def load(self, url: str, authenticated: bool) -> Optional[CacheEntry]:
+        """저장된 응답을 읽는다. (없거나 손상된 경우 None)"""
+        if not self.__enabled:
+            return None
+        try:
+            with open(self.__path(url, authenticated), encoding="utf-8") as f:
+                return CacheEntry(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, entry: CacheEntry, authenticated: bool) -> None:
+        """응답을 저장한다. (임시 파일에 쓴 뒤 교체)"""
+        if not self.__enabled:
+            return
+        self.__cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.__path(entry.url, authenticated)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(entry), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def store(
+        self,
+        url: str,
+        authenticated: bool,
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """서버에서 새로 받은 응답을 저장한다."""
+        self.save(
+            CacheEntry(
+                url=url,
+                fetched_at=time.time(),
+                data=data,
+                etag=etag,
+                last_modified=last_modified,
+            ),
+            authenticated,
+        )
+
+    def touch(self, entry: CacheEntry, authenticated: bool) -> None:
+        """304 응답으로 재검증된 항목의 확인 시각을 갱신한다."""
+        entry.fetched_at = time.time()
+        self.save(entry, authenticated)
+
+    @property
+    def ttl_seconds(self) -> float:
+        """캐시 유지 시간(초)"""
+        return self.__ttl_seconds
+
+    @property
+    def offline(self) -> bool:
+        """오프라인 모드 여부 (True 면 네트워크 요청 없이 캐시만 사용)"""
+        return self.__offline
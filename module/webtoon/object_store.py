@@ -0,0 +1,247 @@
+import asyncio
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+import aiohttp
+
+from module.webtoon.manifest import FileDigest
+from module.webtoon.part_file import PartFile
+
+
+class StoreStats(NamedTuple):
+    """객체 저장소의 중복 제거 통계"""
+
+    objects: int  # 저장된 이미지(blob) 수
+    stored_bytes: int  # 실제로 디스크에 저장된 크기
+    logical_bytes: int  # 에피소드 폴더에서 보이는 전체 크기 (하드 링크 수 기준)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """중복 제거 비율 (logical / stored, 1.0 이면 중복 없음)"""
+        return self.logical_bytes / self.stored_bytes if self.stored_bytes else 1.0
+
+
+class ObjectStore:
+    """
+    이미지를 내용(sha256) 기준으로 한 번만 저장하는 저장소
+
+    Webtoon_Download/.objects/ab/abcdef... 에 이미지를 한 번만 저장하고
+    에피소드 폴더의 이미지 파일은 이 blob 을 가리키는 하드 링크로 만든다.
+    (공지 배너, 엔딩 컷처럼 여러 에피소드에 반복되는 이미지는 디스크를 한 번만 사용)
+
+    index.json 에 URL -> 해시, (ETag, 크기) -> 해시를 기록해두고
+    - 같은 URL 은 요청 없이 바로 링크하고
+    - 처음 보는 URL 이라도 HEAD 응답의 ETag / Content-Length 가 같으면 GET 없이 링크한다.
+    하드 링크를 만들 수 없는 파일시스템에서는 복사로 대신한다. (중복 제거 효과 없음)
+
+    파일시스템 작업이 있는 find / link / add / stats 는 asyncio.to_thread 로 실행하므로
+    색인과 통계는 잠금 안에서 고친다.
+    """
+
+    DIR_NAME = ".objects"
+    INDEX_NAME = "index.json"
+    VERSION = 1
+
+    def __init__(self, download_path: Path) -> None:
+        self.__root = download_path / self.DIR_NAME
+        self.__index_path = self.__root / self.INDEX_NAME
+        self.__urls: Dict[str, str] = {}  # 이미지 URL -> sha256
+        self.__etags: Dict[str, str] = {}  # "ETag|크기" -> sha256
+
+        # 이번 실행에서 다운로드 없이 링크한 이미지 수와 절약한 바이트 수
+        self.__reused = 0
+        self.__saved_bytes = 0
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def load(cls, download_path: Path) -> "ObjectStore":
+        """저장소 색인을 읽어서 객체를 만든다. (없거나 손상된 경우 빈 색인)"""
+        store = cls(download_path)
+        try:
+            with open(store.__index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == cls.VERSION:
+                store.__urls = dict(data.get("urls", {}))
+                store.__etags = dict(data.get("etags", {}))
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"저장소 색인이 손상되어 새로 작성합니다. ({e})")
+        return store
+
+    def save(self) -> None:
+        """임시 파일에 쓴 뒤 교체해서 중간에 종료돼도 색인이 깨지지 않게 저장한다."""
+        self.__root.mkdir(parents=True, exist_ok=True)
+        with self.__lock:
+            data = {
+                "version": self.VERSION,
+                "urls": dict(self.__urls),
+                "etags": dict(self.__etags),
+            }
+        tmp_path = self.__index_path.with_name(self.__index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.__index_path)
+
+    def blob_path(self, sha256: str) -> Path:
+        """해시에 해당하는 blob 경로 (.objects/ab/abcdef...)"""
+        return self.__root / sha256[:2] / sha256
+
+    @staticmethod
+    def __etag_key(etag: str, size: int) -> str:
+        return f"{etag}|{size}"
+
+    def find(
+        self, url: str, etag: Optional[str] = None, size: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        이미 저장된 이미지인지 찾는 함수
+
+        Args:
+            url: 이미지 URL
+            etag: HEAD 응답의 ETag
+            size: HEAD 응답의 Content-Length
+
+        Returns:
+            저장된 blob 의 sha256 (없으면 None)
+        """
+        with self.__lock:
+            sha256 = self.__urls.get(url)
+            if sha256 is None and etag and size is not None:
+                sha256 = self.__etags.get(self.__etag_key(etag, size))
+        if sha256 is None or not self.blob_path(sha256).is_file():
+            return None
+        return sha256
+
+    def link(self, sha256: str, file_path: Path, url: Optional[str] = None) -> FileDigest:
+        """
+        저장된 blob 을 에피소드 폴더의 이미지 파일로 연결하는 함수 (다운로드 없이 재사용)
+
+        Args:
+            sha256: 연결할 blob 의 해시
+            file_path: 만들 이미지 파일 경로
+            url: ETag 로 찾은 경우 이미지 URL (다음 실행부터 요청 없이 URL 로 찾도록 기록)
+
+        Returns:
+            연결한 이미지의 크기와 체크섬
+        """
+        blob = self.blob_path(sha256)
+        size = blob.stat().st_size
+        self.__place(blob, file_path)
+        with self.__lock:
+            if url is not None:
+                self.__urls[url] = sha256
+            self.__reused += 1
+            self.__saved_bytes += size
+        return FileDigest(size, sha256)
+
+    @property
+    def has_etags(self) -> bool:
+        """ETag 로 찾을 수 있는 이미지가 하나라도 있으면 True (없으면 HEAD 요청을 할 필요가 없음)"""
+        return bool(self.__etags)
+
+    def add(
+        self, file_path: Path, url: str, etag: Optional[str], digest: FileDigest
+    ) -> None:
+        """
+        새로 받은 이미지 파일을 저장소에 넣고, 파일은 blob 을 가리키게 바꾸는 함수
+        (같은 내용의 blob 이 이미 있으면 받은 파일 대신 기존 blob 에 연결)
+        """
+        blob = self.blob_path(digest.sha256)
+        if blob.is_file():
+            self.__place(blob, file_path)
+        else:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(file_path, blob)
+            except OSError:
+                shutil.copyfile(file_path, blob)
+
+        with self.__lock:
+            self.__urls[url] = digest.sha256
+            if etag:
+                self.__etags[self.__etag_key(etag, digest.size)] = digest.sha256
+
+    @staticmethod
+    def __place(blob: Path, file_path: Path) -> None:
+        """blob 을 file_path 에 하드 링크한다. (안 되면 복사)"""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_name(file_path.name + ".link")
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(blob, tmp_path)
+        except OSError:
+            shutil.copyfile(blob, tmp_path)
+        os.replace(tmp_path, file_path)
+
+    def stats(self) -> StoreStats:
+        """저장소 전체의 중복 제거 통계를 계산한다. (blob 의 하드 링크 수로 참조 수를 셈)"""
+        objects, stored_bytes, logical_bytes = 0, 0, 0
+        if self.__root.is_dir():
+            for bucket in self.__root.iterdir():
+                if not bucket.is_dir():
+                    continue
+                for blob in bucket.iterdir():
+                    stat = blob.stat()
+                    objects += 1
+                    stored_bytes += stat.st_size
+                    # blob 자신을 뺀 링크 수가 에피소드 폴더에서 참조하는 수
+                    logical_bytes += stat.st_size * max(stat.st_nlink - 1, 1)
+        return StoreStats(objects, stored_bytes, logical_bytes)
+
+    @property
+    def reused(self) -> int:
+        """이번 실행에서 다운로드 없이 재사용한 이미지 수"""
+        return self.__reused
+
+    @property
+    def saved_bytes(self) -> int:
+        """이번 실행에서 다운로드하지 않아 절약한 바이트 수"""
+        return self.__saved_bytes
+
+
+class StoredImage:
+    """
+    PartFile 을 감싸서 받은 이미지를 저장소에 넣는 다운로드 대상
+
+    이미 저장된 이미지인지는 GET 을 보내기 전에 확인하므로 (URL 색인, HEAD 의 ETag)
+    여기서는 응답 본문을 끝까지 받아 커넥션을 재사용할 수 있게 한다.
+    """
+
+    def __init__(
+        self, store: ObjectStore, part_file: PartFile, file_path: Path, url: str
+    ) -> None:
+        self.__store = store
+        self.__part_file = part_file
+        self.__file_path = file_path
+        self.__url = url
+
+    def request_headers(self) -> Dict[str, str]:
+        return self.__part_file.request_headers()
+
+    def discard(self) -> None:
+        self.__part_file.discard()
+
+    async def write(self, response: aiohttp.ClientResponse) -> FileDigest:
+        """
+        이미지를 받아서 저장소에 넣는 함수
+
+        Args:
+            response: 상태 코드가 200 또는 206 인 응답
+
+        Returns:
+            이미지의 크기와 체크섬
+        """
+        etag = response.headers.get("ETag")
+        digest = await self.__part_file.write(response)
+        await asyncio.to_thread(
+            self.__store.add, self.__file_path, self.__url, etag, digest
+        )
+        return digest
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+import aiofiles
+import aiohttp
+
+from module.webtoon.manifest import FileDigest
+
+
+class IncompleteDownloadError(Exception):
+    """받은 데이터가 Content-Length / Content-Range 에 적힌 크기보다 작을 때 발생하는 예외"""
+
+
+class PartFile:
+    """
+    이미지를 최종 경로가 아닌 *.part 파일에 받다가 완료되면 원자적으로 이름을 바꾸는 클래스
+
+    - 다운로드 중에는 0001.jpg.part 에 쓰고, 완료 후 os.replace 로 0001.jpg 로 바꾼다.
+      (폴더에 반쯤 받은 이미지가 최종 이름으로 남지 않는다)
+    - 0001.jpg.part.json 에 URL, ETag, 전체 크기를 기록해두고
+      재시도 / 재실행 시 Range: bytes=N- 요청으로 이어받는다.
+    - 서버가 Range 를 무시하거나(200) ETag / 전체 크기가 달라졌으면 처음부터 다시 받는다.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, file_path: Path, url: str) -> None:
+        self.__file_path = file_path
+        self.__part_path = file_path.with_name(file_path.name + ".part")
+        self.__meta_path = file_path.with_name(file_path.name + ".part.json")
+        self.__url = url
+
+    def __read_meta(self) -> Dict:
+        try:
+            with open(self.__meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            return meta if isinstance(meta, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def __write_meta(self, etag: Optional[str], total: Optional[int]) -> None:
+        with open(self.__meta_path, "w", encoding="utf-8") as f:
+            json.dump({"url": self.__url, "etag": etag, "total": total}, f)
+
+    def discard(self) -> None:
+        """받던 .part 파일과 기록을 지운다."""
+        for path in (self.__part_path, self.__meta_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def resume_offset(self) -> int:
+        """이어받을 수 있는 바이트 수 (같은 URL의 .part 파일이 없으면 0)"""
+        try:
+            size = self.__part_path.stat().st_size
+        except OSError:
+            return 0
+        meta = self.__read_meta()
+        if meta.get("url") != self.__url:
+            self.discard()
+            return 0
+        return size
+
+    def request_headers(self) -> Dict[str, str]:
+        """이어받기가 가능하면 Range / If-Range 헤더를 만든다."""
+        offset = self.resume_offset()
+        if offset <= 0:
+            return {}
+        range_headers = {"Range": f"bytes={offset}-"}
+        etag = self.__read_meta().get("etag")
+        # If-Range 는 강한 ETag 만 사용할 수 있다 (약한 ETag 면 전체 크기 비교로만 검증)
+        if etag and not etag.startswith("W/"):
+            range_headers["If-Range"] = etag
+        return range_headers
+
+    async def write(self, response: aiohttp.ClientResponse) -> FileDigest:
+        """
+        응답 본문을 .part 파일에 쓰고, 완료되면 최종 경로로 이름을 바꾸는 함수
+
+        Args:
+            response: 상태 코드가 200 또는 206 인 응답
+
+        Returns:
+            완성된 파일의 크기와 체크섬
+        """
+        etag = response.headers.get("ETag")
+        sha256 = hashlib.sha256()
+        offset = 0
+
+        if response.status == 206:
+            meta = self.__read_meta()
+            offset = self.resume_offset()
+            start, total = self.__parse_content_range(
+                response.headers.get("Content-Range")
+            )
+            # 이어받을 위치 / 전체 크기 / ETag 중 하나라도 다르면 다른 파일이므로 처음부터 다시 받는다
+            if (
+                start != offset
+                or (meta.get("total") is not None and total != meta.get("total"))
+                or (meta.get("etag") and etag and etag != meta.get("etag"))
+            ):
+                self.discard()
+                raise IncompleteDownloadError("이어받기 검증 실패 (Content-Range / ETag 불일치)")
+
+            # 이미 받은 부분도 체크섬에 포함
+            with open(self.__part_path, "rb") as f:
+                for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+            mode = "ab"
+        else:
+            total = response.content_length
+            mode = "wb"
+
+        self.__file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.__write_meta(etag, total)
+
+        size = offset
+        async with aiofiles.open(self.__part_path, mode) as f:
+            async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                sha256.update(chunk)
+                size += len(chunk)
+                await f.write(chunk)
+
+        # 연결이 중간에 끊긴 경우 .part 파일은 남겨두고 다음 시도에서 이어받는다
+        if total is not None and size != total:
+            raise IncompleteDownloadError(f"{size}/{total} 바이트만 받았습니다.")
+
+        os.replace(self.__part_path, self.__file_path)
+        try:
+            os.remove(self.__meta_path)
+        except FileNotFoundError:
+            pass
+        return FileDigest(size, sha256.hexdigest())
+
+    @staticmethod
+    def __parse_content_range(value: Optional[str]) -> tuple[int, Optional[int]]:
+        """'bytes 100-999/1000' 형식의 Content-Range 를 (시작 위치, 전체 크기)로 변환"""
+        match = re.match(r"bytes\s+(\d+)-\d+/(\d+|\*)", value or "")
+        if match is None:
+            return -1, None
+        total = None if match.group(2) == "*" else int(match.group(2))
+        return int(match.group(1)), total
@@ -0,0 +1,149 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+@dataclass
+class HostBucket:
+    """호스트 하나에 대한 토큰 버킷 상태를 담는 데이터 클래스"""
+
+    rate: float  # 초당 허용 요청 수
+    tokens: float = 1.0  # 현재 남아있는 토큰 수
+    last_refill: float = field(default_factory=time.monotonic)
+    success_streak: int = 0  # 연속 성공 횟수 (AIMD 증가 판단용)
+    paused_until: float = 0.0  # Retry-After 로 인해 요청을 멈춰야 하는 시각
+    last_decrease: float = float("-inf")  # 마지막으로 속도를 줄인 시각
+
+
+class AdaptiveRateLimiter:
+    """
+    호스트별 토큰 버킷 + AIMD 방식의 요청 속도 제한기
+
+    - 정상 응답(2xx/304)이 success_threshold 번 연속되면 속도를 increase_step 만큼 올린다. (Additive Increase)
+    - 429 / 5xx 응답을 받으면 속도를 decrease_factor 배로 줄인다. (Multiplicative Decrease)
+      동시에 보낸 요청들이 한꺼번에 429 를 받아도 한 번만 줄이도록, 줄인 뒤 decrease_cooldown 초
+      동안의 실패는 속도에 다시 반영하지 않는다. (TCP 의 혼잡 윈도우당 한 번 감소와 같은 방식)
+    - Retry-After 헤더가 있으면 해당 호스트의 모든 요청을 그 시간 동안 멈춘다.
+      (acquire() 에서 대기하므로 이미 요청을 준비 중인 다른 태스크도 함께 기다린다)
+    """
+
+    def __init__(
+        self,
+        initial_rate: float,
+        min_rate: float,
+        max_rate: float,
+        increase_step: float,
+        decrease_factor: float,
+        success_threshold: int,
+        decrease_cooldown: float = 1.0,
+    ) -> None:
+        self.__initial_rate = initial_rate
+        self.__min_rate = min_rate
+        self.__max_rate = max_rate
+        self.__increase_step = increase_step
+        self.__decrease_factor = decrease_factor
+        self.__success_threshold = max(success_threshold, 1)
+        self.__decrease_cooldown = max(decrease_cooldown, 0.0)
+        self.__buckets: Dict[str, HostBucket] = {}
+
+    def __get_bucket(self, url: str) -> HostBucket:
+        """URL의 호스트에 해당하는 버킷을 가져온다. (없으면 생성)"""
+        host = urlsplit(url).netloc
+        bucket = self.__buckets.get(host)
+        if bucket is None:
+            bucket = HostBucket(rate=self.__initial_rate)
+            self.__buckets[host] = bucket
+        return bucket
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Retry-After 헤더 값을 대기 시간(초)으로 변환하는 함수
+
+        Args:
+            value: 초 단위 숫자 또는 HTTP-date 형식의 문자열
+
+        Returns:
+            대기 시간(초), 해석할 수 없으면 None
+        """
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(retry_at.timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    async def acquire(self, url: str) -> None:
+        """요청을 보내도 될 때까지 대기한 뒤 토큰 하나를 소비한다."""
+        bucket = self.__get_bucket(url)
+        while True:
+            now = time.monotonic()
+
+            # Retry-After 로 멈춘 상태면 재개 시각까지 대기
+            if bucket.paused_until > now:
+                await asyncio.sleep(bucket.paused_until - now)
+                continue
+
+            # 경과 시간만큼 토큰을 채운다 (버스트는 최대 1초 분량)
+            capacity = max(bucket.rate, 1.0)
+            bucket.tokens = min(
+                capacity, bucket.tokens + (now - bucket.last_refill) * bucket.rate
+            )
+            bucket.last_refill = now
+
+            if bucket.tokens >= 1.0:
+                bucket.tokens -= 1.0
+                return
+
+            await asyncio.sleep((1.0 - bucket.tokens) / bucket.rate)
+
+    def feedback(
+        self, url: str, status: Optional[int], retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        응답 결과를 반영해 속도를 조절하는 함수
+
+        Args:
+            url: 요청한 URL
+            status: HTTP 상태 코드 (네트워크 오류로 응답이 없으면 None)
+            retry_after: 응답의 Retry-After 헤더 값
+
+        Returns:
+            Retry-After 로 지정된 대기 시간(초), 없으면 None
+        """
+        bucket = self.__get_bucket(url)
+
+        if status is not None and (200 <= status < 300 or status == 304):
+            bucket.success_streak += 1
+            if bucket.success_streak >= self.__success_threshold:
+                bucket.rate = min(self.__max_rate, bucket.rate + self.__increase_step)
+                bucket.success_streak = 0
+            return None
+
+        if status is None or status == 429 or status >= 500:
+            bucket.success_streak = 0
+            now = time.monotonic()
+            if now - bucket.last_decrease >= self.__decrease_cooldown:
+                # 감소 직전에 이미 보낸 요청들의 실패는 같은 혼잡 때문이므로 한 번만 줄인다
+                bucket.rate = max(self.__min_rate, bucket.rate * self.__decrease_factor)
+                bucket.tokens = 0.0
+                bucket.last_decrease = now
+
+            delay = self.parse_retry_after(retry_after)
+            if delay is not None:
+                bucket.paused_until = max(bucket.paused_until, now + delay)
+            return delay
+
+        # 404 등 서버 부하와 무관한 응답은 속도에 반영하지 않는다
+        return None
+
+    def rate(self, url: str) -> float:
+        """해당 URL 호스트의 현재 초당 허용 요청 수"""
+        return self.__get_bucket(url).rate
@@ -0,0 +1,190 @@
+import aiohttp
+import sys
+import os
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import AsyncContextManager, Hashable, Optional
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from module.headers import headers
+from module.metrics import MetricsRegistry
+from module.settings import Setting
+from module.webtoon.rate_limiter import AdaptiveRateLimiter
+from module.webtoon.fair_scheduler import FairSemaphore
+
+
+@dataclass
+class ConnectionStats:
+    """공유 세션의 커넥션 재사용 통계를 담는 데이터 클래스"""
+
+    requests: int = 0  # 전체 요청 수
+    new_connections: int = 0  # 새로 연결한 커넥션 수 (TCP + TLS 핸드셰이크 발생)
+    reused_connections: int = 0  # keep-alive 로 재사용한 커넥션 수
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        """커넥션 재사용률 (0 ~ 100)"""
+        total = self.new_connections + self.reused_connections
+        return (self.reused_connections / total * 100) if total > 0 else 0.0
+
+    @property
+    def saved_handshakes(self) -> int:
+        """요청마다 세션을 새로 만들었을 때와 비교해 절약한 핸드셰이크 수"""
+        return max(self.requests - self.new_connections, 0)
+
+
+class HttpSession:
+    """
+    WebtoonAnalyzer.create 부터 WebtoonDownloader.download 까지
+    하나의 커넥터(커넥션 풀)를 공유하기 위한 aiohttp 세션 래퍼 클래스
+
+    사용 예)
+        async with HttpSession() as http:
+            analyzer = await WebtoonAnalyzer.create(title_id, http=http)
+            downloader = WebtoonDownloader(..., http=http)
+            await downloader.download(1, 10)
+
+    여러 웹툰을 동시에 받을 때는 scheduler 를 넘겨서 모든 요청이
+    하나의 동시 요청 한도를 웹툰별로 공정하게(라운드 로빈) 나눠 쓰게 할 수 있다.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Setting] = None,
+        scheduler: Optional[FairSemaphore] = None,
+    ) -> None:
+        self.__settings = settings if settings is not None else Setting()
+        self.__session: Optional[aiohttp.ClientSession] = None
+        self.__stats = ConnectionStats()
+        self.__scheduler = scheduler
+
+        # 단계(분석 / URL 수집 / 다운로드)별 요청 수, 지연 시간, 처리량 측정값
+        self.__metrics = MetricsRegistry()
+
+        # comic.naver.com 요청(상세 페이지, list API)이 공유하는 호스트별 속도 제한기
+        self.__limiter = AdaptiveRateLimiter(
+            initial_rate=self.__settings.initial_rate,
+            min_rate=self.__settings.min_rate,
+            max_rate=self.__settings.max_rate,
+            increase_step=self.__settings.increase_step,
+            decrease_factor=self.__settings.decrease_factor,
+            success_threshold=self.__settings.success_threshold,
+            decrease_cooldown=self.__settings.decrease_cooldown,
+        )
+
+    async def __aenter__(self) -> "HttpSession":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def open(self) -> aiohttp.ClientSession:
+        """세션이 없으면 커넥터와 함께 생성한다. (이벤트 루프 안에서 호출해야 함)"""
+        if self.__session is None or self.__session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.__settings.connection_limit,
+                limit_per_host=self.__settings.limit_per_host,
+                ttl_dns_cache=self.__settings.dns_cache_seconds,
+                keepalive_timeout=self.__settings.keepalive_seconds,
+            )
+            self.__session = aiohttp.ClientSession(
+                connector=connector,
+                headers=headers,
+                trace_configs=[self.__create_trace_config()],
+            )
+        return self.__session
+
+    async def close(self) -> None:
+        """세션과 커넥터를 닫는다."""
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        self.__session = None
+
+    def __create_trace_config(self) -> aiohttp.TraceConfig:
+        """커넥션 생성 / 재사용 횟수와 단계별 요청 측정값을 기록하기 위한 TraceConfig 생성"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx: SimpleNamespace, params) -> None:
+            self.__stats.requests += 1
+            ctx.start_time = time.perf_counter()
+
+        async def on_request_end(session, ctx: SimpleNamespace, params) -> None:
+            # 응답 헤더를 받은 시점까지의 지연 시간 (본문 크기는 요청한 코드에서 기록)
+            self.__metrics.observe_request(
+                params.url.host or "",
+                str(params.response.status),
+                time.perf_counter() - ctx.start_time,
+            )
+
+        async def on_request_exception(session, ctx: SimpleNamespace, params) -> None:
+            self.__metrics.observe_request(
+                params.url.host or "", "error", time.perf_counter() - ctx.start_time
+            )
+
+        async def on_connection_create_end(session, ctx, params) -> None:
+            self.__stats.new_connections += 1
+
+        async def on_connection_reuseconn(session, ctx, params) -> None:
+            self.__stats.reused_connections += 1
+
+        async def on_dns_cache_hit(session, ctx, params) -> None:
+            self.__stats.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, ctx, params) -> None:
+            self.__stats.dns_cache_misses += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    def slot(self, owner: Hashable) -> AsyncContextManager[None]:
+        """
+        요청 하나를 보내는 동안 차지할 자리 (scheduler 가 없으면 바로 통과)
+
+        Args:
+            owner: 요청을 보내는 작업 (웹툰 id)
+        """
+        if self.__scheduler is None:
+            return nullcontext()
+        return self.__scheduler.slot(owner)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """열려있는 aiohttp 세션 (open() 이후에만 사용 가능)"""
+        if self.__session is None or self.__session.closed:
+            raise RuntimeError("세션이 열려있지 않습니다. open()을 먼저 호출해주세요.")
+        return self.__session
+
+    @property
+    def limiter(self) -> AdaptiveRateLimiter:
+        """호스트별 요청 속도 제한기"""
+        return self.__limiter
+
+    @property
+    def scheduler(self) -> Optional[FairSemaphore]:
+        """웹툰별 공정 스케줄러 (여러 웹툰을 동시에 받을 때만 사용)"""
+        return self.__scheduler
+
+    @property
+    def stats(self) -> ConnectionStats:
+        """커넥션 재사용 통계"""
+        return self.__stats
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """단계별 요청 / 처리량 측정값"""
+        return self.__metrics
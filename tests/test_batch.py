@@ -0,0 +1,57 @@
+import pytest
+
+from module.webtoon.batch import TitleJob, load_jobs, parse_job_line, parse_range
+
+
+@pytest.mark.parametrize(
+    "text, expected", [("5", (5, 5)), ("1-10", (1, 10)), (" 3-4 ", (3, 4))]
+)
+def test_parse_range(text, expected):
+    assert parse_range(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "a", "1-", "-3", "1-2-3", "1 - 2"])
+def test_parse_range_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        parse_range(text)
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("758037", TitleJob(title_id=758037, line=1)),
+        ("758037 1-10", TitleJob(title_id=758037, start=1, end=10, line=1)),
+        ("758037 5", TitleJob(title_id=758037, start=5, end=5, line=1)),
+        ("758037 NEW", TitleJob(title_id=758037, sync=True, line=1)),
+        (
+            "https://comic.naver.com/webtoon/list?titleId=758037&page=2 3",
+            TitleJob(title_id=758037, start=3, end=3, line=1),
+        ),
+        ("  758037 2-4  # 주석", TitleJob(title_id=758037, start=2, end=4, line=1)),
+    ],
+)
+def test_parse_job_line(line, expected):
+    assert parse_job_line(line, 1) == expected
+
+
+@pytest.mark.parametrize("line", ["", "   ", "# 758037", "\n"])
+def test_parse_job_line_skips_blank_and_comments(line):
+    assert parse_job_line(line, 1) is None
+
+
+@pytest.mark.parametrize(
+    "line", ["758037 1-10 extra", "웹툰이름", "758037 latest", "758037 1-x"]
+)
+def test_parse_job_line_reports_line_number(line):
+    with pytest.raises(ValueError, match="^7번째 줄"):
+        parse_job_line(line, 7)
+
+
+def test_load_jobs(tmp_path):
+    path = tmp_path / "jobs.txt"
+    path.write_text("# 목록\n758037 1-3\n\n183559 new\n", encoding="utf-8")
+
+    assert load_jobs(str(path)) == [
+        TitleJob(title_id=758037, start=1, end=3, line=2),
+        TitleJob(title_id=183559, sync=True, line=4),
+    ]
@@ -0,0 +1,85 @@
+import asyncio
+from typing import AsyncIterator, List
+
+import pytest
+
+from module.webtoon.analyzer import EpisodeIndex, EpisodeInfo
+
+PAGE_SIZE = 20
+
+
+class FakeListApi:
+    """오름차순 list API 페이지를 돌려주고 요청한 페이지를 기록하는 가짜 API"""
+
+    def __init__(self, total: int, unlocked: int) -> None:
+        self.episodes = [
+            EpisodeInfo(no=i + 1, subtitle=f"{i + 1}화", thumbnail_lock=i >= unlocked)
+            for i in range(total)
+        ]
+        self.requested: List[int] = []
+
+    async def fetch_pages(self, pages: List[int]) -> AsyncIterator[List[EpisodeInfo]]:
+        for page in pages:
+            self.requested.append(page)
+            yield self.episodes[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]
+
+    def index(self) -> EpisodeIndex:
+        return EpisodeIndex(len(self.episodes), PAGE_SIZE, self.fetch_pages)
+
+
+@pytest.mark.parametrize(
+    "total, unlocked",
+    [(0, 0), (1, 0), (1, 1), (45, 45), (45, 0), (45, 44), (1200, 1197), (1200, 600), (1200, 1)],
+)
+def test_find_lock_boundary(total, unlocked):
+    api = FakeListApi(total, unlocked)
+    assert asyncio.run(api.index().find_lock_boundary()) == unlocked
+
+
+def test_lock_boundary_in_latest_page_needs_no_more_requests():
+    api = FakeListApi(1200, 1197)
+    index = api.index()
+    # 메타데이터를 가져올 때 받아둔 최신 페이지
+    last_page = index.page_of(1199)
+    index.add((last_page - 1) * PAGE_SIZE, api.episodes[(last_page - 1) * PAGE_SIZE :])
+
+    assert asyncio.run(index.find_lock_boundary()) == 1197
+    assert api.requested == []
+
+
+def test_lock_boundary_requests_few_pages():
+    api = FakeListApi(1200, 600)
+    assert asyncio.run(api.index().find_lock_boundary()) == 600
+    # 1,200화(60페이지)를 모두 받지 않고 지수 + 이진 탐색에 필요한 페이지만 요청
+    assert len(set(api.requested)) <= 15
+
+
+def test_lock_boundary_is_cached():
+    api = FakeListApi(100, 50)
+    index = api.index()
+    asyncio.run(index.find_lock_boundary())
+    requested = len(api.requested)
+
+    assert asyncio.run(index.find_lock_boundary()) == 50
+    assert len(api.requested) == requested
+
+
+def test_get_range_fetches_only_needed_pages():
+    api = FakeListApi(1200, 1200)
+    index = api.index()
+
+    episodes = asyncio.run(index.get_range(15, 45))
+    assert [episode.no for episode in episodes] == list(range(16, 46))
+    assert api.requested == [1, 2, 3]
+
+    # 이미 받은 페이지는 다시 요청하지 않는다
+    asyncio.run(index.get_range(0, 20))
+    assert api.requested == [1, 2, 3]
+
+
+def test_get_range_clamps_to_total():
+    api = FakeListApi(30, 30)
+    index = api.index()
+
+    assert [episode.no for episode in asyncio.run(index.get_range(25, 99))] == list(range(26, 31))
+    assert asyncio.run(index.get_range(40, 50)) == []
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from module.webtoon.fair_scheduler import FairSemaphore
+
+
+def test_limit_must_be_positive():
+    with pytest.raises(ValueError):
+        FairSemaphore(0)
+
+
+def test_never_exceeds_limit():
+    async def run() -> int:
+        scheduler = FairSemaphore(3)
+        active, peak = 0, 0
+
+        async def request(owner: int) -> None:
+            nonlocal active, peak
+            async with scheduler.slot(owner):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.001)
+                active -= 1
+
+        await asyncio.gather(*(request(i % 4) for i in range(40)))
+        return peak
+
+    assert asyncio.run(run()) == 3
+
+
+def test_waiting_owners_take_turns():
+    async def run() -> list:
+        scheduler = FairSemaphore(1)
+        order = []
+        await scheduler.acquire("holder")
+
+        async def request(owner: str) -> None:
+            async with scheduler.slot(owner):
+                order.append(owner)
+
+        # 큰 작업이 먼저 대기열을 채워도 작은 작업이 번갈아 자리를 받는다
+        tasks = [asyncio.create_task(request("big")) for _ in range(4)]
+        tasks += [asyncio.create_task(request("small")) for _ in range(2)]
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run()) == ["big", "small", "big", "small", "big", "big"]
+
+
+def test_granted_counts_per_owner():
+    async def run() -> dict:
+        scheduler = FairSemaphore(2)
+        for owner in ("a", "a", "b"):
+            async with scheduler.slot(owner):
+                pass
+        return scheduler.granted
+
+    assert asyncio.run(run()) == {"a": 2, "b": 1}
+
+
+def test_cancelled_waiter_does_not_leak_slot():
+    async def run() -> bool:
+        scheduler = FairSemaphore(1)
+        await scheduler.acquire("a")
+
+        waiter = asyncio.create_task(scheduler.acquire("b"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        scheduler.release()
+        # 취소된 대기자에게 넘어가지 않고 자리가 반납되어 바로 받을 수 있어야 한다
+        await asyncio.wait_for(scheduler.acquire("c"), 1)
+        return True
+
+    assert asyncio.run(run())
+
+
+def test_cancel_after_handoff_passes_slot_on():
+    async def run() -> bool:
+        scheduler = FairSemaphore(1)
+        await scheduler.acquire("a")
+
+        first = asyncio.create_task(scheduler.acquire("b"))
+        second = asyncio.create_task(scheduler.acquire("c"))
+        await asyncio.sleep(0)
+
+        # b 에게 자리를 넘긴 직후(b 가 깨어나기 전)에 b 가 취소된 경우
+        scheduler.release()
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        await asyncio.wait_for(second, 1)
+        return True
+
+    assert asyncio.run(run())
@@ -0,0 +1,53 @@
+from module.webtoon.image_extractor import (
+    extract_image_urls,
+    extract_image_urls_bs4,
+    extract_image_urls_fast,
+)
+
+PAGE = """
+<html>
+  <head><script>var viewer = "wt_viewer";</script></head>
+  <body>
+    <img src="https://ssl.pstatic.net/logo.png">
+    <div id="sectionContWide" class="wt_viewer viewer_type">
+      <img src="https://image-comic.pstatic.net/1.jpg" alt="">
+      <div class="inner"><img src="https://image-comic.pstatic.net/2.jpg"/></div>
+      <img src="">
+      <img src="https://image-comic.pstatic.net/3.jpg">
+    </div>
+    <div class="comment"><img src="https://ssl.pstatic.net/profile.png"></div>
+  </body>
+</html>
+"""
+
+VIEWER_IMAGES = [
+    "https://image-comic.pstatic.net/1.jpg",
+    "https://image-comic.pstatic.net/2.jpg",
+    "https://image-comic.pstatic.net/3.jpg",
+]
+
+
+def test_fast_extractor_reads_only_viewer_images():
+    assert extract_image_urls_fast(PAGE) == VIEWER_IMAGES
+
+
+def test_fast_extractor_matches_bs4():
+    assert extract_image_urls_fast(PAGE) == extract_image_urls_bs4(PAGE)
+
+
+def test_fast_extractor_gives_up_without_viewer():
+    assert extract_image_urls_fast("<div class='viewer'><img src='a.jpg'></div>") is None
+
+
+def test_fast_extractor_gives_up_on_unclosed_viewer():
+    assert extract_image_urls_fast('<div class="wt_viewer"><img src="a.jpg">') is None
+
+
+def test_fast_extractor_gives_up_on_empty_viewer():
+    assert extract_image_urls_fast('<div class="wt_viewer"></div>') is None
+
+
+def test_extract_image_urls_falls_back_to_bs4():
+    # 닫히지 않은 뷰어는 빠른 추출기가 포기하고 BeautifulSoup 결과를 사용한다
+    html = '<div class="wt_viewer"><img src="a.jpg"><img src="b.jpg">'
+    assert extract_image_urls(html) == ["a.jpg", "b.jpg"]
@@ -0,0 +1,126 @@
+import os
+import re
+
+import cv2
+import numpy as np
+import pytest
+
+import module.jpeg_concat as jpeg_concat
+from module.jpeg_concat import (
+    JpegConcatError,
+    concat_jpeg_files,
+    concat_jpegs,
+    parse_jpeg,
+)
+
+
+def make_jpeg(height: int, seed: int, width: int = 64, restart_interval: int = 0) -> bytes:
+    pixels = (np.random.default_rng(seed).random((height, width, 3)) * 255).astype(np.uint8)
+    params = [cv2.IMWRITE_JPEG_QUALITY, 90, cv2.IMWRITE_JPEG_RST_INTERVAL, restart_interval]
+    ok, encoded = cv2.imencode(".jpg", pixels, params)
+    assert ok
+    return encoded.tobytes()
+
+
+def decode(data: bytes) -> np.ndarray:
+    image = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    assert image is not None
+    return image
+
+
+def assert_same_pixels(merged: bytes, datas: list) -> None:
+    """
+    이어붙인 결과가 원본들을 세로로 쌓은 것과 같은지 확인한다.
+    (디코더가 색차 성분을 보간할 때 이웃 행을 쓰므로 이미지 경계 위아래 한 행은 제외)
+    """
+    result = decode(merged)
+    expected = np.vstack([decode(data) for data in datas])
+    assert result.shape == expected.shape
+
+    seams = np.cumsum([decode(data).shape[0] for data in datas])[:-1]
+    rows = np.ones(result.shape[0], dtype=bool)
+    for seam in seams:
+        rows[seam - 1 : seam + 1] = False
+    assert np.array_equal(result[rows], expected[rows])
+
+
+def test_concat_matches_decoded_images():
+    datas = [make_jpeg(64, seed) for seed in range(3)]
+    merged = concat_jpegs(datas)
+
+    assert parse_jpeg(merged).height == 192
+    # 디코딩 없이 이어붙였으므로 각 부분이 원본 디코딩 결과와 같다
+    assert_same_pixels(merged, datas)
+
+
+def test_last_image_may_be_shorter():
+    datas = [make_jpeg(64, 1), make_jpeg(40, 2)]
+    assert parse_jpeg(concat_jpegs(datas)).height == 104
+
+
+def test_incompatible_width_is_rejected():
+    with pytest.raises(JpegConcatError):
+        concat_jpegs([make_jpeg(64, 1, width=64), make_jpeg(64, 2, width=80)])
+
+
+def test_body_height_must_be_mcu_multiple():
+    with pytest.raises(JpegConcatError):
+        concat_jpegs([make_jpeg(60, 1), make_jpeg(64, 2)])
+
+
+def test_restart_markers_renumbered():
+    datas = [make_jpeg(64, 1, restart_interval=4), make_jpeg(64, 2, restart_interval=4)]
+    merged = concat_jpegs(datas)
+    info = parse_jpeg(merged)
+
+    markers = re.findall(rb"\xff([\xd0-\xd7])", merged[info.scan_start : info.scan_end])
+    assert [marker[0] for marker in markers] == [
+        0xD0 + i % 8 for i in range(len(markers))
+    ]
+    assert_same_pixels(merged, datas)
+
+
+def test_fill_bytes_before_restart_marker_are_skipped():
+    first, second = make_jpeg(64, 1, restart_interval=4), make_jpeg(64, 2, restart_interval=4)
+    # RST 마커 앞에 채움 바이트(FF)를 넣어도 같은 결과가 나와야 한다
+    padded = re.sub(rb"\xff([\xd0-\xd7])", lambda m: b"\xff\xff\xff" + m.group(1), second)
+    assert padded != second
+
+    assert concat_jpegs([first, padded]) == concat_jpegs([first, second])
+
+
+def test_files_split_at_image_boundaries(tmp_path):
+    datas = [make_jpeg(64, seed) for seed in range(4)]
+    paths = concat_jpeg_files(datas, str(tmp_path), max_height=128)
+
+    assert [os.path.basename(path) for path in paths] == ["output_001.jpg", "output_002.jpg"]
+    assert all(decode(open(path, "rb").read()).shape[0] == 128 for path in paths)
+    assert sorted(os.listdir(tmp_path)) == ["output_001.jpg", "output_002.jpg"]
+
+
+def test_single_file_when_under_limit(tmp_path):
+    paths = concat_jpeg_files([make_jpeg(64, 1), make_jpeg(64, 2)], str(tmp_path))
+    assert [os.path.basename(path) for path in paths] == ["output.jpg"]
+
+
+def test_image_taller_than_limit_is_rejected(tmp_path):
+    with pytest.raises(JpegConcatError):
+        concat_jpeg_files([make_jpeg(64, 1), make_jpeg(200, 2)], str(tmp_path), max_height=128)
+    assert os.listdir(tmp_path) == []
+
+
+def test_failed_group_leaves_no_files(tmp_path, monkeypatch):
+    calls = []
+    original = jpeg_concat.concat_jpegs
+
+    def fail_second_group(datas):
+        calls.append(len(datas))
+        if len(calls) == 2:
+            raise JpegConcatError("boom")
+        return original(datas)
+
+    monkeypatch.setattr(jpeg_concat, "concat_jpegs", fail_second_group)
+    datas = [make_jpeg(64, seed) for seed in range(4)]
+    with pytest.raises(JpegConcatError):
+        concat_jpeg_files(datas, str(tmp_path), max_height=128)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,95 @@
+from pathlib import Path
+
+from module.webtoon.manifest import DownloadManifest, FileDigest
+
+TITLE_ID = 758037
+
+
+def write_image(title_dir: Path, name: str, data: bytes = b"jpeg") -> Path:
+    path = title_dir / "[0001] 1화" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def record_images(manifest: DownloadManifest, title_dir: Path, count: int) -> None:
+    manifest.start_episode(1, "1화", count)
+    for idx in range(count):
+        path = write_image(title_dir, f"{idx:04}.jpg")
+        manifest.record_image(1, idx, f"https://img/{idx}", path, FileDigest(4, "h"))
+
+
+def complete_images(manifest: DownloadManifest, title_dir: Path, count: int) -> int:
+    return sum(
+        manifest.is_image_complete(
+            1, idx, f"https://img/{idx}", title_dir / "[0001] 1화" / f"{idx:04}.jpg"
+        )
+        for idx in range(count)
+    )
+
+
+def test_save_and_load_round_trip(tmp_path):
+    manifest = DownloadManifest.load(tmp_path, TITLE_ID)
+    record_images(manifest, tmp_path, 3)
+    manifest.finish_episode(1, True)
+
+    loaded = DownloadManifest.load(tmp_path, TITLE_ID)
+    assert loaded.completed_episodes == {1}
+    assert loaded.is_episode_complete(1)
+    assert not (tmp_path / DownloadManifest.JOURNAL_NAME).exists()
+
+
+def test_journal_replays_flushed_batches_after_crash(tmp_path):
+    batch = DownloadManifest.JOURNAL_BATCH_SIZE
+    manifest = DownloadManifest.load(tmp_path, TITLE_ID)
+    # start_episode 한 줄 + 이미지 batch 줄 -> 처음 batch 줄(에피소드 + 이미지 batch-1 개)만 저널에 쓰임
+    record_images(manifest, tmp_path, batch + 5)
+
+    # save() 없이 종료된 경우
+    recovered = DownloadManifest.load(tmp_path, TITLE_ID)
+    assert recovered.incomplete_episodes == {1}
+    assert complete_images(recovered, tmp_path, batch + 5) == batch - 1
+
+
+def test_journal_skips_torn_last_line(tmp_path):
+    batch = DownloadManifest.JOURNAL_BATCH_SIZE
+    manifest = DownloadManifest.load(tmp_path, TITLE_ID)
+    record_images(manifest, tmp_path, batch)
+    with open(tmp_path / DownloadManifest.JOURNAL_NAME, "a", encoding="utf-8") as f:
+        f.write('{"episode": "1", "image": "99", "url": ')
+
+    recovered = DownloadManifest.load(tmp_path, TITLE_ID)
+    assert complete_images(recovered, tmp_path, batch) == batch - 1
+
+    # 이어서 기록해도 쓰다 만 줄과 섞이지 않는다
+    record_images(recovered, tmp_path, batch)
+    again = DownloadManifest.load(tmp_path, TITLE_ID)
+    assert complete_images(again, tmp_path, batch) == batch - 1
+
+
+def test_save_folds_buffered_records(tmp_path):
+    manifest = DownloadManifest.load(tmp_path, TITLE_ID)
+    record_images(manifest, tmp_path, 3)
+    manifest.save()
+
+    loaded = DownloadManifest.load(tmp_path, TITLE_ID)
+    assert complete_images(loaded, tmp_path, 3) == 3
+
+
+def test_size_mismatch_fails_verification(tmp_path):
+    manifest = DownloadManifest.load(tmp_path, TITLE_ID)
+    record_images(manifest, tmp_path, 2)
+    manifest.finish_episode(1, True)
+    write_image(tmp_path, "0001.jpg", b"truncated")
+
+    loaded = DownloadManifest.load(tmp_path, TITLE_ID)
+    assert not loaded.is_episode_complete(1)
+    assert complete_images(loaded, tmp_path, 2) == 1
+
+
+def test_other_title_manifest_is_ignored(tmp_path):
+    manifest = DownloadManifest.load(tmp_path, TITLE_ID)
+    record_images(manifest, tmp_path, 1)
+    manifest.finish_episode(1, True)
+
+    assert DownloadManifest.load(tmp_path, TITLE_ID + 1).completed_episodes == set()
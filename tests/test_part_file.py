@@ -0,0 +1,125 @@
+import asyncio
+import hashlib
+from typing import AsyncIterator, Dict, List, Optional
+
+import pytest
+
+from module.webtoon.part_file import IncompleteDownloadError, PartFile
+
+URL = "https://image-comic.pstatic.net/webtoon/1/1/0001.jpg"
+BODY = bytes(range(256)) * 40
+
+
+class FakeContent:
+    def __init__(self, chunks: List[bytes]) -> None:
+        self.__chunks = chunks
+
+    async def iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        for chunk in self.__chunks:
+            yield chunk
+
+
+class FakeResponse:
+    """PartFile.write 가 사용하는 aiohttp.ClientResponse 속성만 흉내 낸 응답"""
+
+    def __init__(
+        self,
+        status: int,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        content_length: Optional[int] = None,
+    ) -> None:
+        self.status = status
+        self.headers = headers or {}
+        self.content_length = len(body) if content_length is None else content_length
+        self.content = FakeContent([body[i : i + 1000] for i in range(0, len(body), 1000)])
+
+
+def interrupted_download(part: PartFile, received: int, etag: str = '"v1"') -> None:
+    """전체 크기를 알리고 received 바이트만 보낸 뒤 끊긴 다운로드"""
+    response = FakeResponse(
+        200, BODY[:received], {"ETag": etag}, content_length=len(BODY)
+    )
+    with pytest.raises(IncompleteDownloadError):
+        asyncio.run(part.write(response))
+
+
+def test_complete_download_renames_part_file(tmp_path):
+    path = tmp_path / "0001.jpg"
+    digest = asyncio.run(PartFile(path, URL).write(FakeResponse(200, BODY)))
+
+    assert path.read_bytes() == BODY
+    assert digest.size == len(BODY)
+    assert digest.sha256 == hashlib.sha256(BODY).hexdigest()
+    assert not path.with_name("0001.jpg.part").exists()
+    assert not path.with_name("0001.jpg.part.json").exists()
+
+
+def test_interrupted_download_requests_range_with_if_range(tmp_path):
+    part = PartFile(tmp_path / "0001.jpg", URL)
+    interrupted_download(part, 3000)
+
+    assert part.resume_offset() == 3000
+    assert part.request_headers() == {"Range": "bytes=3000-", "If-Range": '"v1"'}
+
+
+def test_weak_etag_is_not_sent_as_if_range(tmp_path):
+    part = PartFile(tmp_path / "0001.jpg", URL)
+    interrupted_download(part, 3000, etag='W/"v1"')
+
+    assert part.request_headers() == {"Range": "bytes=3000-"}
+
+
+def test_partial_response_resumes_and_hashes_whole_file(tmp_path):
+    path = tmp_path / "0001.jpg"
+    part = PartFile(path, URL)
+    interrupted_download(part, 3000)
+
+    response = FakeResponse(
+        206,
+        BODY[3000:],
+        {"ETag": '"v1"', "Content-Range": f"bytes 3000-{len(BODY) - 1}/{len(BODY)}"},
+    )
+    digest = asyncio.run(PartFile(path, URL).write(response))
+
+    assert path.read_bytes() == BODY
+    assert digest.sha256 == hashlib.sha256(BODY).hexdigest()
+
+
+def test_full_response_to_range_request_restarts(tmp_path):
+    # If-Range 가 맞지 않으면 서버는 206 대신 전체 본문(200)을 보낸다
+    path = tmp_path / "0001.jpg"
+    interrupted_download(PartFile(path, URL), 3000)
+
+    new_body = b"changed" * 100
+    asyncio.run(PartFile(path, URL).write(FakeResponse(200, new_body, {"ETag": '"v2"'})))
+    assert path.read_bytes() == new_body
+
+
+@pytest.mark.parametrize(
+    "content_range, etag",
+    [
+        ("bytes 2000-10239/10240", '"v1"'),  # 이어받을 위치가 다름
+        ("bytes 3000-9999/10000", '"v1"'),  # 전체 크기가 다름
+        ("bytes 3000-10239/10240", '"v2"'),  # ETag 가 다름
+    ],
+)
+def test_mismatched_partial_response_discards_part(tmp_path, content_range, etag):
+    path = tmp_path / "0001.jpg"
+    part = PartFile(path, URL)
+    interrupted_download(part, 3000)
+
+    response = FakeResponse(206, BODY[3000:], {"ETag": etag, "Content-Range": content_range})
+    with pytest.raises(IncompleteDownloadError):
+        asyncio.run(part.write(response))
+    assert part.resume_offset() == 0
+    assert not path.exists()
+
+
+def test_part_file_for_other_url_is_discarded(tmp_path):
+    path = tmp_path / "0001.jpg"
+    interrupted_download(PartFile(path, URL), 3000)
+
+    other = PartFile(path, URL + "?v=2")
+    assert other.resume_offset() == 0
+    assert other.request_headers() == {}
@@ -0,0 +1,75 @@
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from module.webtoon.rate_limiter import AdaptiveRateLimiter
+
+URL = "https://image-comic.pstatic.net/webtoon/1/1/a.jpg"
+
+
+def make_limiter(decrease_cooldown: float = 1.0) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(
+        initial_rate=8,
+        min_rate=0.5,
+        max_rate=20,
+        increase_step=0.5,
+        decrease_factor=0.5,
+        success_threshold=2,
+        decrease_cooldown=decrease_cooldown,
+    )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("120", 120.0), (" 3 ", 3.0), ("0", 0.0), (None, None), ("", None), ("soon", None)],
+)
+def test_parse_retry_after_seconds(value, expected):
+    assert AdaptiveRateLimiter.parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = AdaptiveRateLimiter.parse_retry_after(format_datetime(retry_at, usegmt=True))
+    assert delay is not None and 28 <= delay <= 31
+
+
+def test_parse_retry_after_past_date_is_zero():
+    past = datetime.now(timezone.utc) - timedelta(minutes=5)
+    assert AdaptiveRateLimiter.parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_success_streak_increases_rate():
+    limiter = make_limiter()
+    limiter.feedback(URL, 200)
+    assert limiter.rate(URL) == 8
+    limiter.feedback(URL, 304)
+    assert limiter.rate(URL) == 8.5
+
+
+def test_concurrent_failures_decrease_once_per_cooldown():
+    limiter = make_limiter(decrease_cooldown=60)
+    for _ in range(10):
+        limiter.feedback(URL, 429)
+    assert limiter.rate(URL) == 4
+
+
+def test_failure_after_cooldown_decreases_again():
+    limiter = make_limiter(decrease_cooldown=0.05)
+    limiter.feedback(URL, 503)
+    time.sleep(0.06)
+    limiter.feedback(URL, None)
+    assert limiter.rate(URL) == 2
+
+
+def test_retry_after_returned_even_during_cooldown():
+    limiter = make_limiter(decrease_cooldown=60)
+    limiter.feedback(URL, 429)
+    assert limiter.feedback(URL, 429, "7") == 7.0
+
+
+def test_client_errors_do_not_change_rate():
+    limiter = make_limiter()
+    limiter.feedback(URL, 404)
+    assert limiter.rate(URL) == 8